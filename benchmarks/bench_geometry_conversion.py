@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark: IGH.convert_to_LBT_geom() type-dispatch vs. the original recursive isinstance chain.
+
+Runs on plain CPython (no Rhino needed): the Rhino geometry types and the
+ladybug_rhino converters are replaced by small stub classes / functions.
+
+Usage:
+    python benchmarks/bench_geometry_conversion.py --items 10000 --repeats 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from honeybee_ph_rhino.geometry_conversion import TypeDispatchConverter, to_number_or_str  # noqa: E402
+
+# -----------------------------------------------------------------------------
+# -- Stubbed Rhino.Geometry types and ladybug_rhino converters
+
+
+class Brep:
+    pass
+
+
+class PolylineCurve:
+    pass
+
+
+class LineCurve:
+    def __init__(self, _line=None):
+        self.line = _line
+
+
+class Line:
+    pass
+
+
+class Mesh:
+    pass
+
+
+class Point3d:
+    pass
+
+
+class StubConversionError(Exception):
+    pass
+
+
+def to_face3d(_):
+    return ("Face3D", id(_))
+
+
+def to_polyline3d(_):
+    return ("Polyline3D", id(_))
+
+
+def to_linesegment3d(_):
+    return ("LineSegment3D", id(_.line) if _.line is not None else id(_))
+
+
+def to_mesh3d(_):
+    return ("Mesh3D", id(_))
+
+
+def to_point3d(_):
+    return ("Point3D", id(_))
+
+
+# -----------------------------------------------------------------------------
+# -- The original IGH.convert_to_LBT_geom() (Rhino types swapped for the stubs)
+
+
+def legacy_convert_to_LBT_geom(_inputs):
+    if not isinstance(_inputs, list):
+        _inputs = [_inputs]
+    lbt_geometry = []
+    for i, _ in enumerate(_inputs):
+        if isinstance(_, list):
+            for __ in _:
+                result = legacy_convert_to_LBT_geom(__)
+                lbt_geometry.append(result)
+        elif isinstance(_, (str, int, float)):
+            try:
+                lbt_geometry.append(float(str(_)))
+            except ValueError:
+                lbt_geometry.append(str(_))
+        elif isinstance(_, bool):
+            lbt_geometry.append(_)
+        elif isinstance(_, Brep):
+            lbt_geometry.append(to_face3d(_))
+        elif isinstance(_, PolylineCurve):
+            lbt_geometry.append(to_polyline3d(_))
+        elif isinstance(_, LineCurve):
+            lbt_geometry.append(to_linesegment3d(_))
+        elif isinstance(_, Line):
+            lbt_geometry.append(to_linesegment3d(LineCurve(_)))
+        elif isinstance(_, Mesh):
+            lbt_geometry.append(to_mesh3d(_))
+        elif isinstance(_, Point3d):
+            lbt_geometry.append(to_point3d(_))
+        else:
+            raise StubConversionError(_)
+
+    return lbt_geometry
+
+
+def build_converter():
+    """The same rules IGH.to_LBT_converter uses, with the stub types."""
+    return TypeDispatchConverter(
+        [
+            (bool, str),
+            ((str, int, float), to_number_or_str),
+            (Brep, to_face3d),
+            (PolylineCurve, to_polyline3d),
+            (LineCurve, to_linesegment3d),
+            (Line, lambda _: to_linesegment3d(LineCurve(_))),
+            (Mesh, to_mesh3d),
+            (Point3d, to_point3d),
+        ],
+        StubConversionError,
+    )
+
+
+# -----------------------------------------------------------------------------
+# -- Sample inputs
+
+
+FACTORIES = [
+    Brep,
+    PolylineCurve,
+    LineCurve,
+    Line,
+    Mesh,
+    Point3d,
+    lambda: "2.5",
+    lambda: "label",
+    lambda: 3,
+    lambda: 1.25,
+    lambda: True,
+]
+
+
+def mixed_inputs(_count, _seed=0):
+    rng = random.Random(_seed)
+    return [rng.choice(FACTORIES)() for _ in range(_count)]
+
+
+def nested_inputs(_count, _seed=0):
+    """Roughly the shape of a floor-segment tree: a list of branch-lists of geometry."""
+    items = mixed_inputs(_count, _seed)
+    return [items[i : i + 10] for i in range(0, len(items), 10)]
+
+
+def homogeneous_inputs(_count):
+    return [Point3d() for _ in range(_count)]
+
+
+def best_time(_func, _arg, _repeats):
+    best, result = None, None
+    for _ in range(_repeats):
+        t0 = time.perf_counter()
+        result = _func(_arg)
+        elapsed = time.perf_counter() - t0
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the IGH geometry conversion dispatch")
+    parser.add_argument("--items", type=int, default=10_000, help="Number of input items per case")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per case (the fastest is reported)")
+    args = parser.parse_args()
+
+    cases = {
+        "mixed flat": mixed_inputs(args.items),
+        "mixed nested": nested_inputs(args.items),
+        "all Point3d": homogeneous_inputs(args.items),
+    }
+
+    print(f"{args.items:,} items per case, best of {args.repeats} runs")
+    print("-" * 72)
+    for name, inputs in cases.items():
+        converter = build_converter()
+        t_legacy, r_legacy = best_time(legacy_convert_to_LBT_geom, inputs, args.repeats)
+        t_new, r_new = best_time(converter.convert, inputs, args.repeats)
+        same = "OK" if r_new == r_legacy else "MISMATCH"
+        print(
+            f"{name:<14} legacy: {t_legacy * 1000:>8.2f} ms | dispatch: {t_new * 1000:>8.2f} ms "
+            f"| x{t_legacy / t_new:>5.1f} | {same}"
+        )
+        if r_new != r_legacy:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Benchmark: honeybee_ph_rhino.geometry_kernel vs. the original ghpythonlib.components versions.
+
+Paste into a GHPython component (see benchmarks/README.md). The component needs a
+single Boolean '_run' input. Each operation is timed on the same set of sample
+planar Breps, and the matching results are compared by area/volume.
+"""
+
+import time
+
+import ghpythonlib.components as ghc  # type: ignore
+import Rhino.Geometry as rg  # type: ignore
+import scriptcontext as sc  # type: ignore
+
+from honeybee_ph_rhino import geometry_kernel
+
+NUM_BREPS = 200
+REPEATS = 3
+INSET_DISTANCE = 0.1
+EXTRUDE_DISTANCE = 2.5
+
+
+def sample_breps(_count):
+    """Return a row of touching, L-shaped planar Breps (so merge has real work to do)."""
+    breps = []
+    for i in range(_count):
+        x = float(i) * 4.0
+        pts = [
+            rg.Point3d(x, 0, 0),
+            rg.Point3d(x + 4, 0, 0),
+            rg.Point3d(x + 4, 3, 0),
+            rg.Point3d(x + 2, 3, 0),
+            rg.Point3d(x + 2, 5, 0),
+            rg.Point3d(x, 5, 0),
+            rg.Point3d(x, 0, 0),
+        ]
+        crv = rg.PolylineCurve(pts)
+        breps.append(rg.Brep.CreatePlanarBreps(crv, sc.doc.ModelAbsoluteTolerance)[0])
+    return breps
+
+
+def best_time(_func):
+    """Return the fastest of REPEATS runs (seconds) along with the last result."""
+    best, result = None, None
+    for _ in range(REPEATS):
+        t0 = time.time()
+        result = _func()
+        elapsed = time.time() - t0
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def total_area(_geom):
+    return sum(rg.AreaMassProperties.Compute(g).Area for g in _geom)
+
+
+def report(_name, _t_ghc, _t_native, _check_ghc, _check_native):
+    speedup = _t_ghc / _t_native if _t_native else float("inf")
+    print(
+        "{:<10} ghc: {:>8.1f} ms | native: {:>8.1f} ms | x{:>6.1f} | check: {:.3f} / {:.3f}".format(
+            _name, _t_ghc * 1000, _t_native * 1000, speedup, _check_ghc, _check_native
+        )
+    )
+
+
+def main():
+    tol = sc.doc.ModelAbsoluteTolerance
+    breps = sample_breps(NUM_BREPS)
+    print("{} sample Breps, best of {} runs".format(len(breps), REPEATS))
+    print("-" * 90)
+
+    # -- Inset
+    t_ghc, r_ghc = best_time(lambda: [geometry_kernel.inset_brep_ghc(ghc, b, INSET_DISTANCE) for b in breps])
+    t_rc, r_rc = best_time(lambda: [geometry_kernel.inset_brep(b, INSET_DISTANCE, tol) for b in breps])
+    report("inset", t_ghc, t_rc, total_area(r_ghc), total_area(r_rc))
+
+    # -- Merge
+    t_ghc, r_ghc = best_time(lambda: geometry_kernel.merged_perimeter_curves_ghc(ghc, breps))
+    t_rc, r_rc = best_time(lambda: geometry_kernel.merged_perimeter_curves(breps, tol))
+    report("merge", t_ghc, t_rc, total_area(r_ghc), total_area(r_rc))
+
+    # -- Extrude
+    t_ghc, r_ghc = best_time(
+        lambda: [geometry_kernel.extrude_brep_world_z_ghc(ghc, b, EXTRUDE_DISTANCE) for b in breps]
+    )
+    t_rc, r_rc = best_time(lambda: [geometry_kernel.extrude_brep_world_z(b, EXTRUDE_DISTANCE) for b in breps])
+    report(
+        "extrude",
+        t_ghc,
+        t_rc,
+        sum(rg.VolumeMassProperties.Compute(g).Volume for g in r_ghc),
+        sum(rg.VolumeMassProperties.Compute(g).Volume for g in r_rc),
+    )
+
+
+if _run:  # type: ignore # noqa: F821 -- GHPython component input
+    main()
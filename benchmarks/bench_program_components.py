@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark: the program / load component workers on synthetic models of 10, 100 and 1,000 rooms.
+
+Runs on plain CPython, but needs 'honeybee-core', 'honeybee-energy', 'honeybee-ph',
+'honeybee-ph-standards', 'ph-units' and 'ph-gh-component-io' installed (pip). The Grasshopper
+/ .NET types the workers use, and the IGH, are replaced by the stand-ins in gh_stand_ins.py.
+
+Each case builds a fresh synthetic model (see synthetic_model.py, not timed) and times the
+worker's run(). The fastest of --repeats runs is reported.
+
+Regression check: '--save-baseline' writes the timings to benchmarks/baselines/ (per machine,
+not committed). '--check' compares against that file and exits with code 1 if any case is
+slower than baseline x --threshold.
+
+Usage:
+    python benchmarks/bench_program_components.py --sizes 10 100 1000 --repeats 3
+    python benchmarks/bench_program_components.py --save-baseline
+    python benchmarks/bench_program_components.py --check --threshold 1.25
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from gh_stand_ins import StandInIGH, install_stand_in_modules  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "program_components.json"
+DEFAULT_SIZES = (10, 100, 1000)
+
+# -----------------------------------------------------------------------------
+# -- Cases
+
+
+def case_sfh_program(_hb_rooms):
+    from honeybee_ph_rhino.gh_compo_io.program.set_res_program import GHCompo_CreatePHProgramSingleFamilyHome
+
+    return GHCompo_CreatePHProgramSingleFamilyHome(StandInIGH(), _hb_rooms).run
+
+
+def case_mf_res_room_loads(_hb_rooms):
+    from honeybee_ph_rhino.gh_compo_io.program.set_phius_mf_res import GHCompo_SetPhiusMFResidentialRoomLoads
+
+    return GHCompo_SetPhiusMFResidentialRoomLoads(
+        StandInIGH(), [], 1_500.0, 900.0, 120.0, 0.0, _hb_rooms, "FLOOR_AREA"
+    ).run
+
+
+def case_mf_res_load_data(_hb_rooms):
+    from honeybee_ph_rhino.gh_compo_io.program.get_phius_mf_res_data import GHCompo_GetPhiusMFResidentialLoadData
+
+    return GHCompo_GetPhiusMFResidentialLoadData(StandInIGH(), _hb_rooms).run
+
+
+def case_add_process_equip(_hb_rooms):
+    from honeybee_ph_rhino.gh_compo_io.program.add_process_equip import GHCompo_AddProcessEquip
+
+    num_dwellings = max(1, len(_hb_rooms) // 4)
+    num_bedrooms = num_dwellings * 2
+    num_occupants = num_dwellings * 2.5
+    return GHCompo_AddProcessEquip(StandInIGH(), ["100"], num_bedrooms, num_occupants, num_dwellings, _hb_rooms).run
+
+
+CASES = {
+    "CreatePHProgramSingleFamilyHome": case_sfh_program,
+    "SetPhiusMFResidentialRoomLoads": case_mf_res_room_loads,
+    "GetPhiusMFResidentialLoadData": case_mf_res_load_data,
+    "AddProcessEquip": case_add_process_equip,
+}
+
+
+def best_time(_make_run, _make_rooms, _repeats):
+    """Return the fastest of the runs. Each run gets a fresh model and worker (neither is timed)."""
+    best = None
+    for _ in range(_repeats):
+        run = _make_run(_make_rooms())
+        with contextlib.redirect_stdout(io.StringIO()):
+            t0 = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - t0
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+# -----------------------------------------------------------------------------
+# -- Baselines
+
+
+def load_baseline(_path):
+    with open(_path) as f:
+        return json.load(f)["timings"]
+
+
+def save_baseline(_path, _timings):
+    _path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"machine": platform.node(), "python": platform.python_version(), "timings": _timings}
+    with open(_path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    print(f"Saved baseline: {_path}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the program / load component workers")
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Rooms per model")
+    arg_parser.add_argument("--repeats", type=int, default=3, help="Runs per case (the fastest is reported)")
+    arg_parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=sorted(CASES))
+    arg_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    arg_parser.add_argument("--save-baseline", action="store_true", help="Write these timings as the baseline")
+    arg_parser.add_argument("--check", action="store_true", help="Fail if slower than baseline x threshold")
+    arg_parser.add_argument("--threshold", type=float, default=1.25, help="Allowed slow-down factor for --check")
+    args = arg_parser.parse_args()
+
+    install_stand_in_modules()
+    from synthetic_model import make_rooms
+
+    baseline = load_baseline(args.baseline) if args.check else {}
+
+    print(f"Best of {args.repeats} runs (ms)")
+    header = f"{'Case':<34} {'rooms':>6} {'time':>10} {'baseline':>10} {'ratio':>7}"
+    print(header)
+    print("-" * len(header))
+
+    timings = {}
+    failures = []
+    for name in args.cases:
+        for size in args.sizes:
+            key = f"{name}[{size}]"
+            t = best_time(CASES[name], lambda: make_rooms(size), args.repeats)
+            timings[key] = t
+
+            base = baseline.get(key)
+            if base:
+                ratio = t / base
+                flag = "  SLOWER" if ratio > args.threshold else ""
+                print(f"{name:<34} {size:>6} {t * 1000:>10.2f} {base * 1000:>10.2f} {ratio:>6.2f}x{flag}")
+                if ratio > args.threshold:
+                    failures.append(key)
+            else:
+                print(f"{name:<34} {size:>6} {t * 1000:>10.2f} {'-':>10} {'-':>7}")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, timings)
+
+    if failures:
+        print(f"\n{len(failures)} case(s) slower than the baseline x {args.threshold}: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
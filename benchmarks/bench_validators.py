@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark: every ghio_validators descriptor, set repeatedly the way the builder classes do.
+
+Runs on plain CPython, but needs 'honeybee-core' and 'ph-units' installed (pip) since the
+validators import them. For each descriptor, the same small set of raw inputs is assigned
+--sets times onto new objects (like a 500-segment piping network built from one set of
+defaults). The UnitValidated descriptors are also compared against the original
+per-assignment parse + convert with ph_units, and timed through 'validate_many'.
+
+Usage:
+    python benchmarks/bench_validators.py --sets 500 --repeats 5
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import inspect
+import io
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from ph_units import converter, parser  # noqa: E402
+
+from honeybee_ph_rhino import unit_conversion  # noqa: E402
+
+
+def _load_validators_module():
+    """Load ghio_validators on its own: importing the gh_compo_io package would pull in Rhino."""
+    path = REPO_ROOT / "honeybee_ph_rhino" / "gh_compo_io" / "ghio_validators.py"
+    spec = importlib.util.spec_from_file_location("ghio_validators", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ghio_validators = _load_validators_module()
+
+# -- Raw inputs for the non-unit descriptors
+SAMPLE_INPUTS = {
+    "NotNone": ["a", 1, 2.5],
+    "HBName": ["Room 101", "Kitchen", "Bath_1"],
+    "IntegerNonZero": [1, "2", 3.0],
+    "IntegerPositiveValueOrZero": [0, "2", 3.0],
+    "Float": [1.5, "2.5", -3],
+    "FloatNonZero": [1.5, "2.5", 3],
+    "FloatPositiveValue": [1.5, "2.5", 0],
+    "FloatPercentage": [0.5, "75", 1],
+    "FloatMax24": [8, "12.5", 24],
+}
+
+
+def unit_sample_inputs(_validator_class):
+    """Typical raw inputs for a unit validator: a bare number, a number with the unit, and a float."""
+    unit = _validator_class.unit
+    return ["12.7", "12.7 {}".format(unit), 12.7]
+
+
+def legacy_unit_validate(_validator, _value):
+    """The original Unit* validate(): parse and convert with ph_units on every assignment."""
+    input_value, input_units = parser.parse_input(str(_value))
+    input_value = float(input_value)
+    result = converter.convert(input_value, input_units or _validator.unit, _validator.unit)
+    print("Converting: {} -> {:.4f} {}".format(_value, result, _validator.unit_label or _validator.unit))
+    return result
+
+
+def descriptor_classes():
+    for name, cls in sorted(vars(ghio_validators).items()):
+        if not inspect.isclass(cls) or not issubclass(cls, ghio_validators.Validated):
+            continue
+        if cls in (ghio_validators.Validated, ghio_validators.UnitValidated):
+            continue
+        yield name, cls
+
+
+def make_holder(_validator_class):
+    """Return a new class with the descriptor as its 'value' attribute."""
+    return type("Holder", (object,), {"value": _validator_class("value")})
+
+
+def best_time(_func, _repeats, _reset=None):
+    best = None
+    for _ in range(_repeats):
+        if _reset:
+            _reset()
+        with contextlib.redirect_stdout(io.StringIO()):
+            t0 = time.perf_counter()
+            _func()
+            elapsed = time.perf_counter() - t0
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def reset_caches():
+    ghio_validators.clear_memo()
+    unit_conversion.clear_caches()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the ghio_validators descriptors")
+    arg_parser.add_argument("--sets", type=int, default=500, help="Objects built per descriptor")
+    arg_parser.add_argument("--repeats", type=int, default=5, help="Runs per case (the fastest is reported)")
+    args = arg_parser.parse_args()
+
+    print(f"{args.sets} objects x 3 inputs per descriptor, best of {args.repeats} runs (ms)")
+    header = f"{'Descriptor':<28} {'legacy':>9} {'set':>9} {'many':>9} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for name, cls in descriptor_classes():
+        is_unit = issubclass(cls, ghio_validators.UnitValidated)
+        inputs = unit_sample_inputs(cls) if is_unit else SAMPLE_INPUTS.get(name)
+        if not inputs:
+            print(f"{name:<28} (no sample inputs)")
+            continue
+
+        holder_class = make_holder(cls)
+        all_inputs = inputs * args.sets
+
+        def run_set():
+            for value in all_inputs:
+                obj = holder_class()
+                obj.value = value
+
+        def run_many():
+            cls("value").validate_many(all_inputs)
+
+        t_set = best_time(run_set, args.repeats, reset_caches)
+        t_many = best_time(run_many, args.repeats, reset_caches)
+
+        if is_unit:
+            validator = cls("value")
+
+            def run_legacy():
+                for value in all_inputs:
+                    legacy_unit_validate(validator, value)
+
+            t_legacy = best_time(run_legacy, args.repeats)
+            print(
+                f"{name:<28} {t_legacy * 1000:>9.2f} {t_set * 1000:>9.2f} {t_many * 1000:>9.2f} "
+                f"{t_legacy / t_set:>7.1f}x"
+            )
+        else:
+            print(f"{name:<28} {'-':>9} {t_set * 1000:>9.2f} {t_many * 1000:>9.2f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
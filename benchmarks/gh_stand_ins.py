@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Stand-ins for the Grasshopper / .NET types and the IGH, so the component workers can run on CPython.
+
+Used by the benchmarks here and by the tests in tests/. The 'stubs/' folder only has type-hint
+.pyi files, so the few types the workers use at run-time (DataTree, GH_Path, System.Object)
+are replaced by these small classes, and the IGH by a minimal stand-in with the same methods.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+class GH_Path:
+    def __init__(self, *_indices):
+        self.indices = _indices
+
+    def __hash__(self):
+        return hash(self.indices)
+
+    def __eq__(self, other):
+        return isinstance(other, GH_Path) and self.indices == other.indices
+
+
+class DataTree:
+    def __class_getitem__(cls, _item):
+        return cls
+
+    def __init__(self):
+        self._branches = {}
+
+    def Add(self, _item, _path):
+        self._branches.setdefault(_path, []).append(_item)
+
+    def AddRange(self, _items, _path):
+        self._branches.setdefault(_path, []).extend(_items)
+
+    def Branch(self, _index):
+        return list(self._branches.values())[_index]
+
+    @property
+    def Branches(self):
+        return list(self._branches.values())
+
+    @property
+    def BranchCount(self):
+        return len(self._branches)
+
+
+def install_stand_in_modules():
+    """Register the Grasshopper / System stand-ins, and the gh_compo_io packages without their __init__.
+
+    Importing 'honeybee_ph_rhino.gh_compo_io' would run its __init__, which imports every
+    component (and so Rhino). The two package modules are registered empty instead, so that
+    only the worker modules being run (and what they import) are loaded. The workers only use
+    'honeybee_ph_rhino.gh_io' for type-hints (the real one needs GhPython), so it is
+    registered empty as well.
+    """
+    grasshopper = types.ModuleType("Grasshopper")
+    grasshopper.DataTree = DataTree
+    kernel = types.ModuleType("Grasshopper.Kernel")
+    kernel_data = types.ModuleType("Grasshopper.Kernel.Data")
+    kernel_data.GH_Path = GH_Path
+    system = types.ModuleType("System")
+    system.Object = object
+    sys.modules.setdefault("Grasshopper", grasshopper)
+    sys.modules.setdefault("Grasshopper.Kernel", kernel)
+    sys.modules.setdefault("Grasshopper.Kernel.Data", kernel_data)
+    sys.modules.setdefault("System", system)
+    sys.modules.setdefault("honeybee_ph_rhino.gh_io", types.ModuleType("honeybee_ph_rhino.gh_io"))
+
+    for name, path in (
+        ("honeybee_ph_rhino.gh_compo_io", REPO_ROOT / "honeybee_ph_rhino" / "gh_compo_io"),
+        ("honeybee_ph_rhino.gh_compo_io.program", REPO_ROOT / "honeybee_ph_rhino" / "gh_compo_io" / "program"),
+    ):
+        package = types.ModuleType(name)
+        package.__path__ = [str(path)]
+        sys.modules.setdefault(name, package)
+
+
+class StandInIGH:
+    """Minimal stand-in for the ph_gh_component_io IGH, in a Meters / M2 Rhino document."""
+
+    def __init__(self):
+        self.sc = types.SimpleNamespace(sticky={}, doc=types.SimpleNamespace(ModelAbsoluteTolerance=0.001))
+        self.scriptcontext = self.sc
+        self.messages = []
+
+    def warning(self, _msg):
+        self.messages.append(("warning", _msg))
+
+    def error(self, _msg):
+        self.messages.append(("error", _msg))
+
+    def remark(self, _msg):
+        self.messages.append(("remark", _msg))
+
+    def get_rhino_unit_system_name(self):
+        return "M"
+
+    def get_rhino_areas_unit_name(self):
+        return "M2"
+
+    def warnings(self):
+        return [msg for level, msg in self.messages if level == "warning"]
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Synthetic Honeybee-Room models for the program / load benchmarks.
+
+Builds N box-shaped HB-Rooms laid out on a grid, grouped into stories and dwellings, each
+with a library program (so that the Lighting, Equipment, Infiltration, Ventilation and Setpoint
+loads are set), an HBE-People load carrying PH-Style occupancy (dwellings, bedrooms, people)
+and one (empty) PH-Space. The models are the same for the same arguments, so timings are comparable
+between runs.
+
+Needs 'honeybee-core', 'honeybee-energy' and 'honeybee-ph' installed (pip).
+
+Usage:
+    from synthetic_model import make_rooms
+    rooms = make_rooms(1000, rooms_per_dwelling=4, rooms_per_story=40)
+"""
+
+import random
+
+from honeybee.room import Room
+from honeybee.typing import clean_and_id_ep_string
+from honeybee_energy.lib.programtypes import program_type_by_identifier
+from honeybee_energy.lib.schedules import schedule_by_identifier
+from honeybee_energy.load.people import People
+from honeybee_energy_ph.properties.load.people import PhDwellings
+from honeybee_ph import space
+from ladybug_geometry.geometry3d.pointvector import Point3D
+
+PROGRAM = "Generic Office Program"
+OCCUPANCY_SCHEDULE = "Generic Office Occupancy"
+ACTIVITY_SCHEDULE = "Seated Adult Activity"
+ROOM_SIZE = (6.0, 8.0, 3.0)  # width, depth, height (model units)
+
+
+def make_room(_index, _story_number, _dwellings, _num_bedrooms, _num_people, _people_schedules, _program):
+    """Return one HB-Room with the program, a People load with PH-Style occupancy, and one PH-Space."""
+    width, depth, height = ROOM_SIZE
+    hb_room = Room.from_box(
+        f"Room_{_index:05d}",
+        width,
+        depth,
+        height,
+        origin=_grid_origin(_index, _story_number),
+    )
+    hb_room.display_name = f"Room {_index}"
+    hb_room.story = f"Level_{_story_number:03d}"
+
+    occ_schedule, activity_schedule = _people_schedules
+    hbe_people = People(clean_and_id_ep_string("People"), 0.05, occ_schedule, activity_schedule)
+    ppl_prop_ph = getattr(hbe_people.properties, "ph")
+    ppl_prop_ph.dwellings = _dwellings
+    ppl_prop_ph.number_bedrooms = _num_bedrooms
+    ppl_prop_ph.number_people = _num_people
+
+    room_prop_e = getattr(hb_room.properties, "energy")
+    room_prop_e.program_type = _program
+    room_prop_e.people = hbe_people
+
+    room_prop_ph = getattr(hb_room.properties, "ph")
+    room_prop_ph.add_new_space(space.Space())
+    return hb_room
+
+
+def _grid_origin(_index, _story_number):
+    width, depth, height = ROOM_SIZE
+    return Point3D((_index % 10) * width, ((_index // 10) % 100) * depth, _story_number * height)
+
+
+def make_rooms(_num_rooms, rooms_per_dwelling=4, rooms_per_story=40, seed=0):
+    """Return a list of HB-Rooms, grouped into stories and dwellings.
+
+    Arguments:
+    ----------
+        * _num_rooms (int): The number of HB-Rooms to build.
+        * rooms_per_dwelling (int): Every block of this many rooms shares one PhDwellings object.
+        * rooms_per_story (int): Every block of this many rooms is on the same HB 'story'.
+        * seed (int): Seed for the bedroom / people counts.
+
+    Returns:
+    --------
+        * (list[Room]): The new HB-Rooms.
+    """
+    rng = random.Random(seed)
+    people_schedules = (schedule_by_identifier(OCCUPANCY_SCHEDULE), schedule_by_identifier(ACTIVITY_SCHEDULE))
+    program = program_type_by_identifier(PROGRAM)
+
+    hb_rooms = []
+    dwellings = None
+    for i in range(_num_rooms):
+        if i % rooms_per_dwelling == 0:
+            dwellings = PhDwellings(_num_dwellings=1)
+            dwellings.identifier = clean_and_id_ep_string("HBPH_DWELLING")
+        num_bedrooms = rng.choice((0, 1, 1, 2))
+        num_people = round(rng.uniform(0.5, 2.5), 2)
+        hb_rooms.append(
+            make_room(i, i // rooms_per_story, dwellings, num_bedrooms, num_people, people_schedules, program)
+        )
+    return hb_rooms
+
+
+if __name__ == "__main__":
+    rooms = make_rooms(100)
+    print(f"Built {len(rooms)} rooms on {len({r.story for r in rooms})} stories")
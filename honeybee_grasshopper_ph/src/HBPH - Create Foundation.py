@@ -22,6 +22,9 @@
 """
 Create a new PH-Foundation object which can be added to one or more Honeybee-Rooms.
 -
+Input a list of values into any of the type's inputs to build one PH-Foundation for each item, in a
+single solve. A shorter list repeats its last item.
+-
 EM March 18, 2023
     Args:
         _type: (str) The Type of foundation. Input either-
@@ -51,6 +54,7 @@ except ImportError as e:
 try:
     from honeybee_ph_rhino import gh_compo_io, gh_io
     from honeybee_ph_rhino.gh_compo_io.foundations_create import get_component_inputs
+    from honeybee_ph_rhino.attr_input_map import batch_input_group
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee_ph_rhino:\n\t{}'.format(e))
     
@@ -75,7 +79,7 @@ IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
 #-------------------------------------------------------------------------------
 # -- Setup the input nodes, get all the user input values
 input_dict = get_component_inputs(_type)
-gh_io.setup_component_inputs(IGH, input_dict, _start_i=2)
+gh_io.setup_component_inputs(IGH, batch_input_group(input_dict), _start_i=2)
 input_values_dict = gh_io.get_component_input_values(ghenv)
 
 
@@ -85,8 +89,9 @@ gh_compo_interface = gh_compo_io.GHCompo_CreateFoundations(
         _type,
         input_values_dict,
 )
-ph_foundation_ = gh_compo_interface.run()
+ph_foundation_ = gh_compo_interface.run_batch()
 
 
 # -------------------------------------------------------------------------------------
-preview.object_preview(ph_foundation_)
+for ph_foundation in ph_foundation_:
+    preview.object_preview(ph_foundation)
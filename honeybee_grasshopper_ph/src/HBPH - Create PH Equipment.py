@@ -23,6 +23,9 @@
 Create a new detailed Passive House style equipment which can be added to the 
 honeybee Rooms.
 -
+Input a list of values into any of the type's inputs to build the equipment once for each
+item, in a single solve. A shorter list repeats its last item.
+-
 EM March 4, 2025
     Args:
         _type: (str) Input either -
@@ -64,6 +67,7 @@ except ImportError as e:
 try:
     from honeybee_ph_rhino import gh_compo_io
     from honeybee_ph_rhino.gh_compo_io.program import create_elec_equip
+    from honeybee_ph_rhino.attr_input_map import batch_input_group
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee_ph_rhino:\n\t{}'.format(e))
 
@@ -96,7 +100,7 @@ IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
 #-------------------------------------------------------------------------------
 # -- Setup the input nodes, get all the user input values
 input_dict = create_elec_equip.get_component_inputs(_type)
-gh_io.setup_component_inputs(IGH, input_dict, _start_i=2)
+gh_io.setup_component_inputs(IGH, batch_input_group(input_dict), _start_i=2)
 input_values_dict = gh_io.get_component_input_values(ghenv)
 
 
@@ -106,7 +110,7 @@ gh_compo_interface = gh_compo_io.GHCompo_CreateElecEquip(
         _type,
         input_values_dict
     )
-equipment_ = gh_compo_interface.run()
+equipment_ = gh_compo_interface.run_batch()
 
 
 #-------------------------------------------------------------------------------
@@ -28,6 +28,9 @@ any components to the HB-Energy model. If you need to model mechancial equipment
 / OpenStudio simulation then you must also use the Honeybee-Energy / IronBug components to setup
 those devices separate from the inputs defined on the component here.
 -
+Input a list of values into any of the type's inputs to build one heater for each item, in a
+single solve. A shorter list repeats its last item.
+-
 EM April 21, 20224
 
 """
@@ -45,6 +48,7 @@ except ImportError as e:
 
 try:
     from honeybee_ph_rhino import gh_compo_io, gh_io
+    from honeybee_ph_rhino.attr_input_map import batch_input_group
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee_ph_rhino:\n\t{}'.format(e))
 
@@ -68,7 +72,7 @@ IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
 #-------------------------------------------------------------------------------
 # -- Setup the input nodes, get all the user input values
 input_dict = gh_compo_io.shw.create_heater.get_component_inputs(heater_type)
-gh_io.setup_component_inputs(IGH, input_dict)
+gh_io.setup_component_inputs(IGH, batch_input_group(input_dict))
 input_values_dict = gh_io.get_component_input_values(ghenv)
 
 
@@ -79,9 +83,10 @@ gh_compo_interface = gh_compo_io.GHCompo_CreateSHWHeater(
         heater_type,
         input_values_dict,
     )
-heater_ = gh_compo_interface.run()
+heater_ = gh_compo_interface.run_batch()
 
 
 #-------------------------------------------------------------------------------
 # -- Preview
-preview.object_preview(heater_)
\ No newline at end of file
+for heater in heater_:
+    preview.object_preview(heater)
\ No newline at end of file
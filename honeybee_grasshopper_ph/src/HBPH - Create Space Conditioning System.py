@@ -24,6 +24,9 @@ Create a new PH-HVAC Space Conditioning (Heating, Cooling) System which can serv
 Connect the 'space_conditioning_system_' output to the '_space_conditioning_systems' input on a 
 'HBPH - Add Mech Systems' component.
 -
+Input a list of values into any of the type's inputs to build one system for each item, in a
+single solve. A shorter list repeats its last item.
+-
 NOTE: Using the component will add ONLY the Passive House devices and will **NOT** add 
 any components to the HB-Energy model. If you need to model mechancial equipment for an EnergyPlus
 / OpenStudio simulation then you must also use the Honeybee-Energy / IronBug components to setup
@@ -52,6 +55,7 @@ except ImportError as e:
 try:
     from honeybee_ph_rhino import gh_compo_io, gh_io
     from honeybee_ph_rhino.gh_compo_io.hvac import create_space_conditioning_sys
+    from honeybee_ph_rhino.attr_input_map import batch_input_group
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee_ph_rhino:\n\t{}'.format(e))
 
@@ -73,7 +77,7 @@ IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
 #-------------------------------------------------------------------------------
 # -- Setup the input nodes, get all the user input values
 input_dict = create_space_conditioning_sys.get_component_inputs(_system_type)
-gh_io.setup_component_inputs(IGH, input_dict, _start_i=1)
+gh_io.setup_component_inputs(IGH, batch_input_group(input_dict), _start_i=1)
 input_values_dict = gh_io.get_component_input_values(ghenv)
 
 
@@ -84,9 +88,10 @@ gh_compo_interface = gh_compo_io.GHCompo_CreateSpaceConditioningSystem(
         _system_type,
         input_values_dict,
     )
-space_conditioning_system_ = gh_compo_interface.run()
+space_conditioning_system_ = gh_compo_interface.run_batch()
 
 
 #-------------------------------------------------------------------------------
 # -- Preview
-preview.object_preview(space_conditioning_system_)
\ No newline at end of file
+for space_conditioning_system in space_conditioning_system_:
+    preview.object_preview(space_conditioning_system)
\ No newline at end of file
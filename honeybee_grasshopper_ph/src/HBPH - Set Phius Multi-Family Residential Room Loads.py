@@ -51,6 +51,12 @@ EM April 8, 2025
 
         _hb_residential_rooms: (list[Room]): The Honeybee Residential Rooms to add the new loads to.
 
+        _allocate_by_: (str) Optional. How the total MEL and Lighting are divided between the 
+            Honeybee-Rooms. Input either-
+"EQUAL" (Default) each Honeybee-Room gets the same share.
+"FLOOR_AREA" each Honeybee-Room gets a share by its floor area.
+"DWELLINGS" each dwelling gets the same share, split evenly between the dwelling's Honeybee-Rooms.
+
     Returns:
 
         hb_residential_rooms_: The Honeybee-Rooms with the new Residential electrical
@@ -97,6 +103,7 @@ gh_compo_interface = gh_compo_io.GHCompo_SetPhiusMFResidentialRoomLoads(
     _total_lighting_ext,
     _total_lighting_garage,
     _hb_residential_rooms,
+    _allocate_by_,
 )
 
 hb_residential_rooms_ = gh_compo_interface.run()
\ No newline at end of file
@@ -0,0 +1,96 @@
+#
+# Honeybee-PH: A Plugin for adding Passive-House data to LadybugTools Honeybee-Energy Models
+# 
+# This component is part of the PH-Tools toolkit <https://github.com/PH-Tools>.
+# 
+# Copyright (c) 2022, PH-Tools and bldgtyp, llc <phtools@bldgtyp.com> 
+# Honeybee-PH is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# Honeybee-PH is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <https://github.com/PH-Tools/honeybee_ph/blob/main/LICENSE>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Write any of the WUFI-XML, METr-JSON, PPP and OpenPH outputs from one HBJSON file, in
+one step. The HBJSON is read in and converted only once for all of the outputs (the
+WUFI-XML and METr-JSON share one conversion), instead of once per output as when
+using the separate 'Write' components.
+-
+EM October 19, 2026
+    Args:
+        _filename: (str) The filename for the WUFI XML, METr JSON and PPP files.
+        
+        _save_folder: (str) The folder path to save the files to. The OpenPH tables
+            are written to an 'out' folder inside this folder.
+        
+        _hb_json_file: (str) The path to the HBJSON file to convert. Or, connect the HB-Model
+            itself to send it to the Py3 worker without writing an HBJSON file.
+        
+        _settings: The WUFI Settings object, used for the WUFI XML and METr JSON. 
+            Connect the "HBPH - Write WUFI XML Settings" 'settings_' output.
+
+        _formats: (list[str]) Optional. The outputs to write: "wufi_xml", "metr_json", 
+            "ppp" and / or "openph". Default: all of them.
+
+        _write: (bool) Set True to run. 
+            
+    Returns:
+        xml_file_: The full path to the output WUFI XML file.
+        
+        json_file_: The full path to the output METr JSON file.
+        
+        ppp_file_: The full path to the output PPP file.
+        
+        openph_folder_: The folder with the OpenPH output tables.
+"""
+
+import scriptcontext as sc
+import Rhino as rh
+import rhinoscriptsyntax as rs
+import ghpythonlib.components as ghc
+import Grasshopper as gh
+
+
+try:
+    from honeybee_ph_rhino import gh_compo_io, gh_io
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_ph_rhino:\n\t{}'.format(e))
+
+
+# ------------------------------------------------------------------------------
+import honeybee_ph_rhino._component_info_
+reload(honeybee_ph_rhino._component_info_)
+ghenv.Component.Name = "HBPH - Write Exports"
+DEV = honeybee_ph_rhino._component_info_.set_component_params(ghenv, dev=False)
+if DEV:
+    from honeybee_ph_rhino import py3_worker
+    reload(py3_worker)
+    from honeybee_ph_rhino.gh_compo_io import write_exports as gh_compo_io
+    reload(gh_compo_io)
+    reload(gh_io)
+    
+# ------------------------------------------------------------------------------
+# -- GH Interface
+IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
+
+
+# ------------------------------------------------------------------------------
+gh_compo_interface = gh_compo_io.GHCompo_WriteExports(
+        IGH,
+        _filename,
+        _save_folder,
+        _hb_json_file,
+        _settings,
+        _formats,
+        _write,
+)
+xml_file_, json_file_, ppp_file_, openph_folder_ = gh_compo_interface.run()
\ No newline at end of file
@@ -0,0 +1,88 @@
+#
+# Honeybee-PH: A Plugin for adding Passive-House data to LadybugTools Honeybee-Energy Models
+# 
+# This component is part of the PH-Tools toolkit <https://github.com/PH-Tools>.
+# 
+# Copyright (c) 2022, PH-Tools and bldgtyp, llc <phtools@bldgtyp.com> 
+# Honeybee-PH is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# Honeybee-PH is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <https://github.com/PH-Tools/honeybee_ph/blob/main/LICENSE>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Write the HB-Model to an HBJSON file: plain, gzip-compressed, or chunked (one chunk
+per room, plus one for the constructions, schedules and the rest of the model). The
+compressed and chunked files are several times smaller. For a chunked file, the
+export components can tell from its index alone if the model changed since the
+last export, without reading in the rooms. The Honeybee-PH 'Write' components (and
+the Py3 worker) read all three layouts, but the other LBT / Honeybee tools only read
+a plain HBJSON file.
+-
+EM October 19, 2026
+    Args:
+        _hb_model: (honeybee.model.Model) The HB-Model to write.
+        
+        _filename: (str) Optional. The file name, without the extension. Default: the
+            model's identifier.
+        
+        _save_folder: (str) The folder path to save the file to.
+        
+        _layout: (str) Optional. "json" (.hbjson), "gzip" (.hbjson.gz) or "chunked" 
+            (.hbjsonz). Default: "json".
+
+        _write: (bool) Set True to run. 
+            
+    Returns:
+        hbjson_file_: The full path to the HBJSON file.
+"""
+
+import scriptcontext as sc
+import Rhino as rh
+import rhinoscriptsyntax as rs
+import ghpythonlib.components as ghc
+import Grasshopper as gh
+
+
+try:
+    from honeybee_ph_rhino import gh_compo_io, gh_io
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_ph_rhino:\n\t{}'.format(e))
+
+
+# ------------------------------------------------------------------------------
+import honeybee_ph_rhino._component_info_
+reload(honeybee_ph_rhino._component_info_)
+ghenv.Component.Name = "HBPH - Write HBJSON"
+DEV = honeybee_ph_rhino._component_info_.set_component_params(ghenv, dev=False)
+if DEV:
+    from honeybee_ph_rhino import hbjson_io
+    reload(hbjson_io)
+    from honeybee_ph_rhino.gh_compo_io import write_hbjson as gh_compo_io
+    reload(gh_compo_io)
+    reload(gh_io)
+    
+# ------------------------------------------------------------------------------
+# -- GH Interface
+IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
+
+
+# ------------------------------------------------------------------------------
+gh_compo_interface = gh_compo_io.GHCompo_WriteHBJSON(
+        IGH,
+        _hb_model,
+        _filename,
+        _save_folder,
+        _layout,
+        _write,
+)
+hbjson_file_ = gh_compo_interface.run()
\ No newline at end of file
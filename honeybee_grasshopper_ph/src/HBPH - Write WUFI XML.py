@@ -30,7 +30,8 @@ EM June 5, 2024
         
         _save_folder: (str) The folder path to save the WUFI XML file to.
         
-        _hb_json_file: (str) The path to the HBJSON file to convert into WUFI XML.
+        _hb_json_file: (str | Model) The path to the HBJSON file to convert into WUFI XML,
+            or the Honeybee-Model itself.
         
         _settings: The WUFI Settings object. Connect the "HBPH - Write WUFI XML Settings"
             'settings_' output.
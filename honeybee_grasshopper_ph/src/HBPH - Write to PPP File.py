@@ -27,8 +27,8 @@ with the PHPP for details.
 -
 EM March 11, 2026
     Args:
-        _hbjson_file: (str) The full file path to the HBJSON you would like to write 
-            out to PHPP.
+        _hbjson_file: (str | Model) The full file path to the HBJSON you would like to write 
+            out to PHPP, or the Honeybee-Model itself.
     
         _write: (bool) Set True to run the PPP File writer.
             
@@ -554,6 +554,18 @@ COMPONENT_PARAMS = {
         "Category": CATEGORY,
         "SubCategory": 3,
     },
+    "HBPH - Write Exports": {
+        "NickName": "Write Exports",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 3,
+    },
+    "HBPH - Write HBJSON": {
+        "NickName": "Write HBJSON",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 3,
+    },
     # -- Foundations
     "HBPH - Add Foundations": {
         "NickName": "Add Foundations",
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Precomputed attribute -> component-input maps for the 'Create ...' components.
+
+Several components (Create PH Equipment, Create SHW Heater, Create Foundation, Create Space
+Conditioning System) build a new object and then copy the user-inputs onto it. They used to
+call 'dir()' on the new object every run, and for every attribute search the component's
+input-group dict for the input-node with that name, to find its unit.
+
+The AttributeInputMap here does that work once for each (object-class, input-group) pair and
+keeps it for the session. Applying the inputs to a new object is then one dict lookup per
+attribute.
+
+Batch mode: 'batch_input_group' sets a component's 'item' inputs to 'list' access, so that the
+component gets every value in a single solve. 'expand_batch_inputs' then splits the values
+into one input-dict per object, using Grasshopper's 'longest-list' matching, and 'run_batch'
+builds an object from each.
+
+Usage:
+------
+
+>>> from honeybee_ph_rhino.attr_input_map import get_attr_input_map
+>>> attr_map = get_attr_input_map(type(heater), input_group)
+>>> attr_map.apply(heater, input_dict)
+"""
+
+from copy import copy
+
+try:
+    from typing import Any, Dict, Iterable, List, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_ph_rhino import unit_conversion
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
+
+_ATTR_NAMES = {}  # type: Dict[type, Tuple[str, ...]]
+_INPUT_NAMES = {}  # type: Dict[int, Tuple[Dict, Dict[str, Any]]]
+_MAPS = {}  # type: Dict[Tuple[type, int], AttributeInputMap]
+
+
+def public_attr_names(_obj):
+    # type: (Any) -> Tuple[str, ...]
+    """Return the (cached) names in 'dir(_obj)' which don't start with "_", for the object's class.
+
+    The names come from the first object of each class seen, so they include the attributes
+    which the class sets in its __init__.
+    """
+    cls = type(_obj)
+    try:
+        return _ATTR_NAMES[cls]
+    except KeyError:
+        names = tuple(n for n in dir(_obj) if not n.startswith("_"))
+        _ATTR_NAMES[cls] = names
+        return names
+
+
+def input_names(_input_group):
+    # type: (Optional[Dict[int, Any]]) -> Dict[str, Any]
+    """Return a (cached) {input-name: ComponentInput} dict for a component input-group dict."""
+    if not _input_group:
+        return {}
+
+    key = id(_input_group)
+    try:
+        group, by_name = _INPUT_NAMES[key]
+        if group is _input_group:
+            return by_name
+    except KeyError:
+        pass
+
+    by_name = {}
+    for component_input in _input_group.values():
+        by_name.setdefault(component_input.name, component_input)
+    _INPUT_NAMES[key] = (_input_group, by_name)  # keep the group alive, so its id is not reused
+    return by_name
+
+
+class AttributeInputMap(object):
+    """The public attributes of an object-class, and the target-unit of the input-node for each.
+
+    Arguments:
+    ----------
+        * _attr_names (Iterable[str]): The public attribute names of the object-class.
+        * _input_group (Optional[Dict[int, ComponentInput]]): The component's input-group dict.
+    """
+
+    def __init__(self, _attr_names, _input_group=None):
+        # type: (Iterable[str], Optional[Dict[int, Any]]) -> None
+        by_name = input_names(_input_group)
+        self.items = []  # type: List[Tuple[str, Optional[str]]]
+        for attr_name in _attr_names:
+            component_input = by_name.get(attr_name, None)
+            target_unit = getattr(component_input, "target_unit", None) if component_input else None
+            self.items.append((attr_name, target_unit))
+
+    def apply(self, _obj, _input_dict, _log=None):
+        # type: (Any, Dict[str, Any], Optional[Any]) -> Any
+        """Set the object's attributes from the user-input values, converting any with a target-unit.
+
+        Arguments:
+        ----------
+            * _obj (Any): The object to set the attributes on.
+            * _input_dict (Dict[str, Any]): The user-input values, by input-node name.
+            * _log (Optional[SolveLogger]): Optional logger for each attribute set.
+
+        Returns:
+        --------
+            * (Any): The same object, with its attributes set.
+        """
+        for attr_name, target_unit in self.items:
+            user_input = _input_dict.get(attr_name, None)
+            if not user_input:
+                continue
+
+            if target_unit:
+                user_input = convert_user_input(user_input, target_unit)
+                if not user_input:
+                    continue
+
+            if _log is not None:
+                _log.debug("Setting attribute '{}' to '{}'", attr_name, user_input)
+            setattr(_obj, attr_name, user_input)
+
+        return _obj
+
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        return "{}(attributes={})".format(self.__class__.__name__, len(self))
+
+
+def get_attr_input_map(_obj, _input_group=None):
+    # type: (Any, Optional[Dict[int, Any]]) -> AttributeInputMap
+    """Return the (cached) AttributeInputMap for the object's class and the component input-group."""
+    key = (type(_obj), id(_input_group) if _input_group else None)
+    try:
+        return _MAPS[key]
+    except KeyError:
+        pass
+
+    if _input_group:
+        input_names(_input_group)  # keeps the group alive for the life of the cache
+    attr_map = AttributeInputMap(public_attr_names(_obj), _input_group)
+    _MAPS[key] = attr_map
+    return attr_map
+
+
+def convert_user_input(_input, _target_unit):
+    # type: (Any, str) -> Any
+    """Convert a user-input (or a list of them) with or without a unit (ie: "12.7 MM") to the target-unit."""
+    if isinstance(_input, (list, tuple, set)):
+        return unit_conversion.convert_many(_input, _target_unit)
+
+    value, unit = unit_conversion.parse_input(_input)
+    return unit_conversion.convert(value, unit, _target_unit)
+
+
+def clear_cache():
+    # type: () -> None
+    """Clear the attribute-name, input-name and AttributeInputMap caches."""
+    _ATTR_NAMES.clear()
+    _INPUT_NAMES.clear()
+    _MAPS.clear()
+
+
+# -----------------------------------------------------------------------------
+# -- Batch mode
+
+
+def batch_input_group(_input_group):
+    # type: (Optional[Dict[int, Any]]) -> Dict[int, Any]
+    """Return a copy of the component input-group, with its 'item' inputs set to 'list' access."""
+    batch_group = {}
+    for input_num, component_input in (_input_group or {}).items():
+        if component_input.access == 0:
+            component_input = copy(component_input)
+            component_input.access = 1
+        batch_group[input_num] = component_input
+    return batch_group
+
+
+def batch_input_names(_input_group):
+    # type: (Optional[Dict[int, Any]]) -> List[str]
+    """Return the names of the input-group's 'item' inputs, which take one value per object in batch mode."""
+    return [component_input.name for component_input in (_input_group or {}).values() if component_input.access == 0]
+
+
+def expand_batch_inputs(_input_dict, _batch_names):
+    # type: (Dict[str, Any], Iterable[str]) -> List[Dict[str, Any]]
+    """Split one input-dict with list inputs into one input-dict per object, using 'longest-list' matching.
+
+    Arguments:
+    ----------
+        * _input_dict (Dict[str, Any]): The user-input values, by input-node name.
+        * _batch_names (Iterable[str]): The names of the inputs which hold one value per object.
+            Any shorter list repeats its last item, and an empty list is no value (None). All
+            other inputs are shared by every object.
+
+    Returns:
+    --------
+        * (List[Dict[str, Any]]): One input-dict for each object to build (always at least one).
+    """
+    shared_input_dict = dict(_input_dict)
+    columns = {}  # type: Dict[str, List[Any]]
+    for name in _batch_names:
+        values = shared_input_dict.get(name, None)
+        if not isinstance(values, (list, tuple)):
+            continue
+        if values:
+            columns[name] = list(values)
+        else:
+            shared_input_dict[name] = None
+
+    if not columns:
+        return [shared_input_dict]
+
+    count = max(len(v) for v in columns.values())
+    input_dicts = []
+    for i in range(count):
+        input_dict = dict(shared_input_dict)
+        for name, values in columns.items():
+            input_dict[name] = values[min(i, len(values) - 1)]
+        input_dicts.append(input_dict)
+    return input_dicts
+
+
+def run_batch(_gh_compo_interface, _input_dicts):
+    # type: (Any, Iterable[Dict[str, Any]]) -> List[Any]
+    """Call the component-interface's run() once for each input-dict, and return the results in order."""
+    original_input_dict = _gh_compo_interface.input_dict
+    results_ = []
+    try:
+        for input_dict in _input_dicts:
+            _gh_compo_interface.input_dict = input_dict
+            results_.append(_gh_compo_interface.run())
+    finally:
+        _gh_compo_interface.input_dict = original_input_dict
+    return results_
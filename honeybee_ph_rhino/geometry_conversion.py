@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Type-keyed dispatch used by IGH.convert_to_LBT_geom() and IGH.convert_to_rhino_geom().
+
+The converter for each input type is found once (by walking the ordered rules with
+isinstance) and then cached by type, so a list of 10,000 Breps does one lookup instead
+of 10,000 trips through an isinstance chain. Nested lists are walked with an explicit
+stack instead of recursion.
+
+This module has no Rhino or Ladybug imports: the rules (type -> function) are supplied
+by the caller, which keeps it testable / benchmark-able outside of Rhino.
+"""
+
+try:
+    from typing import Any, Callable, Dict, List, Sequence, Tuple, Type, Union
+except ImportError:
+    pass  # IronPython 2.7
+
+
+def to_number_or_str(_input):
+    # type: (Any) -> Union[float, str]
+    """Return the input as a float if it can be read as a number, otherwise as a string."""
+    try:
+        return float(_input)
+    except (ValueError, TypeError):
+        return str(_input)
+
+
+class TypeDispatchConverter(object):
+    """Convert items (and nested lists of items) using a per-type cached converter function.
+
+    Arguments:
+    ----------
+        * _rules (Sequence[Tuple[Type | Tuple[Type, ...], Callable]]): The ordered
+            (type(s), converter) pairs. The first rule whose type(s) match by isinstance wins,
+            just like an if / elif chain.
+        * _on_unknown (Callable[[Any], Exception]): Called with any item which matches no
+            rule. Should return the Exception to raise.
+    """
+
+    def __init__(self, _rules, _on_unknown):
+        # type: (Sequence[Tuple[Any, Callable[[Any], Any]]], Callable[[Any], Exception]) -> None
+        self._rules = list(_rules)
+        self._on_unknown = _on_unknown
+        self._cache = {}  # type: Dict[type, Callable[[Any], Any]]
+
+    def converter_for(self, _type):
+        # type: (type) -> Callable[[Any], Any]
+        """Return the converter function for the type, resolving it against the rules only on the first call."""
+        try:
+            return self._cache[_type]
+        except KeyError:
+            pass
+
+        for rule_type, func in self._rules:
+            if issubclass(_type, rule_type):
+                self._cache[_type] = func
+                return func
+        return self._raise_unknown
+
+    def _raise_unknown(self, _item):
+        raise self._on_unknown(_item)
+
+    def convert_item(self, _item):
+        # type: (Any) -> Any
+        """Convert a single (non-list) item."""
+        return self.converter_for(type(_item))(_item)
+
+    def convert_flat(self, _items):
+        # type: (Sequence[Any]) -> List[Any]
+        """Convert a flat list of (non-list) items. Homogeneous lists use a single converter lookup."""
+        if not _items:
+            return []
+
+        first_type = type(_items[0])
+        if all(type(item) is first_type for item in _items):
+            func = self.converter_for(first_type)
+            return [func(item) for item in _items]
+
+        converter_for = self.converter_for
+        return [converter_for(type(item))(item) for item in _items]
+
+    def convert(self, _inputs):
+        # type: (Any) -> List[Any]
+        """Convert the input(s), keeping the same output nesting as the original recursive IGH methods.
+
+        A non-list input is treated as a one-item list. Items of the input list are converted
+        in place. Each item inside a nested list is converted as if it were its own input, so
+        it comes back wrapped in a list:
+
+            [a, [b, [c, d]]] -> [A, [B], [C, D]]
+        """
+        if not isinstance(_inputs, list):
+            _inputs = [_inputs]
+
+        if not any(isinstance(item, list) for item in _inputs):
+            return self.convert_flat(_inputs)
+
+        converter_for = self.converter_for
+        output = []  # type: List[Any]
+        stack = [(_inputs, output)]  # type: List[Tuple[List[Any], List[Any]]]
+        while stack:
+            source, target = stack.pop()
+            for item in source:
+                if not isinstance(item, list):
+                    target.append(converter_for(type(item))(item))
+                    continue
+
+                for sub_item in item:
+                    if isinstance(sub_item, list):
+                        sub_target = []  # type: List[Any]
+                        target.append(sub_target)
+                        stack.append((sub_item, sub_target))
+                    else:
+                        target.append([converter_for(type(sub_item))(sub_item)])
+
+        return output
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Geometry kernel behind the gh_io.IGH geometry helpers (inset, merge, extrude).
+
+Every ghpythonlib.components call builds and solves a complete Grasshopper component, which
+is slow when the IGH helpers are called thousands of times while building Spaces, Floors and
+Volumes. The functions here do the same work directly with RhinoCommon.
+
+The original ghpythonlib.components versions are kept (the '*_ghc' functions) so the two can
+be compared using 'benchmarks/bench_geometry_kernel.py'.
+"""
+
+try:
+    from typing import Any, List, Optional
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    import Rhino.Geometry as rg  # type: ignore
+except ImportError:
+    raise ImportError("Failed to import Rhino")
+
+
+class GeometryKernelError(Exception):
+    def __init__(self, _operation):
+        self.message = "Geometry Error: RhinoCommon '{}' operation failed.".format(_operation)
+        super(GeometryKernelError, self).__init__(self.message)
+
+
+# -----------------------------------------------------------------------------
+# -- Utils
+
+
+def curve_area(_curve):
+    # type: (rg.Curve) -> float
+    """Return the area enclosed by a closed planar curve, or 0.0 if it cannot be calculated."""
+    mass_props = rg.AreaMassProperties.Compute(_curve)
+    if not mass_props:
+        return 0.0
+    return mass_props.Area
+
+
+def brep_perimeter_curves(_brep, _tolerance):
+    # type: (rg.Brep, float) -> List[rg.Curve]
+    """Return the Brep's naked-edges, joined together into (closed) perimeter curves."""
+    edges = _brep.DuplicateNakedEdgeCurves(True, True)
+    if not edges:
+        return []
+    return list(rg.Curve.JoinCurves(edges, _tolerance))
+
+
+def planar_breps_from_curves(_curves, _tolerance):
+    # type: (List[rg.Curve], float) -> List[rg.Brep]
+    """Return the planar Brep(s) bounded by the curves. Inner curves become holes."""
+    breps = rg.Brep.CreatePlanarBreps(_curves, _tolerance)
+    if not breps:
+        return []
+    return list(breps)
+
+
+def _offset_into_face(_curve, _plane, _distance, _tolerance, _shrink):
+    # type: (rg.Curve, rg.Plane, float, float, bool) -> Optional[rg.Curve]
+    """Offset a closed planar curve so that the face it bounds gets smaller.
+
+    The offset side of a closed curve depends on its direction, so try one side and
+    check the enclosed area; only if that went the wrong way is the other side tried.
+    An outer boundary should shrink (_shrink=True), a hole should grow (_shrink=False).
+    """
+    original_area = curve_area(_curve)
+    for distance in (_distance, -_distance):
+        offsets = _curve.Offset(_plane, distance, _tolerance, rg.CurveOffsetCornerStyle.Sharp)
+        if not offsets or len(offsets) != 1:
+            continue
+
+        offset = offsets[0]
+        if not offset.IsClosed:
+            continue
+
+        offset_area = curve_area(offset)
+        if _shrink and offset_area < original_area:
+            return offset
+        if not _shrink and offset_area > original_area:
+            return offset
+    return None
+
+
+def _boolean_union_curves(_curves, _tolerance):
+    # type: (List[rg.Curve], float) -> List[rg.Curve]
+    """Boolean-union closed planar curves. Works with both the Rhino 7+ and the Rhino 6 API."""
+    try:
+        result = rg.Curve.CreateBooleanUnion(_curves, _tolerance)
+    except TypeError:
+        result = rg.Curve.CreateBooleanUnion(_curves)  # Rhino 6
+    if not result:
+        return []
+    return list(result)
+
+
+# -----------------------------------------------------------------------------
+# -- RhinoCommon
+
+
+def inset_brep(_brep, _inset_distance, _tolerance):
+    # type: (rg.Brep, float, float) -> rg.Brep
+    """Return a new planar Brep with the edges of the input (planar) Brep moved inward.
+
+    Arguments:
+    ----------
+        * _brep (rg.Brep): The planar Brep to inset.
+        * _inset_distance (float): The distance to move each edge 'into' the Brep.
+        * _tolerance (float): The Rhino document tolerance.
+
+    Returns:
+    --------
+        * (rg.Brep): The new inset Brep. If the edges cannot be offset, a planar Brep
+            built from the original edges is returned instead.
+    """
+    perimeters = brep_perimeter_curves(_brep, _tolerance)
+    if not perimeters:
+        raise GeometryKernelError("DuplicateNakedEdgeCurves")
+
+    # -- The outer boundary encloses the largest area, any others are holes.
+    perimeters = sorted(perimeters, key=curve_area, reverse=True)
+    success, plane = perimeters[0].TryGetPlane(_tolerance)
+
+    new_curves = []
+    for i, perimeter in enumerate(perimeters):
+        new_curve = None
+        if success:
+            new_curve = _offset_into_face(perimeter, plane, _inset_distance, _tolerance, _shrink=(i == 0))
+        new_curves.append(new_curve or perimeter)
+
+    new_breps = planar_breps_from_curves(new_curves, _tolerance)
+    if not new_breps:
+        new_breps = planar_breps_from_curves(perimeters, _tolerance)
+    if not new_breps:
+        raise GeometryKernelError("CreatePlanarBreps")
+    return new_breps[0]
+
+
+def merged_perimeter_curves(_breps, _tolerance):
+    # type: (List[rg.Brep], float) -> List[rg.Curve]
+    """Return the boolean-union of the perimeter curves of the (touching or overlapping) planar Breps.
+
+    As with the GH RegionUnion, a single curve, or curves which do not touch, are returned unchanged.
+    """
+    perimeters = []
+    for brep in _breps:
+        perimeters.extend(brep_perimeter_curves(brep, _tolerance))
+
+    if len(perimeters) < 2:
+        return perimeters
+
+    unioned_curves = _boolean_union_curves(perimeters, _tolerance)
+    if not unioned_curves:
+        return perimeters
+    return unioned_curves
+
+
+def extrude_brep_world_z(_brep, _distance):
+    # type: (rg.Brep, float) -> rg.Brep
+    """Return a closed (capped) Brep made by extruding the first face of the Brep along the World-Z axis."""
+    path = rg.LineCurve(rg.Point3d(0, 0, 0), rg.Point3d(0, 0, _distance))
+    volume = _brep.Faces[0].CreateExtrusion(path, True)
+    if not volume:
+        raise GeometryKernelError("CreateExtrusion")
+    return volume
+
+
+# -----------------------------------------------------------------------------
+# -- ghpythonlib.components (original versions, kept for benchmark comparison)
+
+
+def inset_brep_ghc(_ghc, _brep, _inset_distance):
+    # type: (Any, rg.Brep, float) -> rg.Brep
+    """ghpythonlib.components version of inset_brep()."""
+    srfcPerim = _ghc.JoinCurves(_ghc.BrepEdges(_brep)[0], preserve=False)
+    plane = _ghc.IsPlanar(_brep, True).plane
+    srfcPerim_Inset_Pos = _ghc.OffsetCurve(srfcPerim, _inset_distance, plane, 1)
+    srfcPerim_Inset_Neg = _ghc.OffsetCurve(srfcPerim, _inset_distance * -1, plane, 1)
+
+    # -- Choose the right Offset Curve. The one with the smaller area
+    if srfcPerim_Inset_Pos.IsPlanar():
+        srfcInset_Pos = _ghc.BoundarySurfaces(srfcPerim_Inset_Pos)
+    else:
+        srfcInset_Pos = _ghc.BoundarySurfaces(srfcPerim)
+
+    if srfcPerim_Inset_Neg.IsPlanar():
+        srfcInset_Neg = _ghc.BoundarySurfaces(srfcPerim_Inset_Neg)
+    else:
+        srfcInset_Neg = _ghc.BoundarySurfaces(srfcPerim)
+
+    if _ghc.Area(srfcInset_Pos).area < _ghc.Area(srfcInset_Neg).area:
+        return srfcInset_Pos
+    else:
+        return srfcInset_Neg
+
+
+def merged_perimeter_curves_ghc(_ghc, _breps):
+    # type: (Any, List[rg.Brep]) -> List[rg.Curve]
+    """ghpythonlib.components version of merged_perimeter_curves()."""
+    perims = []
+    for brep in _breps:
+        faces, edges, vertices = _ghc.DeconstructBrep(brep)
+        perims.append(_ghc.JoinCurves(edges, True))
+
+    joined_curves = _ghc.RegionUnion(perims)
+    if not isinstance(joined_curves, list):
+        joined_curves = [joined_curves]
+    return joined_curves
+
+
+def extrude_brep_world_z_ghc(_ghc, _brep, _distance):
+    # type: (Any, rg.Brep, float) -> rg.Brep
+    """ghpythonlib.components version of extrude_brep_world_z()."""
+    volume_geom = _ghc.Extrude(_brep, _ghc.UnitZ(_distance))
+    try:
+        volume_geom = volume_geom.ToBrep()
+    except AttributeError:
+        pass
+    return volume_geom
@@ -65,5 +65,12 @@ from honeybee_ph_rhino.gh_compo_io.write_PHPP import GHCompo_WriteToPHPP
 from honeybee_ph_rhino.gh_compo_io.write_ppp import GHCompo_WritePPPFile
 
 # -- Export
+from honeybee_ph_rhino.gh_compo_io.write_exports import GHCompo_WriteExports
+from honeybee_ph_rhino.gh_compo_io.write_hbjson import GHCompo_WriteHBJSON
 from honeybee_ph_rhino.gh_compo_io.write_wufi_xml_settings import GHCompo_WriteWufiXmlSettings
 from honeybee_ph_rhino.gh_compo_io.write_wuif_xml import GHCompo_WriteWufiXml
+
+# -- Solve-time Profiling (does nothing unless switched on, see gh_profiler)
+from honeybee_ph_rhino import gh_profiler
+
+gh_profiler.instrument_gh_compo_classes(globals())
@@ -34,10 +34,9 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
 
 try:
-    from ph_units.converter import convert
-    from ph_units.parser import parse_input
+    from honeybee_ph_rhino.unit_conversion import convert, parse_input
 except ImportError as e:
-    raise ImportError("\nFailed to import ph_units:\n\t{}".format(e))
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 try:
     from honeybee_ph_rhino.gh_compo_io.assmbly_create_heterogeneous_material import generate_preview
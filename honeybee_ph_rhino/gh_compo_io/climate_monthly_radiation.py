@@ -19,10 +19,9 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 try:
-    from ph_units.converter import convert
-    from ph_units.parser import parse_input
+    from honeybee_ph_rhino.unit_conversion import convert_many
 except ImportError as e:
-    raise ImportError("\nFailed to import ph_units:\n\t{}".format(e))
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 
 class GHCompo_CreateMonthlyRadiation(object):
@@ -54,12 +53,7 @@ class GHCompo_CreateMonthlyRadiation(object):
     def _build_data(self, _input_list):
         # type: (List[float]) -> List[float]
         """Clean and convert the input data (if needed)."""
-        _ = []
-        for t in self._validate(_input_list):
-            input_value, input_units = parse_input(str(t))
-            result = convert(input_value, input_units or "KWH/M2", "KWH/M2")
-            _.append(result)
-        return _
+        return convert_many([str(t) for t in self._validate(_input_list)], "KWH/M2", _default_unit="KWH/M2")
 
     @property
     def north(self):
@@ -14,10 +14,9 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph:\n\t{}".format(e))
 
 try:
-    from ph_units.converter import convert
-    from ph_units.parser import parse_input
+    from honeybee_ph_rhino.unit_conversion import convert_many
 except ImportError as e:
-    raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 try:
     from honeybee_ph_rhino import gh_io
@@ -51,12 +50,7 @@ class GHCompo_MonthlyTemps(object):
     def _build_data(self, _input_list):
         # type: (List[float]) -> List[float]
         """Clean and convert the input data (if needed)."""
-        _ = []
-        for t in self._validate(_input_list):
-            input_value, input_units = parse_input(str(t))
-            result = convert(input_value, input_units or "C", "C")
-            _.append(result)
-        return _
+        return convert_many([str(t) for t in self._validate(_input_list)], "C", _default_unit="C")
 
     @property
     def air_temps(self):
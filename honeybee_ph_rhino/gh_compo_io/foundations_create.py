@@ -23,6 +23,7 @@ except ImportError as e:
 
 try:
     from honeybee_ph_rhino import gh_io
+    from honeybee_ph_rhino.attr_input_map import batch_input_names, expand_batch_inputs, get_attr_input_map, run_batch
     from honeybee_ph_rhino.gh_io import ComponentInput
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
@@ -32,11 +33,6 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
 
-try:
-    from ph_units import converter, parser
-except ImportError as e:
-    raise ImportError("\nFailed to import ph-units:\n\t{}".format(e))
-
 
 # -----------------------------------------------------------------------------
 # -- Setup the component input node groups
@@ -280,38 +276,6 @@ def get_component_inputs(_foundation_type):
         raise Exception('Error: Foundation type: "{}" is not a valid type.'.format(input_type_id))
 
 
-def get_component_input_by_name(_input_group, _name):
-    # type: (Dict[int, ComponentInput], str) -> Optional[ComponentInput]
-    """Get the component input from the input group by name."""
-    for value in _input_group.values():
-        if value.name == _name:
-            return value
-
-
-def convert_input(_input, _target_unit):
-    # type: (str, str) -> Optional[Union[float, int]]
-    """Convert a single input to the target unit."""
-    user_input_value, user_input_unit = parser.parse_input(_input)
-    converted_input = converter.convert(user_input_value, user_input_unit, _target_unit)
-    print(
-        "Converting: {:.3f}-{} --> {:.3f}-{}".format(
-            float(user_input_value), user_input_unit, converted_input, _target_unit
-        )
-    )
-    return converted_input
-
-
-def convert_list_of_inputs(_input_list, _target_unit):
-    # type: (Iterable[Any], str) -> List[Optional[Union[float, int]]]
-    """Convert a list of inputs to the target unit."""
-    user_input = []
-    for val in _input_list:
-        val, input_unit = parser.parse_input(val)
-        val = converter.convert(val, input_unit, _target_unit)
-        user_input.append(val)
-    return user_input
-
-
 # -----------------------------------------------------------------------------
 # Component Interface
 
@@ -383,29 +347,14 @@ class GHCompo_CreateFoundations(object):
         hbph_foundation_obj_ = self.create_new_foundation()
         hbph_foundation_obj_.display_name = self.input_dict["_display_name"]
 
-        # -- Set all the new PhFoundation Object's attributes from user-inputs
-        for attr_name in dir(hbph_foundation_obj_):
-            if attr_name.startswith("_"):
-                continue
-
-            # -- Pull out the user-input-value for this attribute
-            user_input = self.input_dict.get(attr_name, None)
-
-            # -- Find the GH-Component's Input Node for the attribute so we can check the unit-conversion (if any)
-            target_unit = None
-            gh_compo_input = get_component_input_by_name(self.gh_component_input_group, attr_name)
-            if gh_compo_input:
-                target_unit = gh_compo_input.target_unit
-
-            # -- Convert the attribute's user-input-value, if necessary
-            if user_input and target_unit:
-                if isinstance(user_input, (list, tuple, set)):
-                    user_input = convert_list_of_inputs(user_input, target_unit)
-                else:
-                    user_input = convert_input(user_input, target_unit)
-
-            # -- Set the attribute value
-            if user_input:
-                setattr(hbph_foundation_obj_, attr_name, user_input)
+        # -- Set all the new PhFoundation Object's attributes from user-inputs, converting any with a target-unit
+        attr_map = get_attr_input_map(hbph_foundation_obj_, self.gh_component_input_group)
+        attr_map.apply(hbph_foundation_obj_, self.input_dict)
 
         return hbph_foundation_obj_
+
+    def run_batch(self):
+        # type: () -> List[foundations.PhFoundation]
+        """Build a new PhFoundation for each item of the list inputs (see attr_input_map.expand_batch_inputs)."""
+        batch_names = batch_input_names(self.gh_component_input_group)
+        return run_batch(self, expand_batch_inputs(self.input_dict, batch_names))
@@ -22,7 +22,7 @@ class MyClassWithValidation(object):
 """
 
 try:
-    from typing import Any
+    from typing import Any, Dict, Iterable, List, Optional, Tuple
 except ImportError:
     pass  # IronPython 2.7
 
@@ -32,9 +32,19 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
 
 try:
-    from ph_units import converter, parser
+    from honeybee_ph_rhino import unit_conversion
 except ImportError as e:
-    raise ImportError("\nFailed to import ph-units:\n\t{}".format(e))
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
+# -- UnitValidated results, by (validator-class, raw-input). Cleared whenever it grows past the max size.
+MAX_UNIT_MEMO_SIZE = 10000
+_UNIT_MEMO = {}  # type: Dict[Tuple[type, Any], Optional[float]]
+
+
+def clear_memo():
+    # type: () -> None
+    """Clear the memoized UnitValidated results."""
+    _UNIT_MEMO.clear()
 
 
 class Validated(object):
@@ -92,6 +102,11 @@ class Validated(object):
         """
         raise NotImplementedError("Error: Must implement the .validated() method on subclass of Validated.")
 
+    def validate_many(self, values):
+        # type: (Iterable[Any]) -> List[Any]
+        """Return the validated version of each value, as if each were set on a new object."""
+        return [self.validate(self.storage_name, value, None) for value in values]
+
     def __str__(self):
         return "Validated[{}](storage_name={})".format(self.__class__.__name__, self.storage_name)
 
@@ -310,37 +325,18 @@ class FloatMax24(Validated):
 # --- Unit converters ---------------------------------------------------------
 
 
-class UnitM(Validated):
-    """A Meter value (float) of any value (positive or negative)."""
-
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
-
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert to Meters
-        result = converter.convert(input_value, input_units or "M", "M")
-
-        print("Converting: {} -> {:.4f} M".format(new_value, result))
-
-        return result
+class UnitValidated(Validated):
+    """Base class for the unit-type validators. The value is converted to (and stored in) the 'unit'.
 
+    Subclasses set the 'unit' (ie: "MM"), and optionally 'unit_label' (for the 'Converting...'
+    message) and 'positive_only'. String inputs (ie: "12.7 MM") are parsed and converted once and
+    the result is memoized, so the same default used by hundreds of objects is only parsed the
+    first time. Plain int / float inputs are already in the right unit and skip the parsing.
+    """
 
-class UnitM2(Validated):
-    """A Meter-squared area (float) of any value."""
+    unit = ""
+    unit_label = ""
+    positive_only = False
 
     def validate(self, name, new_value, old_value):
         if new_value is None:
@@ -350,65 +346,30 @@ class UnitM2(Validated):
             except:
                 return old_value
 
-        input_value, input_units = parser.parse_input(str(new_value))
-
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert to Meters
-        result = converter.convert(input_value, input_units or "M2", "M2")
-
-        print("Converting: {} -> {:.4f} M2".format(new_value, result))
-
-        return result
-
-
-class UnitMM(Validated):
-    """A Millimeter value (float) of any value (positive or negative)."""
-
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
+        if type(new_value) in (float, int):
+            result = float(new_value)
+        else:
+            key = (self.__class__, new_value)
             try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
-
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
+                result = _UNIT_MEMO[key]
+            except KeyError:
+                result = self.convert(new_value)
+                if len(_UNIT_MEMO) >= MAX_UNIT_MEMO_SIZE:
+                    _UNIT_MEMO.clear()
+                _UNIT_MEMO[key] = result
+            except TypeError:
+                result = self.convert(new_value)  # unhashable input
 
-        # -- Convert to MilliMeters
-        result = converter.convert(input_value, input_units or "MM", "MM")
-
-        print("Converting: {} -> {:.4f} MM".format(new_value, result))
+        # -- Make sure its positive
+        if self.positive_only and result and result < 0.0:
+            raise ValueError("Error: input for '{}' cannot be negative.".format(name))
 
         return result
 
-
-class UnitW_MK(Validated):
-    """A W/MK conductivity value (float) of any value."""
-
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
+    def convert(self, new_value):
+        # type: (Any) -> Optional[float]
+        """Parse the input and return it converted to the validator's unit."""
+        input_value, input_units = unit_conversion.parse_input(str(new_value))
 
         # -- Make sure the value is a float
         try:
@@ -418,451 +379,127 @@ class UnitW_MK(Validated):
                 "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
             )
 
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "W/MK", "W/MK")
+        result = unit_conversion.convert(input_value, input_units or self.unit, self.unit)
 
-        print("Converting: {} -> {:.4f} W/MK".format(new_value, result))
+        print("Converting: {} -> {:.4f} {}".format(new_value, result, self.unit_label or self.unit))
 
         return result
 
 
-class UnitW_M2K(Validated):
-    """A W/M2K U-Value value (float) of any positive value."""
+class UnitM(UnitValidated):
+    """A Meter value (float) of any value (positive or negative)."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
+    unit = "M"
 
-        input_value, input_units = parser.parse_input(str(new_value))
 
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
+class UnitM2(UnitValidated):
+    """A Meter-squared area (float) of any value."""
 
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "W/M2K", "W/M2K")
+    unit = "M2"
 
-        print("Converting: {} -> {:.4f} W/M2K".format(new_value, result))
 
-        # -- Make sure its positive
-        if result and result < 0.0:
-            raise ValueError("Error: input for '{}' cannot be negative.".format(name))
+class UnitMM(UnitValidated):
+    """A Millimeter value (float) of any value (positive or negative)."""
 
-        return result
+    unit = "MM"
 
 
-class UnitW_K(Validated):
-    """A W/K heat loss value (float) of any positive value."""
+class UnitW_MK(UnitValidated):
+    """A W/MK conductivity value (float) of any value."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
+    unit = "W/MK"
 
-        input_value, input_units = parser.parse_input(str(new_value))
 
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
+class UnitW_M2K(UnitValidated):
+    """A W/M2K U-Value value (float) of any positive value."""
 
-        # -- Convert to Meters
-        result = converter.convert(input_value, input_units or "W/K", "W/K")
+    unit = "W/M2K"
+    positive_only = True
 
-        print("Converting: {} -> {:.4f} W/K".format(new_value, result))
 
-        # -- Make sure its positive
-        if result and result < 0.0:
-            raise ValueError("Error: input for '{}' cannot be negative.".format(name))
+class UnitW_K(UnitValidated):
+    """A W/K heat loss value (float) of any positive value."""
 
-        return result
+    unit = "W/K"
+    positive_only = True
 
 
-class UnitDeltaC(Validated):
+class UnitDeltaC(UnitValidated):
     """A Delta Degree Celsius value (float) of any value (positive or negative)."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
+    unit = "DELTA-C"
+    unit_label = "Delta-C"
 
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
 
-        # -- Convert to Meters
-        result = converter.convert(input_value, input_units or "DELTA-C", "DELTA-C")
-
-        print("Converting: {} -> {:.4f} Delta-C".format(new_value, result))
-
-        return result
-
-
-class UnitDegreeC(Validated):
+class UnitDegreeC(UnitValidated):
     """A Degree Celsius value (float) of any value (positive or negative)."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
-
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert to Meters
-        result = converter.convert(input_value, input_units or "C", "C")
-
-        print("Converting: {} -> {:.4f} C".format(new_value, result))
-
-        return result
+    unit = "C"
 
 
-class UnitMeterPerSecond(Validated):
+class UnitMeterPerSecond(UnitValidated):
     """A Meter-per-Second value (float) of any value (positive or negative)."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
+    unit = "M/S"
+    unit_label = "meter/second"
 
-        input_value, input_units = parser.parse_input(str(new_value))
 
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert to Meters
-        result = converter.convert(input_value, input_units or "M/S", "M/S")
-
-        print("Converting: {} -> {:.4f} meter/second".format(new_value, result))
-
-        return result
-
-
-class UnitWH_M3(Validated):
+class UnitWH_M3(UnitValidated):
     """A Wh/M3 (W/m3-hr) Fan Elec. Efficiency (float) of any positive value."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
+    unit = "WH/M3"
+    positive_only = True
 
-        input_value, input_units = parser.parse_input(str(new_value))
 
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "WH/M3", "WH/M3")
-
-        print("Converting: {} -> {:.4f} WH/M3".format(new_value, result))
-
-        # -- Make sure its positive
-        if result and result < 0.0:
-            raise ValueError("Error: input for '{}' cannot be negative.".format(name))
-
-        return result
-
-
-class UnitKWH(Validated):
+class UnitKWH(UnitValidated):
     """A kWH Energy value of any positive value."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
+    unit = "KWH"
+    positive_only = True
 
-        input_value, input_units = parser.parse_input(str(new_value))
 
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "KWH", "KWH")
-
-        print("Converting: {} -> {:.4f} KWH".format(new_value, result))
-
-        # -- Make sure its positive
-        if result and result < 0.0:
-            raise ValueError("Error: input for '{}' cannot be negative.".format(name))
-
-        return result
-
-
-class UnitKWH_M2(Validated):
+class UnitKWH_M2(UnitValidated):
     """A kWH/M2 Energy Demand of any positive value."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
-
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "KWH/M2", "KWH/M2")
-
-        print("Converting: {} -> {:.4f} KWH/M2".format(new_value, result))
-
-        # -- Make sure its positive
-        if result and result < 0.0:
-            raise ValueError("Error: input for '{}' cannot be negative.".format(name))
-
-        return result
+    unit = "KWH/M2"
+    positive_only = True
 
 
-class UnitW_M2(Validated):
+class UnitW_M2(UnitValidated):
     """A W/M2 Load of any positive value."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
+    unit = "W/M2"
+    positive_only = True
 
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
 
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "W/M2", "W/M2")
-
-        print("Converting: {} -> {:.4f} W/M2".format(new_value, result))
-
-        # -- Make sure its positive
-        if result and result < 0.0:
-            raise ValueError("Error: input for '{}' cannot be negative.".format(name))
-
-        return result
-
-
-class UnitM3_S(Validated):
+class UnitM3_S(UnitValidated):
     """A M3/Second Airflow of any positive value."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
-
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "M3/S", "M3/S")
-
-        print("Converting: {} -> {:.4f} M3/S".format(new_value, result))
-
-        # -- Make sure its positive
-        if result and result < 0.0:
-            raise ValueError("Error: input for '{}' cannot be negative.".format(name))
-
-        return result
+    unit = "M3/S"
+    positive_only = True
 
 
-class UnitKW(Validated):
+class UnitKW(UnitValidated):
     """A KW power of any positive value."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
-
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
+    unit = "KW"
+    positive_only = True
 
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "KW", "KW")
 
-        print("Converting: {} -> {:.4f} KW".format(new_value, result))
-
-        # -- Make sure its positive
-        if result and result < 0.0:
-            raise ValueError("Error: input for '{}' cannot be negative.".format(name))
-
-        return result
-
-
-class UnitW(Validated):
+class UnitW(UnitValidated):
     """A W power of any positive value."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
-
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "W", "W")
-
-        print("Converting: {} -> {:.4f} W".format(new_value, result))
-
-        # -- Make sure its positive
-        if result and result < 0.0:
-            raise ValueError("Error: input for '{}' cannot be negative.".format(name))
-
-        return result
+    unit = "W"
+    positive_only = True
 
 
-class UnitKG_M2(Validated):
+class UnitKG_M2(UnitValidated):
     """A KG/M2 concentration value."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
-
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "KG/M2", "KG/M2")
+    unit = "KG/M2"
 
-        print("Converting: {} -> {:.4f} KG/M2".format(new_value, result))
 
-        return result
-
-
-class UnitCost_M2(Validated):
+class UnitCost_M2(UnitValidated):
     """A Cost/M2 concentration value."""
 
-    def validate(self, name, new_value, old_value):
-        if new_value is None:
-            # If the user passed a 'default' attribute, try and use that
-            try:
-                return float(self.default)
-            except:
-                return old_value
-
-        input_value, input_units = parser.parse_input(str(new_value))
-
-        # -- Make sure the value is a float
-        try:
-            input_value = float(input_value)
-        except:
-            raise ValueError(
-                "Error: input {} of type: {} is not allowed." "Supply float only.".format(new_value, type(new_value))
-            )
-
-        # -- Convert units
-        result = converter.convert(input_value, input_units or "COST/M2", "COST/M2")
-
-        print("Converting: {} -> {:.4f} COST/M2".format(new_value, result))
-
-        return result
+    unit = "COST/M2"
@@ -18,6 +18,7 @@ except ImportError:
 
 try:
     from honeybee_ph_rhino import gh_io
+    from honeybee_ph_rhino.attr_input_map import batch_input_names, expand_batch_inputs, get_attr_input_map, run_batch
     from honeybee_ph_rhino.gh_io import ComponentInput
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
@@ -32,11 +33,6 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
 
-try:
-    from ph_units import converter, parser
-except ImportError as e:
-    raise ImportError("\nFailed to import ph-units:\n\t{}".format(e))
-
 
 # -----------------------------------------------------------------------------
 # Setup the component input node groups
@@ -163,14 +159,6 @@ def get_component_inputs(_system_type):
         raise Exception('Error: Heating type ID: "{}" is not a valid equip type.'.format(input_type_id))
 
 
-def get_component_input_by_name(_input_group, _name):
-    # type: (Dict[int, ComponentInput], str) -> Optional[ComponentInput]
-    """Get the component input from the input group by name."""
-    for k, v in _input_group.items():
-        if v.name == _name:
-            return v
-
-
 class GHCompo_CreateSpaceConditioningSystem(object):
     system_classes = {
         1: heating.PhHeatingDirectElectric,
@@ -214,23 +202,6 @@ class GHCompo_CreateSpaceConditioningSystem(object):
         else:
             return {}
 
-    def convert_input(self, _input, _target_unit):
-        # type: (str, str) -> Optional[Union[float, int]]
-        """Convert a single input to the target unit."""
-        user_input, input_unit = parser.parse_input(_input)
-        user_input = converter.convert(user_input, input_unit, _target_unit)
-        return user_input
-
-    def convert_list_of_inputs(self, _input_list, _target_unit):
-        # type: (Iterable[Any], str) -> List[Optional[Union[float, int]]]
-        """Convert a list of inputs to the target unit."""
-        user_input = []
-        for val in _input_list:
-            val, input_unit = parser.parse_input(val)
-            val = converter.convert(val, input_unit, _target_unit)
-            user_input.append(val)
-        return user_input
-
     @property
     def heating_system_percent_coverage(self):
         # type: () -> float
@@ -273,30 +244,10 @@ class GHCompo_CreateSpaceConditioningSystem(object):
 
         # -- Build the new Heating system
         new_heating_system = heating_system_class()
-        for attr_name in dir(new_heating_system):
-            if attr_name.startswith("_"):
-                continue
-
-            # -- Pull out the user-input-value for this attribute
-            user_input = self.input_dict.get(attr_name, None)
-
-            # -- Find the GH-Component's Input Node for the attribute so we can check the unit-conversion (if any)
-            gh_compo_input = get_component_input_by_name(self.gh_component_input_group, attr_name)
-            if gh_compo_input:
-                target_unit = gh_compo_input.target_unit
-            else:
-                target_unit = None
-
-            # -- Convert the attribute's user-input-value, if necessary
-            if user_input and target_unit:
-                if isinstance(user_input, (list, tuple, set)):
-                    user_input = self.convert_list_of_inputs(user_input, target_unit)
-                else:
-                    user_input = self.convert_input(user_input, target_unit)
-
-            # -- Set the attribute value
-            if user_input:
-                setattr(new_heating_system, attr_name, user_input)
+
+        # -- Set the attributes from the user-inputs, converting any with a GH-Component Input Node target-unit
+        attr_map = get_attr_input_map(new_heating_system, self.gh_component_input_group)
+        attr_map.apply(new_heating_system, self.input_dict)
 
         # -- Set "_xx" attributes
         # -- This is needed because I chose to use a "_xx" prefix in the name for some reason
@@ -330,6 +281,12 @@ class GHCompo_CreateSpaceConditioningSystem(object):
 
         return new_heating_system
 
+    def run_batch(self):
+        # type: () -> List[Optional[Union[heating.PhHeatingSystem, heat_pumps.PhHeatPumpSystem]]]
+        """Build a new system for each item of the list inputs (see attr_input_map.expand_batch_inputs)."""
+        batch_names = batch_input_names(self.gh_component_input_group)
+        return run_batch(self, expand_batch_inputs(self.input_dict, batch_names))
+
     def warn_cooling_without_dehumidification(self, _system):
         # type: (heat_pumps.PhHeatPumpSystem) -> None
         if _system.cooling_params.recirculation.used:
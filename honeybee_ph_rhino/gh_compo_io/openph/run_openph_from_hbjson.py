@@ -5,6 +5,11 @@
 
 import os
 
+try:
+    from typing import Any
+except ImportError:
+    pass  # IronPython 2.7
+
 try:
     from honeybee.config import folders as hb_folders
 except ImportError as e:
@@ -16,21 +21,26 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import from ph_gh_component_io:\n\t{}".format(e))
 
+try:
+    from honeybee_ph_rhino import py3_worker
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
 
 class GHCompo_RunOpenPhFromHBJSON(object):
     """GHCompo Interface: HBPH - Run OpenPH with HBJSON File."""
 
     def __init__(self, _IGH, _output_folder, _hbjson_file, _calc, *args, **kwargs):
-        # type: (IGH, str | None, str | None, bool, list, dict) -> None
+        # type: (IGH, str | None, Any, bool, list, dict) -> None
         self.IGH = _IGH
         self._output_folder = _output_folder
-        self.hbjson_file = _hbjson_file
+        self.hbjson_file = _hbjson_file  # -- The HBJSON file path, or the HB-Model
         self.calc = _calc
 
     @property
     def ready(self):
         # type: () -> bool
-        return self.hbjson_file is not None and self.calc is True
+        return self.hbjson_file is not None and self.output_folder is not None and self.calc is True
 
     @property
     def py3_script_file(self):
@@ -49,25 +59,34 @@ class GHCompo_RunOpenPhFromHBJSON(object):
         if self._output_folder:
             return self._output_folder
         else:
-            if self.hbjson_file:
+            if isinstance(self.hbjson_file, str):
                 return os.path.dirname(self.hbjson_file)
             else:
                 return None
 
     def run(self):
         # type: () -> str | None
+        if self.calc and self.hbjson_file is not None and self.output_folder is None:
+            self.IGH.warning("Please supply an '_output_folder' to run OpenPH with an HB-Model.")
         if not self.ready:
             return None
 
         print("running OpenPH with HBJSON file: {}".format(self.hbjson_file))
         print("self.py3_script_file={}".format(self.py3_script_file))
 
-        # -- Run as a Subprocess
+        # -- Run on the session's Py3 worker, or as a Subprocess if the worker is not available
+        payload = py3_worker.hbjson_payload(self.hbjson_file)
+        payload["output_folder"] = self.output_folder
+        response = py3_worker.run_job(self.IGH, "openph", payload)
+        if response is not None:
+            process_stderr(self.IGH, response["stderr"])
+            return process_stdout(self.IGH, response["stdout"])
+
         commands = [
             hb_folders.python_exe_path,  # ----- The python3-interpreter to use (LBT py3.10)
             self.py3_script_file,  # ----------- The python3-script to run
             self.output_folder,  # ------------- The save folder to use
-            self.hbjson_file,  # --------------- The HBJSON file to use
+            py3_worker.hbjson_file(self.hbjson_file),  # The HBJSON file to use
         ]
         stdout, stderr = run_subprocess(commands)
         process_stderr(self.IGH, stderr)
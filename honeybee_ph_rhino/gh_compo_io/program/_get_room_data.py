@@ -3,7 +3,12 @@
 
 """Utility functions for getting room data from the Honeybee-Rooms."""
 
-from statistics import mean
+from collections import defaultdict
+
+try:
+    from typing import Any, Dict, List, Optional, Set
+except ImportError:
+    pass  # IronPython 2.7
 
 try:
     from honeybee.room import Room
@@ -26,74 +31,349 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 try:
-    from ph_units.converter import convert
-    from ph_units.parser import parse_input
+    from honeybee_ph_rhino.schedule_stats import annual_mean
+    from honeybee_ph_rhino.unit_context import get_unit_context
 except ImportError as e:
-    raise ImportError("\nFailed to import ph_units:\n\t{}".format(e))
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 
-def get_area_value_in_unit(_IGH, _input, _target_unit):
-    # type: (gh_io.IGH, str | float, str) -> int | float
-    """Get an area value in either the specified unit-type, or the Rhino-doc unit-type."""
+def get_room_floor_area_ft2(_hb_room, _IGH):
+    # type: (Room, gh_io.IGH) -> float
+    """Get the floor area of the room in ft2."""
 
-    # -- If the user supplied an input unit, just use that
-    input_value, input_unit = parse_input(_input)
+    units = get_unit_context(_IGH)
+    return units.convert(_hb_room.floor_area, units.area_unit, "FT2") or 0.0
 
-    # -- Otherwise use the Rhino document unit system as the input unit-type
-    if not input_unit:
-        input_unit = _IGH.get_rhino_areas_unit_name()
 
-    # -- convert the input value to Meters, always
-    new_value = convert(input_value, input_unit, _target_unit)
+# -----------------------------------------------------------------------------
+# -- Single-pass room statistics
 
-    if not new_value:
-        raise ValueError("Failed to parse {}?".format(_input))
-    else:
-        print("Converting: {} {} -> {:.4f} {}".format(input_value, input_unit, new_value, _target_unit))
-        return new_value
 
+class RoomStats(object):
+    """The statistics of a single HB-Room that the program components use, all read in one pass."""
 
-def get_num_dwellings(_hb_rooms):
-    # type: (list[Room]) -> int
-    """Return the total number of dwellings in the list of HB-Rooms."""
-    ph_dwelling_objs = {r.properties.energy.people.properties.ph.dwellings for r in _hb_rooms}  # type: ignore
-    return sum(d.num_dwellings for d in ph_dwelling_objs)
+    __slots__ = (
+        "room",
+        "story",
+        "is_dwelling",
+        "has_people",
+        "has_spaces",
+        "dwellings",
+        "floor_area",
+        "floor_area_m2",
+        "floor_area_ft2",
+        "num_occupants",
+        "num_bedrooms",
+    )
 
+    def __init__(self, _hb_room, _area_to_m2, _area_to_ft2):
+        # type: (Room, float, float) -> None
+        self.room = _hb_room
+        self.story = _hb_room.story
+        self.floor_area = _hb_room.floor_area
+        self.floor_area_m2 = self.floor_area * _area_to_m2
+        self.floor_area_ft2 = self.floor_area * _area_to_ft2
 
-def get_room_floor_area_ft2(_hb_room, _IGH):
-    # type: (Room, gh_io.IGH) -> float
-    """Get the floor area of the room in ft2."""
+        hbe_prop = getattr(_hb_room.properties, "energy")  # type: RoomEnergyProperties
+        hbph_prop = getattr(_hb_room.properties, "ph", None)
+        self.has_spaces = bool(hbph_prop and len(hbph_prop.spaces) > 0)
 
-    return convert(_hb_room.floor_area, _IGH.get_rhino_areas_unit_name(), "FT2") or 0.0
+        people = hbe_prop.people
+        hbph_ppl_prop = None  # type: Optional[PeoplePhProperties]
+        if people:
+            hbph_ppl_prop = getattr(people.properties, "ph", None)
+        self.has_people = people is not None
+        self.is_dwelling = bool(hbph_ppl_prop and hbph_ppl_prop.is_residential)
+        self.dwellings = hbph_ppl_prop.dwellings if hbph_ppl_prop else None
+        self.num_bedrooms = hbph_ppl_prop.number_bedrooms if hbph_ppl_prop else 0
 
+        if not people:
+            self.num_occupants = 0
+        elif not hbph_ppl_prop:
+            # -- If No PH-Style data, use the HB-Energy Program's info
+            self.num_occupants = people.people_per_area * self.floor_area_m2 * annual_mean(people.occupancy_schedule)
+        else:
+            self.num_occupants = float(hbph_ppl_prop.number_people)
 
-def get_num_occupants(hb_room, _IGH):
-    # type: (Room, gh_io.IGH) -> float
-    hbe_prop = getattr(hb_room.properties, "energy")  # type: RoomEnergyProperties
-    if not hbe_prop.people:
-        return 0
-
-    # -- Calculate the number of occupants
-    hbph_ppl_prop = getattr(hbe_prop.people.properties, "ph", None)  # type: PeoplePhProperties | None
-    area_m2 = get_area_value_in_unit(_IGH, hb_room.floor_area, "M2")
-    if not hbph_ppl_prop:
-        # -- If No PH-Style data, use the HB-Energy Program's info
-        peak_ppl_per_m2 = hbe_prop.people.people_per_area
-        avg_occ_rate = mean(hbe_prop.people.occupancy_schedule.values())  # type: ignore
-        avg_ppl = peak_ppl_per_m2 * area_m2 * avg_occ_rate
-    else:
-        # -- Get the PH-Style info
-        peak_ppl_per_m2 = hbph_ppl_prop.number_people / area_m2
-        avg_ppl = float(hbph_ppl_prop.number_people)
-
-    return avg_ppl
-
-
-def get_num_bedrooms(hb_room):
-    # type: (Room) -> int
-    hbe_prop = getattr(hb_room.properties, "energy")  # type: RoomEnergyProperties
-    if not hbe_prop.people:
-        return 0
-
-    hbph_ppl_prop = getattr(hbe_prop.people.properties, "ph")  # type: PeoplePhProperties
-    return hbph_ppl_prop.number_bedrooms
+
+class RoomStatsCollection(object):
+    """The RoomStats for a set of HB-Rooms, with their totals.
+
+    Arguments:
+    ----------
+        * _hb_rooms (list[Room]): The Honeybee-Rooms to collect the statistics of.
+        * _IGH (gh_io.IGH): The Grasshopper Interface, used to get the Rhino document area-unit.
+    """
+
+    def __init__(self, _hb_rooms, _IGH):
+        # type: (List[Room], gh_io.IGH) -> None
+        units = get_unit_context(_IGH)
+        area_to_m2 = units.area_to_m2
+        area_to_ft2 = units.area_to_ft2
+        if area_to_m2 is None or area_to_ft2 is None:
+            raise ValueError("Failed to convert the Rhino document area unit: '{}'?".format(units.area_unit))
+        self.area_to_m2 = area_to_m2
+        self.area_to_ft2 = area_to_ft2
+        self.stats = [RoomStats(rm, area_to_m2, area_to_ft2) for rm in _hb_rooms]  # type: List[RoomStats]
+        self._occupancy_index = None  # type: Optional[OccupancyIndex]
+
+    def __iter__(self):
+        return iter(self.stats)
+
+    def __len__(self):
+        return len(self.stats)
+
+    def filter(self, _is_dwelling):
+        # type: (bool) -> RoomStatsCollection
+        """Return a new collection of only the dwelling (True) or non-dwelling (False) rooms."""
+        new_collection = RoomStatsCollection.__new__(RoomStatsCollection)
+        new_collection.area_to_m2 = self.area_to_m2
+        new_collection.area_to_ft2 = self.area_to_ft2
+        new_collection.stats = [_ for _ in self.stats if _.is_dwelling == _is_dwelling]
+        new_collection._occupancy_index = None
+        return new_collection
+
+    @property
+    def occupancy_index(self):
+        # type: () -> OccupancyIndex
+        """The OccupancyIndex of the rooms, built the first time it is used."""
+        if self._occupancy_index is None:
+            self._occupancy_index = OccupancyIndex(self)
+        return self._occupancy_index
+
+    @property
+    def rooms(self):
+        # type: () -> List[Room]
+        return [_.room for _ in self.stats]
+
+    @property
+    def stories(self):
+        # type: () -> Set[Any]
+        return {_.story for _ in self.stats}
+
+    def rooms_by_story(self):
+        # type: () -> List[List[Room]]
+        """Returns lists of the rooms, grouped by their Honeybee 'story' and sorted by story."""
+        d = defaultdict(list)  # type: Dict[Any, List[Room]]
+        for _ in self.stats:
+            d[_.story].append(_.room)
+        return [d[story_key] for story_key in sorted(d.keys())]
+
+    def first_room_without_spaces(self):
+        # type: () -> Optional[Room]
+        for _ in self.stats:
+            if not _.has_spaces:
+                return _.room
+        return None
+
+    def first_room_without_people(self):
+        # type: () -> Optional[Room]
+        for _ in self.stats:
+            if not _.has_people:
+                return _.room
+        return None
+
+    @property
+    def total_floor_area_m2(self):
+        # type: () -> float
+        return sum(_.floor_area_m2 for _ in self.stats)
+
+    @property
+    def total_floor_area_ft2(self):
+        # type: () -> float
+        return sum(_.floor_area_ft2 for _ in self.stats)
+
+    @property
+    def total_num_occupants(self):
+        # type: () -> float
+        return self.occupancy_index.total_num_occupants
+
+    @property
+    def total_num_bedrooms(self):
+        # type: () -> int
+        return self.occupancy_index.total_num_bedrooms
+
+    @property
+    def total_num_dwellings(self):
+        # type: () -> int
+        """Return the total number of dwellings. Rooms which share a PH-Dwellings object are counted once."""
+        return self.occupancy_index.total_num_dwellings
+
+
+# -----------------------------------------------------------------------------
+# -- Occupancy index
+
+
+class OccupancyTotals(object):
+    """The total floor-area, bedrooms and occupants of a group of rooms (ie: a dwelling)."""
+
+    __slots__ = ("num_rooms", "floor_area_m2", "num_bedrooms", "num_occupants")
+
+    def __init__(self):
+        self.num_rooms = 0
+        self.floor_area_m2 = 0.0
+        self.num_bedrooms = 0
+        self.num_occupants = 0.0
+
+    def add(self, _room_stats, _sign=1):
+        # type: (RoomStats, int) -> None
+        """Add (or with _sign=-1, remove) the room's values."""
+        self.num_rooms += _sign
+        self.floor_area_m2 += _sign * _room_stats.floor_area_m2
+        self.num_bedrooms += _sign * _room_stats.num_bedrooms
+        self.num_occupants += _sign * _room_stats.num_occupants
+
+    def change(self, _num_bedrooms=0, _num_occupants=0.0):
+        # type: (int, float) -> None
+        """Change the bedroom and occupant totals by the amounts given."""
+        self.num_bedrooms += _num_bedrooms
+        self.num_occupants += _num_occupants
+
+    def __repr__(self):
+        return "{}(num_rooms={}, floor_area_m2={:.2f}, num_bedrooms={}, num_occupants={})".format(
+            self.__class__.__name__, self.num_rooms, self.floor_area_m2, self.num_bedrooms, self.num_occupants
+        )
+
+
+class OccupancyIndex(object):
+    """The rooms of each PH-Dwellings object, with each dwelling's bedroom and occupant totals.
+
+    The index is built from a RoomStatsCollection in one pass. When a room's number of bedrooms
+    or people is changed, call 'update_occupancy' to change just that value and the totals.
+    When anything else about the room is changed (ie: its People load was replaced), call
+    'update_room' to re-read the whole room. Rooms without a PH-Dwellings object are each
+    indexed as their own group.
+
+    Arguments:
+    ----------
+        * _room_stats (RoomStatsCollection): The statistics of the HB-Rooms to index.
+    """
+
+    def __init__(self, _room_stats):
+        # type: (RoomStatsCollection) -> None
+        self.area_to_m2 = _room_stats.area_to_m2
+        self.area_to_ft2 = _room_stats.area_to_ft2
+        self._stats = {}  # type: Dict[int, RoomStats]
+        self._groups = {}  # type: Dict[Any, List[RoomStats]]
+        self._totals = {}  # type: Dict[Any, OccupancyTotals]
+        self._all = OccupancyTotals()
+        for room_stats in _room_stats:
+            self._add(room_stats)
+
+    @staticmethod
+    def _group_key(_room_stats):
+        # type: (RoomStats) -> Any
+        if _room_stats.dwellings is not None:
+            return _room_stats.dwellings
+        return ("room", id(_room_stats.room))
+
+    def _add(self, _room_stats):
+        # type: (RoomStats) -> None
+        key = self._group_key(_room_stats)
+        self._stats[id(_room_stats.room)] = _room_stats
+        self._groups.setdefault(key, []).append(_room_stats)
+        self._totals.setdefault(key, OccupancyTotals()).add(_room_stats)
+        self._all.add(_room_stats)
+
+    def _remove(self, _room_stats):
+        # type: (RoomStats) -> None
+        key = self._group_key(_room_stats)
+        del self._stats[id(_room_stats.room)]
+        self._groups[key].remove(_room_stats)
+        self._totals[key].add(_room_stats, -1)
+        self._all.add(_room_stats, -1)
+        if not self._groups[key]:
+            del self._groups[key]
+            del self._totals[key]
+
+    def update_room(self, _hb_room):
+        # type: (Room) -> RoomStats
+        """Re-read the room's values (ie: after its People load was changed) and update the totals.
+
+        Only the index is updated, not the RoomStatsCollection it was built from.
+        """
+        old_stats = self._stats.get(id(_hb_room), None)
+        if old_stats is not None:
+            self._remove(old_stats)
+        new_stats = RoomStats(_hb_room, self.area_to_m2, self.area_to_ft2)
+        self._add(new_stats)
+        return new_stats
+
+    def update_occupancy(self, _hb_room, _num_bedrooms=None, _num_occupants=None):
+        # type: (Room, Optional[int], Optional[float]) -> RoomStats
+        """Set the room's number of bedrooms and/or occupants, and change the totals by the difference.
+
+        Only the values given are changed. The room's other values (ie: its floor area) are not
+        read again. The RoomStats is changed in place, so the RoomStatsCollection the index was
+        built from sees the new values as well. A room which is not in the index yet is read
+        and added with 'update_room'.
+        """
+        room_stats = self._stats.get(id(_hb_room), None)
+        if room_stats is None:
+            return self.update_room(_hb_room)
+
+        d_bedrooms, d_occupants = 0, 0.0
+        if _num_bedrooms is not None:
+            d_bedrooms = _num_bedrooms - room_stats.num_bedrooms
+            room_stats.num_bedrooms = _num_bedrooms
+        if _num_occupants is not None:
+            d_occupants = float(_num_occupants) - room_stats.num_occupants
+            room_stats.num_occupants = float(_num_occupants)
+
+        self._totals[self._group_key(room_stats)].change(d_bedrooms, d_occupants)
+        self._all.change(d_bedrooms, d_occupants)
+        return room_stats
+
+    def room_stats(self, _hb_room):
+        # type: (Room) -> RoomStats
+        """Return the RoomStats of the room. Raises KeyError if the room is not in the index."""
+        return self._stats[id(_hb_room)]
+
+    @property
+    def dwellings(self):
+        # type: () -> List[Any]
+        """The PH-Dwellings objects in the index."""
+        return [k for k in self._groups if not isinstance(k, tuple)]
+
+    def dwelling_rooms(self, _dwellings):
+        # type: (Any) -> List[Room]
+        """Return the rooms which share the PH-Dwellings object."""
+        return [_.room for _ in self._groups.get(_dwellings, [])]
+
+    def dwelling_totals(self, _dwellings):
+        # type: (Any) -> OccupancyTotals
+        """Return the totals for all the rooms which share the PH-Dwellings object."""
+        return self._totals.get(_dwellings, OccupancyTotals())
+
+    def totals_of(self, _hb_rooms):
+        # type: (List[Room]) -> OccupancyTotals
+        """Return the totals for the rooms. Any room not in the index is read, but not added to it."""
+        totals = OccupancyTotals()
+        for hb_room in _hb_rooms:
+            room_stats = self._stats.get(id(hb_room), None)
+            if room_stats is None:
+                room_stats = RoomStats(hb_room, self.area_to_m2, self.area_to_ft2)
+            totals.add(room_stats)
+        return totals
+
+    @property
+    def total_num_occupants(self):
+        # type: () -> float
+        return self._all.num_occupants
+
+    @property
+    def total_num_bedrooms(self):
+        # type: () -> int
+        return self._all.num_bedrooms
+
+    @property
+    def total_num_dwellings(self):
+        # type: () -> int
+        """Return the total number of dwellings. Rooms which share a PH-Dwellings object are counted once."""
+        return sum(d.num_dwellings for d in self.dwellings)
+
+    def __len__(self):
+        return len(self._stats)
+
+    def __repr__(self):
+        return "{}(rooms={}, dwellings={})".format(self.__class__.__name__, len(self), len(self.dwellings))
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GHCompo Interface: Utility to share equal HBE-Load objects between HB-Rooms.
+
+The program components build each new load (People, Lighting, Setpoint...) from the room's
+existing load and a few reference values, then give it a new random identifier. When many
+rooms have the same inputs this creates many copies of what is really the same load.
+
+The LoadPool keys each load by the kind of load, the value of the input load it is built from,
+and the reference values. The first time a key is seen the load is built and locked. Every
+later room with the same key gets that same locked instance. The number of load objects then
+follows the number of unique programs, not the number of rooms.
+
+Any code which needs to edit one of these shared loads must first duplicate it, the same way
+it would for any other load shared through a Honeybee-Energy ProgramType.
+"""
+
+import json
+
+try:
+    from typing import Any, Callable, Dict, Hashable, List, Tuple, TypeVar
+
+    T = TypeVar("T")
+except ImportError:
+    pass  # IronPython 2.7
+
+
+def value_key(_hbe_obj):
+    # type: (Any) -> Hashable
+    """Return a hashable key for the value of an HBE-Load (or None), based on its abridged dict."""
+    if _hbe_obj is None:
+        return None
+    try:
+        return json.dumps(_hbe_obj.to_dict(abridged=True), sort_keys=True)
+    except Exception:
+        return ("id", id(_hbe_obj))  # The object is kept alive by the pool, so the id won't be reused.
+
+
+def _lock(_obj):
+    # type: (Any) -> None
+    try:
+        _obj.lock()
+    except AttributeError:
+        pass
+
+
+class LoadPool(object):
+    """Interning pool of HBE-Load objects, keyed by load-kind, input-load value and reference values."""
+
+    def __init__(self):
+        self._loads = {}  # type: Dict[Tuple, Any]
+        self._inputs = []  # type: List[Any]
+        self.requests = 0
+
+    def get(self, _kind, _input_load, _args, _factory):
+        # type: (str, Any, Tuple, Callable[[], T]) -> T
+        """Return the pooled load for the key, building (and locking) it with the factory the first time.
+
+        Arguments:
+        ----------
+            * _kind (str): The kind of load, ie: "people".
+            * _input_load (Any): The room's existing load that the new load is built from (or None).
+            * _args (Tuple): The hashable reference values used to build the new load.
+            * _factory (Callable[[], T]): Function which builds the new load.
+
+        Returns:
+        --------
+            * (T): The new load, shared by every room with the same key.
+        """
+        self.requests += 1
+        key = (_kind, value_key(_input_load), _args)
+        try:
+            return self._loads[key]
+        except KeyError:
+            pass
+
+        new_load = _factory()
+        _lock(new_load)
+        self._inputs.append(_input_load)
+        self._loads[key] = new_load
+        return new_load
+
+    def get_list(self, _kind, _args, _factory):
+        # type: (str, Tuple, Callable[[], List[T]]) -> List[T]
+        """Return the pooled list of loads (ie: a process-load set) for the key, building it the first time."""
+        self.requests += 1
+        key = (_kind, None, _args)
+        try:
+            return self._loads[key]
+        except KeyError:
+            pass
+
+        new_loads = _factory()
+        for new_load in new_loads:
+            _lock(new_load)
+        self._loads[key] = new_loads
+        return new_loads
+
+    def clear(self):
+        # type: () -> None
+        self._loads = {}
+        self._inputs = []
+        self.requests = 0
+
+    def __len__(self):
+        return len(self._loads)
+
+    def __repr__(self):
+        return "{}(unique={}, requests={})".format(self.__class__.__name__, len(self), self.requests)
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GHCompo Interface: Utility for indexed, session-cached Program lookups.
+
+'Set Residential Program' used to resolve its base-program through the Honeybee-Energy
+library on every solve (a 'building' program is re-blended each time), and 'Phius Program
+Finder' searched the Phius standards data set on every solve.
+
+The ProgramCatalogue keeps everything it looks up for the session:
+
+    * Honeybee-Energy programs, by identifier.
+    * Phius program data, by (field, value, protocol) query.
+    * An index of every Phius program record, by protocol, built the first time a search
+      does not find an exact match. It is used for the fuzzy search over names/descriptions.
+    * The ProgramTypes built from the Phius data.
+
+The ProgramTypes returned are shared by every caller and are locked. Duplicate one before
+changing it (ie: to give it a new identifier).
+"""
+
+import difflib
+import json
+
+try:
+    from typing import Any, Dict, List, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_energy.lib.programtypes import building_program_type_by_identifier, program_type_by_identifier
+    from honeybee_energy.programtype import ProgramType
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_energy:\n\t{}".format(e))
+
+try:
+    from honeybee_energy_ph.library import programtypes
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
+
+
+SEARCH_FIELDS = ("name", "description")
+FUZZY_CUTOFF = 0.6  # difflib similarity (0-1) needed for a fuzzy match
+MAX_FUZZY_MATCHES = 5
+
+
+def _lock(_program):
+    # type: (Any) -> None
+    try:
+        _program.lock()
+    except AttributeError:
+        pass
+
+
+def _record_key(_data):
+    # type: (Any) -> str
+    """Return a hashable key for a Phius program data record."""
+    try:
+        return json.dumps(_data, sort_keys=True)
+    except (TypeError, ValueError):
+        return repr(_data)
+
+
+class ProgramCatalogue(object):
+    """Session cache and index of the Honeybee-Energy and Phius standards Programs."""
+
+    def __init__(self):
+        self._hb_programs = {}  # type: Dict[str, ProgramType]
+        self._queries = {}  # type: Dict[Tuple[str, str, Optional[str]], List[Dict]]
+        self._records = {}  # type: Dict[Optional[str], List[Dict]]
+        self._phius_programs = {}  # type: Dict[str, ProgramType]
+        self._protocols = None  # type: Optional[List[str]]
+        self._program_names = {}  # type: Dict[Optional[str], List[str]]
+
+    # -------------------------------------------------------------------------
+    # -- Honeybee-Energy Library
+
+    def hb_program(self, _identifier):
+        # type: (str) -> ProgramType
+        """Return the (locked) Honeybee-Energy library program with the identifier.
+
+        Building-program identifiers (ie: "MidriseApartment") are tried first, then the
+        room-program identifiers. Raises ValueError if neither library has the identifier.
+        """
+        try:
+            return self._hb_programs[_identifier]
+        except KeyError:
+            pass
+
+        try:
+            program = building_program_type_by_identifier(_identifier)
+        except ValueError:
+            program = program_type_by_identifier(_identifier)
+        _lock(program)
+        self._hb_programs[_identifier] = program
+        return program
+
+    # -------------------------------------------------------------------------
+    # -- Phius Standards
+
+    @property
+    def protocols(self):
+        # type: () -> List[str]
+        """The names of all the Phius standards protocols."""
+        if self._protocols is None:
+            self._protocols = list(programtypes.get_all_valid_protocol_names())
+        return self._protocols
+
+    def program_names(self, _protocol):
+        # type: (Optional[str]) -> List[str]
+        """The names of all the Phius standards programs of the protocol."""
+        try:
+            return self._program_names[_protocol]
+        except KeyError:
+            names = list(programtypes.get_all_valid_program_names_of_protocol(_protocol))
+            self._program_names[_protocol] = names
+            return names
+
+    def records(self, _protocol=None):
+        # type: (Optional[str]) -> List[Dict]
+        """Every Phius program data record of the protocol (or of all the protocols if None)."""
+        try:
+            return self._records[_protocol]
+        except KeyError:
+            pass
+
+        if _protocol is None:
+            records = [r for protocol in self.protocols for r in self.records(protocol)]
+        else:
+            records = []
+            seen = set()
+            for name in self.program_names(_protocol):
+                for data in self.query(name, "name", _protocol):
+                    key = _record_key(data)
+                    if key not in seen:
+                        seen.add(key)
+                        records.append(data)
+        self._records[_protocol] = records
+        return records
+
+    def query(self, _value, _field, _protocol=None):
+        # type: (str, str, Optional[str]) -> List[Dict]
+        """Return the Phius data records for the value, same as 'programtypes.load_data_from_Phius_standards'."""
+        key = (_value, _field, _protocol)
+        try:
+            return self._queries[key]
+        except KeyError:
+            data = list(programtypes.load_data_from_Phius_standards(_value, _field, _protocol) or [])
+            self._queries[key] = data
+            return data
+
+    def search(self, _text, _field, _protocol=None, _max_matches=MAX_FUZZY_MATCHES):
+        # type: (str, str, Optional[str], int) -> List[Dict]
+        """Return the Phius data records whose field (ie: "name") is the closest match to the text.
+
+        A record is a match if the text is part of its field-value, or if the two are similar
+        enough (difflib). Closer matches are first. Case is ignored.
+        """
+        if _field not in SEARCH_FIELDS:
+            raise ValueError("Cannot search the '{}' field. Use one of: {}".format(_field, SEARCH_FIELDS))
+
+        text = str(_text).strip().lower()
+        if not text:
+            return []
+
+        scored = []
+        for i, data in enumerate(self.records(_protocol)):
+            value = str(data.get(_field, "") or "").lower()
+            if not value:
+                continue
+            score = difflib.SequenceMatcher(None, text, value).ratio()
+            if text in value:
+                score = max(score, FUZZY_CUTOFF) + 1.0
+            if score >= FUZZY_CUTOFF:
+                scored.append((-score, i, data))
+
+        return [data for _, _, data in sorted(scored, key=lambda _: (_[0], _[1]))[:_max_matches]]
+
+    def find(self, _value, _field, _protocol=None):
+        # type: (str, str, Optional[str]) -> List[Dict]
+        """Return the Phius data records for the value, or the closest matches if there are none."""
+        return self.query(_value, _field, _protocol) or self.search(_value, _field, _protocol)
+
+    def phius_program(self, _data):
+        # type: (Dict) -> ProgramType
+        """Return the (locked) ProgramType built from the Phius data record."""
+        key = _record_key(_data)
+        try:
+            return self._phius_programs[key]
+        except KeyError:
+            program = programtypes.build_hb_program_from_Phius_data(_data)
+            _lock(program)
+            self._phius_programs[key] = program
+            return program
+
+    def __repr__(self):
+        return "{}(hb_programs={}, phius_programs={}, queries={})".format(
+            self.__class__.__name__, len(self._hb_programs), len(self._phius_programs), len(self._queries)
+        )
+
+
+_CATALOGUE = None  # type: Optional[ProgramCatalogue]
+
+
+def get_catalogue():
+    # type: () -> ProgramCatalogue
+    """Return the session's ProgramCatalogue."""
+    global _CATALOGUE
+    if _CATALOGUE is None:
+        _CATALOGUE = ProgramCatalogue()
+    return _CATALOGUE
+
+
+def clear_cache():
+    # type: () -> None
+    """Clear the session's ProgramCatalogue."""
+    global _CATALOGUE
+    _CATALOGUE = None
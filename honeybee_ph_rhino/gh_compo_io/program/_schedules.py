@@ -1,10 +1,21 @@
 # -*- coding: utf-8 -*-
 # -*- Python Version: 2.7 -*-
 
-"""GHCompo Interface: Utility to load Program Schedules from Standards Library."""
+"""GHCompo Interface: Utility to load Program Schedules from Standards Library.
+
+Building the ScheduleRulesets from the JSON files is slow, and every program component
+used to rebuild all of them on each solve. The loaded schedules are now kept in a
+module-level cache, keyed by file path. Each entry is re-loaded only if the file's
+modified-time has changed, and each file is only loaded the first time it is needed.
+"""
 
 import os
 
+try:
+    from typing import Dict, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
 try:
     from honeybee_energy.lib.schedules import schedule_by_identifier
     from honeybee_energy.schedule.ruleset import ScheduleRuleset
@@ -16,20 +27,88 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_standards:\n\t{}".format(e))
 
+try:
+    from honeybee.config import folders
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+
+# -- {file-path: (modified-time, {schedule-identifier: ScheduleRuleset})}
+_FILE_CACHE = {}  # type: Dict[str, Tuple[float, Dict[str, ScheduleRuleset]]]
+
+
+def default_schedules_directory():
+    # type: () -> str
+    """Return the path to the honeybee_ph_standards 'schedules' folder."""
+    return os.path.join(folders.python_package_path, "honeybee_ph_standards", "schedules")
+
+
+def load_schedules_file(_file_path):
+    # type: (str) -> Dict[str, ScheduleRuleset]
+    """Return the ScheduleRulesets in the JSON file, loading the file only if it is new or has changed.
+
+    The ScheduleRulesets returned are shared by every caller, so do not modify them.
+    """
+    file_path = os.path.abspath(_file_path)
+    modified_time = os.path.getmtime(file_path)
+    try:
+        cached_time, schedules = _FILE_CACHE[file_path]
+        if cached_time == modified_time:
+            return schedules
+    except KeyError:
+        pass
+
+    schedules = load_schedules_from_json_file(file_path)
+    _FILE_CACHE[file_path] = (modified_time, schedules)
+    return schedules
+
+
+def clear_cache():
+    # type: () -> None
+    """Clear the loaded-schedules cache."""
+    _FILE_CACHE.clear()
+
 
 class SchedulesCollection(object):
     """Convenience class to hold all the schedules for a single-family home."""
 
-    def __init__(self, root_directory):
-        # type: (str) -> None
-        self.all_appliances = load_schedules_from_json_file(os.path.join(root_directory, "hbph_sfh_appliances.json"))
-        self.all_lighting = load_schedules_from_json_file(os.path.join(root_directory, "hbph_sfh_lighting.json"))
-        self.all_mel = load_schedules_from_json_file(os.path.join(root_directory, "hbph_sfh_electric_equipment.json"))
-        self.all_occupancy = load_schedules_from_json_file(os.path.join(root_directory, "hbph_sfh_occupancy.json"))
-        self.all_lighting = load_schedules_from_json_file(os.path.join(root_directory, "hbph_sfh_lighting.json"))
-        self.all_mel = load_schedules_from_json_file(os.path.join(root_directory, "hbph_sfh_electric_equipment.json"))
-        self.all_setpoint = load_schedules_from_json_file(os.path.join(root_directory, "hbph_sfh_setpoint.json"))
-        self.all_hot_water = load_schedules_from_json_file(os.path.join(root_directory, "hbph_sfh_hot_water.json"))
+    def __init__(self, root_directory=None):
+        # type: (Optional[str]) -> None
+        self.root_directory = root_directory or default_schedules_directory()
+
+    def _load(self, _file_name):
+        # type: (str) -> Dict[str, ScheduleRuleset]
+        return load_schedules_file(os.path.join(self.root_directory, _file_name))
+
+    @property
+    def all_appliances(self):
+        # type: () -> Dict[str, ScheduleRuleset]
+        return self._load("hbph_sfh_appliances.json")
+
+    @property
+    def all_lighting(self):
+        # type: () -> Dict[str, ScheduleRuleset]
+        return self._load("hbph_sfh_lighting.json")
+
+    @property
+    def all_mel(self):
+        # type: () -> Dict[str, ScheduleRuleset]
+        return self._load("hbph_sfh_electric_equipment.json")
+
+    @property
+    def all_occupancy(self):
+        # type: () -> Dict[str, ScheduleRuleset]
+        return self._load("hbph_sfh_occupancy.json")
+
+    @property
+    def all_setpoint(self):
+        # type: () -> Dict[str, ScheduleRuleset]
+        return self._load("hbph_sfh_setpoint.json")
+
+    @property
+    def all_hot_water(self):
+        # type: () -> Dict[str, ScheduleRuleset]
+        return self._load("hbph_sfh_hot_water.json")
 
     def get_schedule(self, _schedule_name):
         # type: (str) -> ScheduleRuleset
@@ -3,15 +3,12 @@
 
 """GHCompo Interface: HBPH - Add Process Equipment."""
 
-import os
-
 try:
     from typing import Type
 except ImportError:
     pass  # IronPython 2.7
 
 try:
-    from honeybee.config import folders
     from honeybee.room import Room
     from honeybee.typing import clean_and_id_ep_string
 except ImportError as e:
@@ -66,9 +63,7 @@ class GHCompo_AddProcessEquip(object):
 
     def __init__(self, _IGH, _equipment, _num_bedrooms, _num_occupants, _num_dwellings, _hb_rooms):
         # type: (gh_io.IGH, list[str | ph_equipment.PhEquipment], float, float, float, list[Room]) -> None
-        self.schedules = SchedulesCollection(
-            os.path.join(folders.python_package_path, "honeybee_ph_standards", "schedules")
-        )
+        self.schedules = SchedulesCollection()
         self.IGH = _IGH
         self.equipment = _equipment
         self.num_bedrooms = _num_bedrooms
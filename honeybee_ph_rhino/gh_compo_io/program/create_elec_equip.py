@@ -15,7 +15,9 @@ from Grasshopper.Kernel.Parameters import Hints  # type: ignore
 
 try:
     from honeybee_ph_rhino import gh_io
+    from honeybee_ph_rhino.attr_input_map import batch_input_names, expand_batch_inputs, get_attr_input_map, run_batch
     from honeybee_ph_rhino.gh_io import ComponentInput
+    from honeybee_ph_rhino.gh_logger import get_logger
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
@@ -347,16 +349,8 @@ class GHCompo_CreateElecEquip(object):
     def set_object_attributes(self, _equipment_obj):
         # type: (ph_equipment.PhEquipment) -> ph_equipment.PhEquipment
         """Set the object's attributes based on the component inputs"""
-        for attr_name in dir(_equipment_obj):
-            if attr_name.startswith("_"):
-                continue
-
-            input_val = self.input_dict.get(attr_name)
-            if input_val:
-                print("Setting attribute '{}' to '{}' [{}]".format(attr_name, input_val, type(input_val)))
-                setattr(_equipment_obj, attr_name, input_val)
-
-        return _equipment_obj
+        attr_map = get_attr_input_map(_equipment_obj)
+        return attr_map.apply(_equipment_obj, self.input_dict, get_logger(self.IGH))
 
     def run(self):
         # type: () -> list[ph_equipment.PhEquipment]
@@ -370,3 +364,13 @@ class GHCompo_CreateElecEquip(object):
             equipment_.append(equipment_obj)
 
         return equipment_
+
+    def run_batch(self):
+        # type: () -> list[ph_equipment.PhEquipment]
+        """Build the equipment for each item of the list inputs (see attr_input_map.expand_batch_inputs).
+
+        Returns the equipment of every run() in a single list, in order.
+        """
+        batch_names = batch_input_names(get_component_inputs(self.equip_type))
+        input_dicts = expand_batch_inputs(self.input_dict, batch_names)
+        return [equipment for equipment_ in run_batch(self, input_dicts) for equipment in equipment_]
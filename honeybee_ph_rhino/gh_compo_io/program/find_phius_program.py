@@ -13,13 +13,9 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_energy:\n\t{}".format(e))
 
-try:
-    from honeybee_energy_ph.library import programtypes
-except ImportError as e:
-    raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
-
 try:
     from honeybee_ph_rhino import gh_io
+    from honeybee_ph_rhino.gh_compo_io.program._program_catalogue import get_catalogue
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
@@ -45,6 +41,25 @@ class GHCompo_FindPhiusProgram(object):
         self.protocol = _protocol
         self.base_program = _base_program
 
+    def find_data(self, _value, _field):
+        # type: (str, str) -> List[dict]
+        """Return the Phius data for the name or description, or the closest matches if there is no exact match."""
+        catalogue = get_catalogue()
+        prog_data = catalogue.query(_value, _field, self.protocol)
+        if prog_data:
+            return prog_data
+
+        prog_data = catalogue.search(_value, _field, self.protocol)
+        if prog_data:
+            msg = "No exact Phius match for {}: '{}'. Using the closest match(es) instead: {}".format(
+                _field, _value, ", ".join("'{}'".format(data.get(_field)) for data in prog_data)
+            )
+            self.IGH.warning(msg)
+        else:
+            msg = "No Phius data found for {}: '{}'".format(_field, _value)
+            self.IGH.warning(msg)
+        return prog_data
+
     def run(self):
         # type: () -> Optional[List[ProgramType]]
         """Run the GHCompo_FindPhiusProgram class.
@@ -52,13 +67,15 @@ class GHCompo_FindPhiusProgram(object):
         Returns:
             Optional[List[ProgramType]]: A list of program types.
         """
+        catalogue = get_catalogue()
+
         # -- Give some helpful output
         if not self.protocol:
-            protocols = programtypes.get_all_valid_protocol_names()
+            protocols = catalogue.protocols
             print("No protocol specified. Select either: '{}'".format(protocols))
 
         if self.protocol and not self.name and not self.description:
-            program_names = programtypes.get_all_valid_program_names_of_protocol(self.protocol)
+            program_names = catalogue.program_names(self.protocol)
             print("No program name specified. Select either: '{}'".format(program_names))
 
         # -- Get the data from in the Phius data set
@@ -68,25 +85,19 @@ class GHCompo_FindPhiusProgram(object):
             return None
 
         if self.name:
-            prog_data = programtypes.load_data_from_Phius_standards(self.name, "name", self.protocol)
-            if not prog_data:
-                msg = "No Phius data found for name: '{}'".format(self.name)
-                self.IGH.warning(msg)
+            prog_data = self.find_data(self.name, "name")
         elif self.description:
-            prog_data = programtypes.load_data_from_Phius_standards(self.description, "description", self.protocol)
-            if not prog_data:
-                msg = "No Phius data found for description: '{}'".format(self.description)
-                self.IGH.warning(msg)
+            prog_data = self.find_data(self.description, "description")
         else:
             prog_data = []
             msg = "No Phius data found for name: '{}' or description: '{}'".format(self.name, self.description)
             self.IGH.warning(msg)
 
         # ------------------------------------------------------------------------------
-        # -- Turn the datasets found into a HB Programs
+        # -- Turn the datasets found into a HB Programs (shared and locked, duplicate before editing)
         programs_ = []
         for data in prog_data:
-            prog = programtypes.build_hb_program_from_Phius_data(data)
+            prog = catalogue.phius_program(data)
             programs_.append(prog)
 
         return programs_
@@ -3,8 +3,6 @@
 
 """GHCompo Interface: HBPH - Get Phius Multi-Family Residential Room Load Data."""
 
-from collections import defaultdict
-
 try:
     from typing import Any
 except ImportError:
@@ -32,51 +30,26 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
-
-# -----------------------------------------------------------------------------
-
-
-def stories_error(_hb_rooms):
-    # type (list[Room]) -> bool
-    """Returns False if HBE-Stories are less than 2."""
-    try:
-        stories = {rm.story for rm in _hb_rooms}
-        if len(stories) < 2:
-            return True
-        else:
-            return False
-    except AttributeError:
-        return True
-
-
-def spaces_error(_hb_rooms):
-    # type: (list[Room]) -> Room | None
-    """Returns any Honeybee Room which does not have PH-Spaces."""
-    for rm in _hb_rooms:
-        if len(rm.properties.ph.spaces) == 0:  # type: ignore
-            return rm
-    return None
+try:
+    from honeybee_ph_rhino.gh_compo_io.program._get_room_data import RoomStatsCollection
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 
-def people_error(_hb_rooms):
-    # type: (list[Room]) -> Room | None
-    """Returns any room that does not have the 'People' HBE property applied."""
-    for rm in _hb_rooms:
-        if rm.properties.energy.people is None:  # type: ignore
-            return rm
-    return None
+# -----------------------------------------------------------------------------
 
 
-def check_res_room_inputs(_hb_rooms, _IGH):
-    # type: (list[Room], gh_io.IGH) -> None
+def check_res_room_inputs(_room_stats, _IGH):
+    # type: (RoomStatsCollection, gh_io.IGH) -> None
     """Validate the input Honeybee-Rooms."""
-    if not _hb_rooms:
+    if not len(_room_stats):
         msg = "Warning: No Residential HB-Rooms found?"
         print(msg)
         _IGH.warning(msg)
 
     # -- Check the HBE-Stories
-    if stories_error(_hb_rooms):
+    stories = _room_stats.stories
+    if len(stories) < 2:
         msg = (
             "Warning: It appears that there is only 1 Honeybee-Story assigned to the "
             "Honeybee-Rooms? If that is true, ignore this warning. Otherwise, check that you "
@@ -87,10 +60,10 @@ def check_res_room_inputs(_hb_rooms, _IGH):
         print(msg)
         _IGH.warning(msg)
     else:
-        print("{} Stories found".format(len({rm.story for rm in _hb_rooms})))
+        print("{} Stories found".format(len(stories)))
 
     # -- Check that al the rooms have "PH-Spaces"
-    rm_with_error = spaces_error(_hb_rooms)
+    rm_with_error = _room_stats.first_room_without_spaces()
     if rm_with_error:
         msg = (
             "Error: There are no PH-Spaces assigned to room: '{}'. Please be sure to assign the "
@@ -101,7 +74,7 @@ def check_res_room_inputs(_hb_rooms, _IGH):
         _IGH.error(msg)
 
     # -- Check that all the rooms have a "People"
-    rm = people_error(_hb_rooms)
+    rm_with_error = _room_stats.first_room_without_people()
     if rm_with_error:
         msg = (
             "Error: There is no 'People' property assigned to room: '{}'. Be sure to use "
@@ -120,24 +93,14 @@ def room_is_dwelling(_hb_room):
     return hb_room_prop_e_prop_ph.is_residential
 
 
-def sort_rooms_by_story(_hb_rooms):
-    # type: (list[Room]) -> list[list[Room]]
-    """Returns lists of the rooms, grouped by their Honeybee 'story'."""
-
-    d = defaultdict(list)
-    for rm in _hb_rooms:
-        d[rm.story].append(rm)
-    return [d[story_key] for story_key in sorted(d.keys())]
-
-
 # -----------------------------------------------------------------------------
 
 
-def create_phius_stories(_hb_rooms, _area_unit):
-    # type: (list[Room], str) -> list[phius_mf.PhiusResidentialStory]
+def create_phius_stories(_room_stats, _area_unit):
+    # type: (RoomStatsCollection, str) -> list[phius_mf.PhiusResidentialStory]
     """Create a list of PhiusResidentialStory objects from the HB-Rooms."""
 
-    rooms_by_story = sort_rooms_by_story(_hb_rooms)
+    rooms_by_story = _room_stats.rooms_by_story()
     phius_stories = [phius_mf.PhiusResidentialStory(room_list, _area_unit) for room_list in rooms_by_story]
     phius_stories = sorted(phius_stories, reverse=True)
     return phius_stories
@@ -223,13 +186,14 @@ class GHCompo_GetPhiusMFResidentialLoadData(object):
 
         # ---------------------------------------------------------------------
         # -- Break out the Res, from the Non-Res. HB-Rooms
-        hb_res_rooms_ = [rm for rm in self.hb_rooms if room_is_dwelling(rm)]
+        res_room_stats = RoomStatsCollection(self.hb_rooms, self.IGH).filter(_is_dwelling=True)
+        hb_res_rooms_ = res_room_stats.rooms
 
         # -- Check the inputs for errors, display warnings
-        check_res_room_inputs(hb_res_rooms_, self.IGH)
+        check_res_room_inputs(res_room_stats, self.IGH)
 
         # ---------------------------------------------------------------------
-        phius_stories = create_phius_stories(hb_res_rooms_, self.IGH.get_rhino_areas_unit_name())
+        phius_stories = create_phius_stories(res_room_stats, self.IGH.get_rhino_areas_unit_name())
         mf_calculator_check = get_res_room_data_as_string(phius_stories)
         total_energy_consumption = get_total_energy_consumption(phius_stories)
 
@@ -14,11 +14,7 @@ except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
 try:
-    from honeybee_ph_rhino.gh_compo_io.program._get_room_data import (
-        get_num_bedrooms,
-        get_num_dwellings,
-        get_num_occupants,
-    )
+    from honeybee_ph_rhino.gh_compo_io.program._get_room_data import RoomStatsCollection
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
@@ -34,8 +30,9 @@ class GHCompo_GetResOccupancy(object):
         if not self.hb_rooms:
             return 0, 0, 0
 
-        total_num_ppl = sum(get_num_occupants(rm, self.IGH) for rm in self.hb_rooms)
-        total_num_br = sum(get_num_bedrooms(rm) for rm in self.hb_rooms)
-        total_num_dwellings = get_num_dwellings(self.hb_rooms)
+        room_stats = RoomStatsCollection(self.hb_rooms, self.IGH)
+        total_num_ppl = room_stats.total_num_occupants
+        total_num_br = room_stats.total_num_bedrooms
+        total_num_dwellings = room_stats.total_num_dwellings
 
         return total_num_br, total_num_ppl, total_num_dwellings
@@ -42,9 +42,9 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
 
 try:
-    from honeybee_ph_standards.schedules._load_schedules import load_schedules_from_json_file
+    from honeybee_ph_rhino.gh_compo_io.program._schedules import default_schedules_directory, load_schedules_file
 except ImportError as e:
-    raise ImportError("\nFailed to import honeybee_ph_standards:\n\t{}".format(e))
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 try:
     from ph_gh_component_io import gh_io
@@ -71,11 +71,9 @@ def get_new_people(_hbe_people, _occ_schd, _act_schd):
 
 
 class GHCompo_SetDwelling(object):
-    file_pth = os.path.join(
-        folders.python_package_path, "honeybee_ph_standards", "schedules", "hbph_sfh_occupancy.json"
-    )
-    default_occ_schd = load_schedules_from_json_file(file_pth)["hbph_sfh_Occupant_Presence"]
-    default_activity_schd = load_schedules_from_json_file(file_pth)["hbph_sfh_Occupant_Activity"]
+    file_pth = os.path.join(default_schedules_directory(), "hbph_sfh_occupancy.json")
+    default_occ_schd = load_schedules_file(file_pth)["hbph_sfh_Occupant_Presence"]
+    default_activity_schd = load_schedules_file(file_pth)["hbph_sfh_Occupant_Activity"]
 
     def __init__(self, _IGH, _num_dwellings, _hb_rooms, *args, **kwargs):
         # type: (gh_io.IGH, DataTree[int], DataTree[Room], *Any, **Any) -> None
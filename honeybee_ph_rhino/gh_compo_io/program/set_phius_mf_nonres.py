@@ -3,15 +3,12 @@
 
 """GHCompo Interface: HBPH - Set Phius Multi-Family Non-Residential Room Loads."""
 
-import os
-
 try:
     from typing import Any
 except ImportError:
     pass  # IronPython 2.7
 
 try:
-    from honeybee.config import folders
     from honeybee.room import Room
     from honeybee.typing import clean_and_id_ep_string
 except ImportError as e:
@@ -35,12 +32,7 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 try:
-    from honeybee_ph_rhino.gh_compo_io.program._get_room_data import (
-        get_num_bedrooms,
-        get_num_dwellings,
-        get_num_occupants,
-        get_room_floor_area_ft2,
-    )
+    from honeybee_ph_rhino.gh_compo_io.program._get_room_data import RoomStatsCollection
     from honeybee_ph_rhino.gh_compo_io.program._schedules import SchedulesCollection
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
@@ -92,9 +84,7 @@ class GHCompo_SetPhiusMFNonResidentialRoomLoads(object):
         self.total_num_dwellings = 0
         self.total_num_bedrooms = 0
         self.total_floor_area_ft2 = 0.0
-        self.schedules = SchedulesCollection(
-            os.path.join(folders.python_package_path, "honeybee_ph_standards", "schedules")
-        )
+        self.schedules = SchedulesCollection()
 
     @property
     def ready(self):
@@ -107,11 +97,12 @@ class GHCompo_SetPhiusMFNonResidentialRoomLoads(object):
         # type: () -> None
         """Collect the room properties for the Phius-MF-PhEquipment."""
 
-        self.total_num_hb_rooms = len(self.hb_rooms)
-        self.total_num_occupants = sum(get_num_occupants(rm, self.IGH) for rm in self.hb_rooms)
-        self.total_num_dwellings = get_num_dwellings(self.hb_rooms)
-        self.total_num_bedrooms = sum(get_num_bedrooms(rm) for rm in self.hb_rooms)
-        self.total_floor_area_ft2 = sum(get_room_floor_area_ft2(rm, self.IGH) for rm in self.hb_rooms)
+        room_stats = RoomStatsCollection(self.hb_rooms, self.IGH)
+        self.total_num_hb_rooms = len(room_stats)
+        self.total_num_occupants = room_stats.total_num_occupants
+        self.total_num_dwellings = room_stats.total_num_dwellings
+        self.total_num_bedrooms = room_stats.total_num_bedrooms
+        self.total_floor_area_ft2 = room_stats.total_floor_area_ft2
 
     def create_ph_process_load(self, _ph_equipment):
         # type: (list[ph_equipment.PhEquipment]) -> list[Process]
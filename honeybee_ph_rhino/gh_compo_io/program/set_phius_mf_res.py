@@ -3,15 +3,14 @@
 
 """GHCompo Interface: HBPH - Set Phius Multi-Family Residential Room Loads."""
 
-import os
+from collections import defaultdict
 
 try:
-    from typing import Any
+    from typing import Any, Optional
 except ImportError:
     pass  # IronPython 2.7
 
 try:
-    from honeybee.config import folders
     from honeybee.room import Room
     from honeybee.typing import clean_and_id_ep_string
 except ImportError as e:
@@ -35,12 +34,7 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 try:
-    from honeybee_ph_rhino.gh_compo_io.program._get_room_data import (
-        get_num_bedrooms,
-        get_num_dwellings,
-        get_num_occupants,
-        get_room_floor_area_ft2,
-    )
+    from honeybee_ph_rhino.gh_compo_io.program._get_room_data import RoomStatsCollection
     from honeybee_ph_rhino.gh_compo_io.program._schedules import SchedulesCollection
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
@@ -99,6 +93,46 @@ def build_lighting_garage(total_lighting_garage, number_of_rooms):
     return lighting_obj
 
 
+ALLOCATION_METHODS = ("EQUAL", "FLOOR_AREA", "DWELLINGS")
+
+
+def allocation_shares(_room_stats, _allocate_by="EQUAL"):
+    # type: (RoomStatsCollection, str) -> list[float]
+    """Return each room's share (0-1, summing to 1) of the building's total MEL and Lighting energy.
+
+    Arguments:
+    ----------
+        * _room_stats (RoomStatsCollection): The statistics of the HB-Rooms.
+        * _allocate_by (str): "EQUAL" (each room gets the same share), "FLOOR_AREA" (by room floor
+            area) or "DWELLINGS" (by the number of dwellings, split evenly between the dwelling's rooms).
+
+    Returns:
+    --------
+        * (list[float]): The share for each room, in order.
+    """
+    allocate_by = str(_allocate_by or "EQUAL").strip().upper()
+    if allocate_by not in ALLOCATION_METHODS:
+        raise ValueError("Unknown allocation: '{}'. Use one of: {}".format(_allocate_by, ALLOCATION_METHODS))
+
+    if allocate_by == "FLOOR_AREA":
+        weights = [_.floor_area for _ in _room_stats]
+    elif allocate_by == "DWELLINGS":
+        rooms_per_dwelling = defaultdict(int)  # type: dict[Any, int]
+        for rm_stats in _room_stats:
+            rooms_per_dwelling[rm_stats.dwellings] += 1
+        weights = [
+            _.dwellings.num_dwellings / float(rooms_per_dwelling[_.dwellings]) if _.dwellings is not None else 0.0
+            for _ in _room_stats
+        ]
+    else:
+        weights = [1.0 for _ in _room_stats]
+
+    total_weight = float(sum(weights))
+    if not total_weight:
+        return [1.0 / len(weights) for _ in weights]
+    return [w / total_weight for w in weights]
+
+
 # -----------------------------------------------------------------------------
 # -- Component Interface
 
@@ -121,13 +155,15 @@ class GHCompo_SetPhiusMFResidentialRoomLoads(object):
         _total_lighting_ext,
         _total_lighting_garage,
         _hb_rooms,
+        _allocate_by=None,
         *args,
         **kwargs
     ):
-        # type: (gh_io.IGH, list[ph_equipment.PhEquipment],float, float, float, float, list[Room], *Any, **Any) -> None
+        # type: (gh_io.IGH, list[ph_equipment.PhEquipment],float, float, float, float, list[Room], Optional[str], *Any, **Any) -> None
         self.IGH = _IGH
         self.hb_rooms = _hb_rooms or []
-        self.ph_equipment = _equipment or []
+        self.ph_equipment = list(_equipment or [])
+        self.allocate_by = _allocate_by or "EQUAL"
         self.total_mel = _total_mel or 0.0
         self.total_lighting_int = _total_lighting_int or 0.0
         self.total_lighting_ext = _total_lighting_ext or 0.0
@@ -138,9 +174,8 @@ class GHCompo_SetPhiusMFResidentialRoomLoads(object):
         self.total_num_dwellings = 0
         self.total_num_bedrooms = 0
         self.total_floor_area_ft2 = 0.0
-        self.schedules = SchedulesCollection(
-            os.path.join(folders.python_package_path, "honeybee_ph_standards", "schedules")
-        )
+        self.room_stats = None  # type: Optional[RoomStatsCollection]
+        self.schedules = SchedulesCollection()
 
     @property
     def ready(self):
@@ -153,11 +188,13 @@ class GHCompo_SetPhiusMFResidentialRoomLoads(object):
         # type: () -> None
         """Collect the room properties for the Phius-MF-PhEquipment."""
 
-        self.total_num_hb_rooms = len(self.hb_rooms)
-        self.total_num_occupants = sum(get_num_occupants(rm, self.IGH) for rm in self.hb_rooms)
-        self.total_num_dwellings = get_num_dwellings(self.hb_rooms)
-        self.total_num_bedrooms = sum(get_num_bedrooms(rm) for rm in self.hb_rooms)
-        self.total_floor_area_ft2 = sum(get_room_floor_area_ft2(rm, self.IGH) for rm in self.hb_rooms)
+        room_stats = RoomStatsCollection(self.hb_rooms, self.IGH)
+        self.room_stats = room_stats
+        self.total_num_hb_rooms = len(room_stats)
+        self.total_num_occupants = room_stats.total_num_occupants
+        self.total_num_dwellings = room_stats.total_num_dwellings
+        self.total_num_bedrooms = room_stats.total_num_bedrooms
+        self.total_floor_area_ft2 = room_stats.total_floor_area_ft2
 
     def create_ph_process_load(self, _ph_equipment):
         # type: (list[ph_equipment.PhEquipment]) -> list[Process]
@@ -194,23 +231,26 @@ class GHCompo_SetPhiusMFResidentialRoomLoads(object):
 
         return new_process_loads
 
-    def add_process_loads_to_rooms(self, _hb_rooms, _process_loads):
-        # type: (list[Room], list[Process]) -> list[Room]
-        """Add each of the Process Loads to each of the Rooms."""
+    def add_process_loads_to_rooms(self, _hb_rooms, _process_loads, _room_process_loads=None):
+        # type: (list[Room], list[Process], Optional[list[list[Process]]]) -> list[Room]
+        """Add each of the Process Loads to each of the Rooms, followed by each room's own allocated loads."""
 
         hb_rooms_ = []  # type: list[Room]
-        for r in _hb_rooms:
+        for i, r in enumerate(_hb_rooms):
             new_room = r.duplicate()  # type: Room
             hbe_prop = getattr(new_room.properties, "energy")  # type: RoomEnergyProperties
             for process_load in _process_loads:
                 hbe_prop.add_process_load(process_load)
+            if _room_process_loads:
+                for process_load in _room_process_loads[i]:
+                    hbe_prop.add_process_load(process_load)
             hb_rooms_.append(new_room)
 
         return hb_rooms_
 
     def setup_ph_equipment(self):
         # type: () -> None
-        """Setup the Phius-MF-PhEquipment for the room loads."""
+        """Setup the default Phius-MF-PhEquipment (appliances) if none are provided."""
 
         # -- Build default MF-PhEquipment if none provided
         if not self.ph_equipment:
@@ -220,11 +260,32 @@ class GHCompo_SetPhiusMFResidentialRoomLoads(object):
             self.ph_equipment.append(ph_equipment.PhFridgeFreezer.phius_default())
             self.ph_equipment.append(ph_equipment.PhCooktop.phius_default())
 
-        # -- Build the Phius-MF-PhEquipment
-        self.ph_equipment.append(build_mel(self.total_mel, self.total_num_hb_rooms))
-        self.ph_equipment.append(build_lighting_int(self.total_lighting_int, self.total_num_hb_rooms))
-        self.ph_equipment.append(build_lighting_ext(self.total_lighting_ext, self.total_num_hb_rooms))
-        self.ph_equipment.append(build_lighting_garage(self.total_lighting_garage, self.total_num_hb_rooms))
+    def allocate_process_loads(self):
+        # type: () -> list[list[Process]]
+        """Return each room's MEL and Lighting Process Loads, split from the building totals.
+
+        Rooms with the same share are given the same Process Load objects, so only one
+        set of Process Loads is built for each distinct share (one in total for "EQUAL").
+        """
+        if self.room_stats is None:
+            self.collect_hb_room_props()
+
+        shares = allocation_shares(self.room_stats, self.allocate_by)
+        loads_by_share = {}  # type: dict[float, list[Process]]
+        room_process_loads = []  # type: list[list[Process]]
+        for share in shares:
+            key = round(share, 12)
+            if key not in loads_by_share:
+                loads_by_share[key] = self.create_ph_process_load(
+                    [
+                        build_mel(self.total_mel * share, 1),
+                        build_lighting_int(self.total_lighting_int * share, 1),
+                        build_lighting_ext(self.total_lighting_ext * share, 1),
+                        build_lighting_garage(self.total_lighting_garage * share, 1),
+                    ]
+                )
+            room_process_loads.append(loads_by_share[key])
+        return room_process_loads
 
     def run(self):
         # type: () -> list[Room]
@@ -234,7 +295,8 @@ class GHCompo_SetPhiusMFResidentialRoomLoads(object):
 
         self.collect_hb_room_props()
         self.setup_ph_equipment()
-        new_process_loads = self.create_ph_process_load(self.ph_equipment)
-        hb_rooms_ = self.add_process_loads_to_rooms(self.hb_rooms, new_process_loads)
+        appliance_process_loads = self.create_ph_process_load(self.ph_equipment)
+        room_process_loads = self.allocate_process_loads()
+        hb_rooms_ = self.add_process_loads_to_rooms(self.hb_rooms, appliance_process_loads, room_process_loads)
 
         return hb_rooms_
@@ -5,7 +5,6 @@
 
 import os
 from contextlib import contextmanager
-from statistics import mean
 
 try:
     from typing import Generator
@@ -32,7 +31,6 @@ except ImportError as e:
 try:
     from honeybee_energy_ph.dwellings import group_rooms_by_dwelling
     from honeybee_energy_ph.properties.load.people import PeoplePhProperties
-    from honeybee_ph_standards.schedules._load_schedules import load_schedules_from_json_file
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
 
@@ -42,9 +40,12 @@ except ImportError:
     raise ImportError("\nFailed to import ph_gh_component_io")
 
 try:
-    from ph_units.converter import convert
+    from honeybee_ph_rhino.gh_compo_io.program._get_room_data import OccupancyIndex, RoomStatsCollection
+    from honeybee_ph_rhino.gh_compo_io.program._schedules import default_schedules_directory, load_schedules_file
+    from honeybee_ph_rhino.gh_logger import SolveLogger, get_logger, print_all_logger
+    from honeybee_ph_rhino.schedule_stats import annual_mean
 except ImportError as e:
-    raise ImportError("\nFailed to import ph_units:\n\t{}".format(e))
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 
 @contextmanager
@@ -60,41 +61,39 @@ def _get_avg_occ_rate(_hb_room):
     # type: (Room) -> float
     """Get the HBE-People Occupancy-Schedule average annual value."""
     hbe_prop = getattr(_hb_room.properties, "energy")  # type: RoomEnergyProperties
-    return mean(hbe_prop.people.occupancy_schedule.values())  # type: ignore
+    return annual_mean(hbe_prop.people.occupancy_schedule)  # type: ignore
 
 
-def _get_room_floor_area_m2(_hb_room, _IGH):
-    # type: (Room, gh_io.IGH) -> float
-    room_floor_area_m2 = convert(_hb_room.floor_area, _IGH.get_rhino_areas_unit_name(), "M2") or 0.0
-    if not room_floor_area_m2:
-        _IGH.warning("Error: Room: '{}' has no floor surfaces?".format(_hb_room.display_name))
-    return room_floor_area_m2
-
-
-def set_number_of_bedrooms(_hb_rooms, _num_bedrooms):
-    # type: (list[Room], list[int]) -> None
-    """Set the number of bedrooms on each HB-Room."""
+def set_number_of_bedrooms(_hb_rooms, _num_bedrooms, _occupancy_index=None, _log=None):
+    # type: (list[Room], list[int], OccupancyIndex | None, SolveLogger | None) -> None
+    """Set the number of bedrooms on each HB-Room (and update the OccupancyIndex, if one is given)."""
+    log = _log or print_all_logger()
     for hb_room, n_br in izip(_hb_rooms, _num_bedrooms):
         hbe_prop = getattr(hb_room.properties, "energy")  # type: RoomEnergyProperties
         people_prop_ph = getattr(hbe_prop.people.properties, "ph")  # type: PeoplePhProperties
         people_prop_ph.number_bedrooms = n_br
-        print("[{}] Setting Number of Bedrooms: {}".format(hb_room.display_name, n_br))
+        log.info("[{}] Setting Number of Bedrooms: {}", hb_room.display_name, n_br)
+        if _occupancy_index is not None:
+            _occupancy_index.update_occupancy(hb_room, _num_bedrooms=people_prop_ph.number_bedrooms)
     return None
 
 
-def set_number_of_people(_hb_rooms, _num_people):
-    # type: (list[Room], list[float]) -> None
-    """Set the number of people on each HB-Room."""
+def set_number_of_people(_hb_rooms, _num_people, _occupancy_index=None, _log=None):
+    # type: (list[Room], list[float], OccupancyIndex | None, SolveLogger | None) -> None
+    """Set the number of people on each HB-Room (and update the OccupancyIndex, if one is given)."""
+    log = _log or print_all_logger()
     for hb_room, n_ppl in izip(_hb_rooms, _num_people):
         hbe_prop = getattr(hb_room.properties, "energy")  # type: RoomEnergyProperties
         people_prop_ph = getattr(hbe_prop.people.properties, "ph")  # type: PeoplePhProperties
         people_prop_ph.number_people = n_ppl
-        print("[{}] Setting Number of People: {}".format(hb_room.display_name, n_ppl))
+        log.info("[{}] Setting Number of People: {}", hb_room.display_name, n_ppl)
+        if _occupancy_index is not None:
+            _occupancy_index.update_occupancy(hb_room, _num_occupants=people_prop_ph.number_people)
     return None
 
 
-def set_people_per_m2(_hb_rooms, _IGH):
-    # type: (list[Room], gh_io.IGH) -> None
+def set_people_per_m2(_hb_rooms, _IGH, _occupancy_index=None):
+    # type: (list[Room], gh_io.IGH, OccupancyIndex | None) -> None
     """Set the HB-Energy 'People' load on each HB-Room.
 
     The HBE Occupancy level is set uniformly across each 'dwelling': the group's total
@@ -109,19 +108,22 @@ def set_people_per_m2(_hb_rooms, _IGH):
           would smear occupants into Rooms the user gave zero people (a crawlspace, say),
           which is visible now that each Room is its own EnergyPlus Zone.
     Either way the model's TOTAL occupancy is identical -- only the distribution differs.
+
+    The group totals are read from the OccupancyIndex, which is built here if not given.
     """
+    if _occupancy_index is None:
+        _occupancy_index = RoomStatsCollection(_hb_rooms, _IGH).occupancy_index
+    log = get_logger(_IGH)
 
-    def _get_num_ppl(_hb_room):
-        # type: (Room) -> float
-        """Get the PH-Properties AVERAGE number of people in the room."""
-        hb_ppl = getattr(_hb_room.properties, "energy")  # type: RoomEnergyProperties
-        ppl_prop_ph = getattr(hb_ppl.people.properties, "ph")  # type: PeoplePhProperties
-        return ppl_prop_ph.number_people
+    for hb_room in _hb_rooms:
+        if not _occupancy_index.room_stats(hb_room).floor_area_m2:
+            _IGH.warning("Error: Room: '{}' has no floor surfaces?".format(hb_room.display_name))
 
     for room_group in group_rooms_by_dwelling(_hb_rooms):
         # -- Get 'Group' level total values
-        total_average_ph_ppl = sum(_get_num_ppl(rm) for rm in room_group)
-        total_floor_area_m2 = sum(_get_room_floor_area_m2(rm, _IGH) for rm in room_group)
+        group_totals = _occupancy_index.totals_of(room_group)
+        total_average_ph_ppl = group_totals.num_occupants
+        total_floor_area_m2 = group_totals.floor_area_m2
 
         # -- Set the 'People' load for each room in the 'Group'
         for hb_room in room_group:
@@ -133,18 +135,17 @@ def set_people_per_m2(_hb_rooms, _IGH):
             # so we can safely unlock the People load here.
             with unlocked(room_e_prop.people) as ppl:
                 ppl.people_per_area = people_per_area
-                print("[{}] Setting People/Area: {:.3f} ppl/m2".format(hb_room.display_name, people_per_area))
+                log.info("[{}] Setting People/Area: {:.3f} ppl/m2", hb_room.display_name, people_per_area)
     return
 
 
-def set_ph_res_occ_schedule(_hb_rooms):
-    # type: (list[Room]) -> None
+def set_ph_res_occ_schedule(_hb_rooms, _log=None):
+    # type: (list[Room], SolveLogger | None) -> None
     """Set the PH-Style Occupancy Schedule on each HB-Room."""
-    file_pth = os.path.join(
-        folders.python_package_path, "honeybee_ph_standards", "schedules", "hbph_sfh_occupancy.json"
-    )
-    occ_schd = load_schedules_from_json_file(file_pth)["hbph_sfh_Occupant_Presence"]
-    activity_schd = load_schedules_from_json_file(file_pth)["hbph_sfh_Occupant_Activity"]
+    log = _log or print_all_logger()
+    occupancy_schedules = load_schedules_file(os.path.join(default_schedules_directory(), "hbph_sfh_occupancy.json"))
+    occ_schd = occupancy_schedules["hbph_sfh_Occupant_Presence"]
+    activity_schd = occupancy_schedules["hbph_sfh_Occupant_Activity"]
 
     for hb_room in _hb_rooms:
         room_e_prop = getattr(hb_room.properties, "energy")  # type: RoomEnergyProperties
@@ -154,7 +155,7 @@ def set_ph_res_occ_schedule(_hb_rooms):
         # Note: we made sure to duplicate the room and the People before
         # so we can safely unlock the People load here.
         with unlocked(room_e_prop.people) as ppl:
-            print("[{}] Setting PH-Style Occupancy Schedules".format(hb_room.display_name))
+            log.info("[{}] Setting PH-Style Occupancy Schedules", hb_room.display_name)
             ppl.occupancy_schedule = occ_schd
             ppl.activity_schedule = activity_schd
 
@@ -254,10 +255,12 @@ class GHCompo_SetResOccupancy(object):
         if not self.all_rooms_have_HBE_People:
             return self.hb_rooms
 
+        log = get_logger(self.IGH)
         hb_rooms_ = self.duplicate_rooms(self.hb_rooms)
         if self.set_ph_res_schedule:
-            set_ph_res_occ_schedule(hb_rooms_)
-        set_number_of_bedrooms(hb_rooms_, self.number_bedrooms)
-        set_number_of_people(hb_rooms_, self.number_people)
-        set_people_per_m2(hb_rooms_, self.IGH)
+            set_ph_res_occ_schedule(hb_rooms_, log)
+        occupancy_index = RoomStatsCollection(hb_rooms_, self.IGH).occupancy_index
+        set_number_of_bedrooms(hb_rooms_, self.number_bedrooms, occupancy_index, log)
+        set_number_of_people(hb_rooms_, self.number_people, occupancy_index, log)
+        set_people_per_m2(hb_rooms_, self.IGH, occupancy_index)
         return hb_rooms_
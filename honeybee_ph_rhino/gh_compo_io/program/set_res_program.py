@@ -3,9 +3,6 @@
 
 """GHCompo Interface: HBPH - Set Residential Program."""
 
-import os
-from statistics import mean
-
 try:
     from Grasshopper import DataTree  # type: ignore
     from Grasshopper.Kernel.Data import GH_Path  # type: ignore
@@ -14,14 +11,12 @@ except ImportError:
     pass  # IronPython 2.7
 
 try:
-    from honeybee.config import folders
     from honeybee.room import Room
     from honeybee.typing import clean_and_id_ep_string
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
 
 try:
-    from honeybee_energy.lib.programtypes import building_program_type_by_identifier, program_type_by_identifier
     from honeybee_energy.lib.schedules import schedule_by_identifier
     from honeybee_energy.load.equipment import ElectricEquipment
     from honeybee_energy.load.hotwater import ServiceHotWater
@@ -46,6 +41,13 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
 
+try:
+    from honeybee_ph_rhino.gh_logger import SolveLogger, get_logger, print_all_logger
+    from honeybee_ph_rhino.schedule_stats import annual_mean
+    from honeybee_ph_rhino.unit_context import get_unit_context
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
 try:
     from ph_units.converter import convert
     from ph_units.parser import parse_input
@@ -53,6 +55,9 @@ except ImportError as e:
     raise ImportError("\nFailed to import ph_units:\n\t{}".format(e))
 
 try:
+    from honeybee_ph_rhino.gh_compo_io.program._get_room_data import OccupancyIndex, RoomStatsCollection
+    from honeybee_ph_rhino.gh_compo_io.program._load_pool import LoadPool
+    from honeybee_ph_rhino.gh_compo_io.program._program_catalogue import get_catalogue
     from honeybee_ph_rhino.gh_compo_io.program._schedules import SchedulesCollection
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
@@ -77,10 +82,7 @@ def get_program(_base_program):
         return ProgramType(clean_and_id_ep_string("HBPH_SFH_Program"))
 
     if isinstance(_base_program, str):
-        try:
-            _base_program = building_program_type_by_identifier(_base_program)
-        except ValueError:
-            _base_program = program_type_by_identifier(_base_program)
+        _base_program = get_catalogue().hb_program(_base_program)
     new_program = _base_program.duplicate()
     new_program.identifier = clean_and_id_ep_string("HBPH_SFH_Program")
     return new_program
@@ -95,7 +97,7 @@ def get_area_value_in_unit(_IGH, _input, _target_unit):
 
     # -- Otherwise use the Rhino document unit system as the input unit-type
     if not input_unit:
-        input_unit = _IGH.get_rhino_areas_unit_name()
+        input_unit = get_unit_context(_IGH).area_unit
 
     # -- convert the input value to Meters, always
     new_value = convert(input_value, input_unit, _target_unit)
@@ -106,19 +108,24 @@ def get_area_value_in_unit(_IGH, _input, _target_unit):
         return new_value
 
 
-def get_occupancy_values(_IGH, room_group):
-    # type: (gh_io.IGH, list[Room]) -> tuple[float, float]
+def get_occupancy_values(_IGH, room_group, _occupancy_index=None):
+    # type: (gh_io.IGH, list[Room], OccupancyIndex | None) -> tuple[float, float]
     num_bedrooms_ = 0
     num_people_ = 0
 
     # -- Try and get the PH-Style Occupancy, if it is set
-    for room in room_group:
-        prop_e = getattr(room.properties, "energy")  # type: RoomEnergyProperties
-        if not prop_e.people:
-            continue
-        pp_prop_ph = getattr(prop_e.people.properties, "ph")  # type: PeoplePhProperties
-        num_bedrooms_ += pp_prop_ph.number_bedrooms
-        num_people_ += pp_prop_ph.number_people
+    if _occupancy_index is not None:
+        group_totals = _occupancy_index.totals_of(room_group)
+        num_bedrooms_ = group_totals.num_bedrooms
+        num_people_ = group_totals.num_occupants
+    else:
+        for room in room_group:
+            prop_e = getattr(room.properties, "energy")  # type: RoomEnergyProperties
+            if not prop_e.people:
+                continue
+            pp_prop_ph = getattr(prop_e.people.properties, "ph")  # type: PeoplePhProperties
+            num_bedrooms_ += pp_prop_ph.number_bedrooms
+            num_people_ += pp_prop_ph.number_people
 
     # -- If no PH-Style info, try and use the HBE-Style Occupancy information to determine the right values
     if not num_people_:
@@ -129,16 +136,16 @@ def get_occupancy_values(_IGH, room_group):
             if not prop_e.people:
                 continue
             peak_ppl = prop_e.people.people_per_area * get_area_value_in_unit(_IGH, room.floor_area, "M2")
-            num_people_ += peak_ppl * mean(prop_e.people.occupancy_schedule.values())  # type: ignore
+            num_people_ += peak_ppl * annual_mean(prop_e.people.occupancy_schedule)  # type: ignore
 
         num_bedrooms_ = abs(num_people_ - 1) or 1
 
     return num_bedrooms_, num_people_
 
 
-def set_people(_people, gross_floor_area_m2, num_people, _presence_schedule, _activity_schedule):
-    # type: (People, float, float, ScheduleRuleset, ScheduleRuleset) -> People
-    """Reset the HBE-People Load Attributes."""
+def set_people(_people, gross_floor_area_m2, num_people, _presence_schedule, _activity_schedule, _log=None):
+    # type: (People, float, float, ScheduleRuleset, ScheduleRuleset, SolveLogger | None) -> People
+    """Reset the HBE-People Load Attributes. If no _log is given, every message is printed."""
     #
     # Note: For PH-Style residential occupancy, I think we should use the PH 'occupancy' as the 'peak' value,
     # even though it is really the 'average' value? If you have 2 BR, and an occupancy of '3',
@@ -154,15 +161,15 @@ def set_people(_people, gross_floor_area_m2, num_people, _presence_schedule, _ac
     new_ppl.identifier = clean_and_id_ep_string("HBPH_SFH_People")
     new_ppl.display_name = "HBPH_SFH_People"
     new_ppl.people_per_area = people_per_m2
-    print("Setting People Per Area: {:.4f}".format(people_per_m2))
+    (_log or print_all_logger()).info("Setting People Per Area: {:.4f}", people_per_m2)
     new_ppl.occupancy_schedule = _presence_schedule
     new_ppl.activity_schedule = _activity_schedule
     return new_ppl
 
 
-def set_interior_lighting(_lighting, _net_floor_area_ft2, _gross_floor_area_m2, _schedule, q_ffil=1.0):
-    # type: (Lighting, float, float, ScheduleRuleset, float) -> Lighting
-    """Reset the HBE-Lighting Attributes.
+def set_interior_lighting(_lighting, _net_floor_area_ft2, _gross_floor_area_m2, _schedule, q_ffil=1.0, _log=None):
+    # type: (Lighting, float, float, ScheduleRuleset, float, SolveLogger | None) -> Lighting
+    """Reset the HBE-Lighting Attributes. If no _log is given, every message is printed.
 
     ### Resnet 2014
     - https://codes.iccsafe.org/content/RESNET3012014P1/4-home-energy-rating-calculation-procedures-
@@ -185,7 +192,7 @@ def set_interior_lighting(_lighting, _net_floor_area_ft2, _gross_floor_area_m2,
     b = INT_LIGHTING_W_PER_DWELLING + (INT_LIGHTING_W_FT2 * _net_floor_area_ft2)
     annual_kWh = a * b * PHIUS_RESNET_FRACTION
     annual_Wh = annual_kWh * 1000
-    peak_watts = annual_Wh / mean(_schedule.values()) / 8760
+    peak_watts = annual_Wh / annual_mean(_schedule) / 8760
     peak_watts_per_m2 = peak_watts / _gross_floor_area_m2
 
     # -- Build the normal HBE-Lighting object
@@ -193,7 +200,7 @@ def set_interior_lighting(_lighting, _net_floor_area_ft2, _gross_floor_area_m2,
     hbe_lighting.identifier = clean_and_id_ep_string("HBPH_SFH_Lighting")
     hbe_lighting.display_name = "HBPH_SFH_Lighting"
     hbe_lighting.watts_per_area = peak_watts_per_m2
-    print("Setting Lighting Watts Per Area: {:.4f}".format(peak_watts_per_m2))
+    (_log or print_all_logger()).info("Setting Lighting Watts Per Area: {:.4f}", peak_watts_per_m2)
     hbe_lighting.schedule = _schedule
     hbe_lighting.return_air_fraction = 0.0
     hbe_lighting.radiant_fraction = 0.32
@@ -207,28 +214,28 @@ def set_interior_lighting(_lighting, _net_floor_area_ft2, _gross_floor_area_m2,
     return hbe_lighting
 
 
-def set_zero_MEL(_elec_equip):
-    # type: (ElectricEquipment) -> ElectricEquipment
+def set_zero_MEL(_elec_equip, _log=None):
+    # type: (ElectricEquipment, SolveLogger | None) -> ElectricEquipment
     """Reset the HBE-Electric-Equipment Attributes. All electric equipment should be set using Process-Load objects."""
 
     hbe_ee = _elec_equip.duplicate()  # type: ElectricEquipment # type: ignore
     hbe_ee.identifier = clean_and_id_ep_string("HBPH_SFH_Equipment")
     hbe_ee.display_name = "HBPH_SFH_ElectricEquipment"
     hbe_ee.watts_per_area = 0.0
-    print("Setting Electric Equipment Watts Per Area: 0.0")
+    (_log or print_all_logger()).info("Setting Electric Equipment Watts Per Area: 0.0")
     hbe_ee.schedule = schedule_by_identifier("Always On")
     return hbe_ee
 
 
-def set_infiltration(_infiltration, flow_per_ext_m2=0.0003):
-    # type: (Infiltration, float) -> Infiltration
+def set_infiltration(_infiltration, flow_per_ext_m2=0.0003, _log=None):
+    # type: (Infiltration, float, SolveLogger | None) -> Infiltration
     """Reset the HBE-Infiltration Attributes."""
 
     hbe_infiltration = _infiltration.duplicate()  # type: Infiltration # type: ignore
     hbe_infiltration.identifier = clean_and_id_ep_string("HBPH_PH_Infiltration")
     hbe_infiltration.display_name = "HBPH_SFH_Infiltration"
     hbe_infiltration.flow_per_exterior_area = flow_per_ext_m2
-    print("Setting Infiltration Flow Per Exterior Area: {:.6f}".format(flow_per_ext_m2))
+    (_log or print_all_logger()).info("Setting Infiltration Flow Per Exterior Area: {:.6f}", flow_per_ext_m2)
     hbe_infiltration.schedule = schedule_by_identifier("Always On")
     return hbe_infiltration
 
@@ -246,17 +253,18 @@ def set_ventilation(_ventilation):
     return hbe_ventilation
 
 
-def set_setpoint(_setpoint, _heating_schedule, _cooling_schedule, _dehumidifying_setpoint=60):
-    # type: (Setpoint, ScheduleRuleset, ScheduleRuleset, float) -> Setpoint
+def set_setpoint(_setpoint, _heating_schedule, _cooling_schedule, _dehumidifying_setpoint=60, _log=None):
+    # type: (Setpoint, ScheduleRuleset, ScheduleRuleset, float, SolveLogger | None) -> Setpoint
     """Reseet the HBE-Setpoint Attributes."""
+    log = _log or print_all_logger()
     new_setpoint = _setpoint.duplicate()  # type: Setpoint # type: ignore
     new_setpoint.identifier = clean_and_id_ep_string("HBPH_SFH_Setpoint")
     new_setpoint.heating_schedule = _heating_schedule
-    print("Setting Heating Setpoint Schedule: {} C".format(mean(_heating_schedule.values())))
+    log.info("Setting Heating Setpoint Schedule: {} C", annual_mean(_heating_schedule))
     new_setpoint.cooling_schedule = _cooling_schedule
-    print("Setting Cooling Setpoint Schedule: {} C".format(mean(_cooling_schedule.values())))
+    log.info("Setting Cooling Setpoint Schedule: {} C", annual_mean(_cooling_schedule))
     new_setpoint.dehumidifying_setpoint = _dehumidifying_setpoint
-    print("Setting Dehumidifying Setpoint: {} %RH".format(_dehumidifying_setpoint))
+    log.info("Setting Dehumidifying Setpoint: {} %RH", _dehumidifying_setpoint)
     return new_setpoint
 
 
@@ -362,11 +370,10 @@ class GHCompo_CreatePHProgramSingleFamilyHome(object):
 
     def __init__(self, _IGH, _hb_rooms):
         # type: (gh_io.IGH, list[Room]) -> None
-        self.schedules = SchedulesCollection(
-            os.path.join(folders.python_package_path, "honeybee_ph_standards", "schedules")
-        )
+        self.schedules = SchedulesCollection()
         self.IGH = _IGH
         self.hb_rooms = _hb_rooms
+        self.load_pool = LoadPool()
 
     @property
     def ready(self):
@@ -411,36 +418,74 @@ class GHCompo_CreatePHProgramSingleFamilyHome(object):
         Rather than create a new program, re-set the program values one at a time to ensure that we
         preserve any extension attributes (ph, revive, etc.)
         """
-        print("- " * 25)
-        print("Setting Loads and Schedules for HB-Room: {}".format(_hb_room.display_name))
+        log = get_logger(self.IGH)
+        log.info("Setting Loads and Schedules for HB-Room: {}", _hb_room.display_name)
 
+        # -- Rooms with the same inputs all share the same (locked) load objects.
+        pool = self.load_pool
+        args = (_gross_floor_area_m2, _net_floor_area_ft2, _num_occupants, _num_bedrooms)
         hb_prop_e = getattr(_hb_room.properties, "energy")  # type: RoomEnergyProperties
-        hb_prop_e.people = set_people(
-            hb_prop_e.people,
-            _gross_floor_area_m2,
-            _num_occupants,
-            self.schedules.occupancy_presence,
-            self.schedules.occupancy_activity,
+
+        people = hb_prop_e.people
+        hb_prop_e.people = pool.get(
+            "people",
+            people,
+            args,
+            lambda: set_people(
+                people,
+                _gross_floor_area_m2,
+                _num_occupants,
+                self.schedules.occupancy_presence,
+                self.schedules.occupancy_activity,
+                _log=log,
+            ),
         )
-        hb_prop_e.lighting = set_interior_lighting(
-            hb_prop_e.lighting,
-            _net_floor_area_ft2,
-            _gross_floor_area_m2,
-            self.schedules.lighting,
+        lighting = hb_prop_e.lighting
+        hb_prop_e.lighting = pool.get(
+            "lighting",
+            lighting,
+            args,
+            lambda: set_interior_lighting(
+                lighting,
+                _net_floor_area_ft2,
+                _gross_floor_area_m2,
+                self.schedules.lighting,
+                _log=log,
+            ),
         )
-        hb_prop_e.electric_equipment = set_zero_MEL(hb_prop_e.electric_equipment)
-        hb_prop_e.infiltration = set_infiltration(hb_prop_e.infiltration)
-        hb_prop_e.ventilation = set_ventilation(hb_prop_e.ventilation)
-        hb_prop_e.setpoint = set_setpoint(
-            hb_prop_e.setpoint,
-            self.schedules.heating_setpoint,
-            self.schedules.cooling_setpoint,
+        elec_equip = hb_prop_e.electric_equipment
+        hb_prop_e.electric_equipment = pool.get(
+            "electric_equipment", elec_equip, (), lambda: set_zero_MEL(elec_equip, _log=log)
         )
-        hb_prop_e.service_hot_water = set_shw(
-            hb_prop_e.service_hot_water,
-            _num_bedrooms,
-            _gross_floor_area_m2,
-            self.schedules.hot_water,
+        infiltration = hb_prop_e.infiltration
+        hb_prop_e.infiltration = pool.get(
+            "infiltration", infiltration, (), lambda: set_infiltration(infiltration, _log=log)
+        )
+        ventilation = hb_prop_e.ventilation
+        hb_prop_e.ventilation = pool.get("ventilation", ventilation, (), lambda: set_ventilation(ventilation))
+        setpoint = hb_prop_e.setpoint
+        hb_prop_e.setpoint = pool.get(
+            "setpoint",
+            setpoint,
+            (),
+            lambda: set_setpoint(
+                setpoint,
+                self.schedules.heating_setpoint,
+                self.schedules.cooling_setpoint,
+                _log=log,
+            ),
+        )
+        shw = hb_prop_e.service_hot_water
+        hb_prop_e.service_hot_water = pool.get(
+            "service_hot_water",
+            shw,
+            args,
+            lambda: set_shw(
+                shw,
+                _num_bedrooms,
+                _gross_floor_area_m2,
+                self.schedules.hot_water,
+            ),
         )
 
         return None
@@ -452,6 +497,8 @@ class GHCompo_CreatePHProgramSingleFamilyHome(object):
         if not self.ready:
             return hb_rooms_
 
+        log = get_logger(self.IGH)
+        occupancy_index = RoomStatsCollection(self.hb_rooms, self.IGH).occupancy_index
         room_groups = group_rooms_by_dwelling(self.hb_rooms)
         for i, room_group in enumerate(room_groups):
             dup_rooms = self.duplicate_rooms(room_group)
@@ -459,17 +506,25 @@ class GHCompo_CreatePHProgramSingleFamilyHome(object):
             # -- Figure out the reference values to use for this whole Dwelling
             gross_floor_area_m2 = self.get_gross_floor_area(dup_rooms)
             net_floor_area_ft2 = self.get_net_floor_area(dup_rooms)
-            num_bedrooms, num_occupants = get_occupancy_values(self.IGH, dup_rooms)
-
-            print("Room Group {}:".format(i))
-            print("  Gross Floor Area [m2]: {:.4f}".format(gross_floor_area_m2))
-            print("  Net Floor Area [ft2]: {:.4f}".format(net_floor_area_ft2))
-            print("  Number of Bedrooms: {}".format(num_bedrooms))
-            print("  Number of Occupants: {}".format(num_occupants))
+            num_bedrooms, num_occupants = get_occupancy_values(self.IGH, room_group, occupancy_index)
+
+            log.info(
+                "Room Group {}: Gross Floor Area [m2]: {:.4f} | Net Floor Area [ft2]: {:.4f} | "
+                "Number of Bedrooms: {} | Number of Occupants: {}",
+                i,
+                gross_floor_area_m2,
+                net_floor_area_ft2,
+                num_bedrooms,
+                num_occupants,
+            )
 
             # -- Create the Phius default Process Loads (Appliances)
-            default_process_loads = create_phius_default_equipment_set(
-                self.schedules, num_occupants, num_bedrooms, net_floor_area_ft2, len(dup_rooms)
+            default_process_loads = self.load_pool.get_list(
+                "process_loads",
+                (num_occupants, num_bedrooms, net_floor_area_ft2, len(dup_rooms)),
+                lambda: create_phius_default_equipment_set(
+                    self.schedules, num_occupants, num_bedrooms, net_floor_area_ft2, len(dup_rooms)
+                ),
             )
 
             for rm in dup_rooms:
@@ -488,12 +543,10 @@ class GHCompo_CreatePHProgramSingleFamilyHome(object):
                     msg = (
                         "HB-Room: {} already has {} Process Loads defined. "
                         "New Single-Family default process loads will be ADDED to these existing ones. "
-                        "In most cases, you should remove these existing process loads before adding the new ones.".format(
-                            rm.display_name, len(rm_prop_e.process_loads)
-                        )
+                        "In most cases, you should remove these existing process loads before adding the new ones."
                     )
-                    print(msg)
-                    self.IGH.warning(msg)
+                    log.warning(msg, rm.display_name, len(rm_prop_e.process_loads))
+                    self.IGH.warning(msg.format(rm.display_name, len(rm_prop_e.process_loads)))
                 for equip in default_process_loads:
                     rm_prop_e.add_process_load(equip)
 
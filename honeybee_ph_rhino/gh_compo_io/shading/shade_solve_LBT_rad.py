@@ -61,10 +61,15 @@ except ImportError as e:
 
 
 try:
-    from ph_units.converter import _standardize_unit_name, convert, unit_type_alias_dict
+    from ph_units.converter import _standardize_unit_name, unit_type_alias_dict
 except ImportError as e:
     raise ImportError("\nFailed to import ph_units:\n\t{}".format(e))
 
+try:
+    from honeybee_ph_rhino.unit_conversion import convert_values
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
 
 try:
     from ph_gh_component_io import gh_io
@@ -233,7 +238,7 @@ def radiation_in_rh_doc_unit(_radiation_kwh_m2, _unit_name):
         return _radiation_kwh_m2
     else:
         unit_name = "KWH/{}".format(area_unit_name)
-        return [convert(_, "KWH/M2", unit_name) or 0.0 for _ in _radiation_kwh_m2]
+        return [_ or 0.0 for _ in convert_values(_radiation_kwh_m2, "KWH/M2", unit_name)]
 
 
 def build_window_meshes(_window_surface, _grid_size, _shading_mesh_params, _window_mesh_params=None):
@@ -4,7 +4,7 @@
 """GHCompo Interface: HBPH - Create SHW Heater."""
 
 try:
-    from typing import Dict, Optional, Type
+    from typing import Dict, List, Optional, Type
 except ImportError:
     pass  # IronPython 2.7
 
@@ -16,6 +16,7 @@ except:
 
 try:
     from honeybee_ph_rhino import gh_io
+    from honeybee_ph_rhino.attr_input_map import batch_input_names, expand_batch_inputs, get_attr_input_map, run_batch
     from honeybee_ph_rhino.gh_io import ComponentInput
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
@@ -365,9 +366,12 @@ class GHCompo_CreateSHWHeater(object):
         heater_ = heater_class()  # type: hot_water_devices.PhHvacHotWaterHeater
 
         # -- Set all the attributes.
-        for attr_name in dir(heater_):
-            input_val = self.input_dict.get(attr_name, None)
-            if input_val:
-                setattr(heater_, attr_name, input_val)
+        get_attr_input_map(heater_).apply(heater_, self.input_dict)
 
         return heater_
+
+    def run_batch(self):
+        # type: () -> List[Optional[hot_water_devices.PhHvacHotWaterHeater]]
+        """Build a new heater for each item of the list inputs (see attr_input_map.expand_batch_inputs)."""
+        batch_names = batch_input_names(get_component_inputs(self.heater_type))
+        return run_batch(self, expand_batch_inputs(self.input_dict, batch_names))
@@ -72,7 +72,7 @@ class GHCompo_AddPHSpaces(object):
             hb_rooms_,
             un_hosted_spaces,
             open_rooms_,
-        ) = make_space.add_spaces_to_honeybee_rooms(spaces, self.hb_rooms, self.inherit_room_names)
+        ) = make_space.add_spaces_to_honeybee_rooms(spaces, self.hb_rooms, self.inherit_room_names, self.IGH.log)
 
         # ---------------------------------------------------------------------
         # -- Warn if any open rooms
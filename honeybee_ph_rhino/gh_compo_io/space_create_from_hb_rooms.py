@@ -13,11 +13,6 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
 
-try:
-    from ladybug_rhino.config import units_abbreviation
-except ImportError as e:
-    raise ImportError("\nFailed to import ladybug_rhino:\n\t{}".format(e))
-
 try:
     from honeybee_ph import space
 except ImportError as e:
@@ -47,7 +42,7 @@ class GHCompo_CreatePHSpacesFromHBRooms(object):
         # type: () -> str
         """Return the Rhino file's unit-type as a string abbreviation. ie: "Meter" -> "M", etc.."""
 
-        return units_abbreviation().upper()
+        return self.IGH.unit_context.length_unit
 
     def _default_height_in_local_units(self):
         # type: () -> Union[float, int]
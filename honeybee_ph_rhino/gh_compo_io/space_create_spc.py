@@ -27,7 +27,6 @@ except ImportError as e:
     raise ImportError("\nFailed to import ladybug_geometry:\n\t{}".format(e))
 
 try:
-    from ladybug_rhino.config import units_abbreviation
     from ladybug_rhino.fromgeometry import from_face3d
 except ImportError as e:
     raise ImportError("\nFailed to import ladybug_rhino:\n\t{}".format(e))
@@ -44,10 +43,15 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
 try:
-    from ph_units import converter, parser
+    from ph_units import converter
 except ImportError as e:
     raise ImportError("\nFailed to import ph_units:\n\t{}".format(e))
 
+try:
+    from honeybee_ph_rhino.unit_conversion import convert_many
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
 try:
     from honeybee_ph_rhino.gh_compo_io.space_create_vent_rates import SpacePhVentFlowRates
 except ImportError as e:
@@ -87,7 +91,7 @@ class GHCompo_CreatePHSpaces(object):
         # type: () -> str
         """Return the Rhino file's unit-type as a string abbreviation. ie: "Meter" -> "M", etc.."""
 
-        return units_abbreviation().upper()
+        return self.IGH.unit_context.length_unit
 
     @property
     def rh_doc_local_length_unit(self):
@@ -123,15 +127,10 @@ class GHCompo_CreatePHSpaces(object):
         # type: (DataTree[float | str | None]) -> DataTree[float | None]
         """Convert the input DataTree to the Rhino document unit-type."""
 
+        target_unit = self.rh_doc_local_area_unit
         new_tree = DataTree[Object]()
         for i in range(_input_tree.BranchCount):
-            for _input in _input_tree.Branch(i):
-                if _input is None:
-                    converted_input = None
-                else:
-                    converted_input = converter.convert(
-                        *parser.parse_input(_input), _target_unit=self.rh_doc_local_area_unit
-                    )
+            for converted_input in convert_many(_input_tree.Branch(i), target_unit):
                 new_tree.Add(converted_input, GH_Path(i))
         return new_tree
 
@@ -139,15 +138,10 @@ class GHCompo_CreatePHSpaces(object):
         # type: (DataTree[float | str | None]) -> DataTree[float | None]
         """Convert the input DataTree to the Rhino document unit-type."""
 
+        target_unit = self.rh_doc_local_length_unit
         new_tree = DataTree[Object]()
         for i in range(_input_tree.BranchCount):
-            for _input in _input_tree.Branch(i):
-                if _input is None:
-                    converted_input = None
-                else:
-                    converted_input = converter.convert(
-                        *parser.parse_input(_input), _target_unit=self.rh_doc_local_length_unit
-                    )
+            for converted_input in convert_many(_input_tree.Branch(i), target_unit):
                 new_tree.Add(converted_input, GH_Path(i))
         return new_tree
 
@@ -182,15 +176,16 @@ class GHCompo_CreatePHSpaces(object):
         ie: if the user inputs "15 m" will convert to the Rhino document unit-type.
         """
 
+        target_unit = self.rh_doc_unit_type_abbreviation
         new_tree = DataTree[_type]()  # type: DataTree[T]
         for i in range(_branch_count):
             try:
-                if not _input_tree.Branch(i):
+                # -- An empty item (None) is no height: a branch with none left gets the default.
+                branch = [_ for _ in _input_tree.Branch(i) if _ is not None]
+                if not branch:
                     new_tree.Add(_default_height, GH_Path(i))
 
-                for input_item in _input_tree.Branch(i):
-                    val, unit = parser.parse_input(input_item)
-                    converted_value = converter.convert(val, unit, self.rh_doc_unit_type_abbreviation)
+                for converted_value in convert_many(branch, target_unit):
                     new_tree.Add(converted_value, GH_Path(i))
             except ValueError:
                 new_tree.Add(_default_height, GH_Path(i))
@@ -74,7 +74,7 @@ class GHCompo_GetFloorSegData(object):
         # -- Get the GH-Component Input Object Attribute UserText values (if any)
         input_index_number = self.IGH.gh_compo_find_input_index_by_name(_input_node_name)
         input_guids = self.IGH.gh_compo_get_input_guids(input_index_number)
-        input_data = self.IGH.get_rh_obj_UserText_dict(input_guids)
+        input_data = self.IGH.get_rh_obj_UserText_dict(input_guids, _use_cache=True)
 
         # -- Build the FloorSegmentData objects, organize all the attributes.
         floor_segment_input_data = []  # type: (List[FloorSegmentData])
@@ -51,18 +51,13 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
-try:
-    from ph_units.converter import convert
-except ImportError as e:
-    raise ImportError("\nFailed to import ph_units:\n\t{}".format(e))
-
 
 class GHCompo_VisualizeWindowFrameElements(object):
     def __init__(self, _IGH, _apertures):
         # type: (gh_io.IGH, List[Aperture]) -> None
         self.IGH = _IGH
         self.apertures = _apertures
-        self.tolerance = _IGH.sc.doc.ModelAbsoluteTolerance
+        self.tolerance = _IGH.tolerance
 
     def get_edge_midpoint(self, _edge):
         # type: (LineCurve) -> Point3d
@@ -117,13 +112,14 @@ class GHCompo_VisualizeWindowFrameElements(object):
     def create_frame_surface(self, _ap_edges, _ap_frame_elements, ap_ctr_pt):
         # type: (Iterable[LineCurve], Iterable, Point3d) -> List[Brep]
         """Create the frame surfaces for the aperture."""
+        # -- From AirTable, and in Honeybee, width will ALWAYS be in meters.
+        doc_unit_type = self.IGH.get_rhino_unit_system_name()
+
         frame_surfaces = []
         for edge, frame in izip(_ap_edges, _ap_frame_elements):
 
             # -- Get the width in the Rhino-document's units
-            # -- From AirTable, and in Honeybee, width will ALWAYS be in meters.
-            doc_unit_type = self.IGH.get_rhino_unit_system_name()
-            width_in_doc_units = convert(frame.width, "M", doc_unit_type)
+            width_in_doc_units = self.IGH.unit_context.convert(frame.width, "M", doc_unit_type)
 
             crv_mid_pt = self.get_edge_midpoint(edge)
             extrusion_vector = self.IGH.ghc.Vector2Pt(crv_mid_pt, ap_ctr_pt, True).vector
@@ -16,7 +16,7 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
 
 try:
-    from honeybee_ph_rhino import gh_io
+    from honeybee_ph_rhino import gh_io, py3_worker
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
@@ -49,7 +49,7 @@ class GHCompo_WriteToPHPP(object):
         if self.write and self.hb_json_file:
             hb_python_site_packages = honeybee.config.folders.python_package_path
             stdout, stderr = run.write_hbjson_to_phpp(
-                self.hb_json_file, hb_python_site_packages, self.activate_variants
+                py3_worker.hbjson_file(self.hb_json_file), hb_python_site_packages, self.activate_variants
             )
             self.check_for_verification_version_warning(stdout)
         else:
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GHCompo Interface: HBPH - Write Exports."""
+
+try:
+    from typing import Any, Dict, List, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_ph_rhino import gh_io, py3_worker
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
+try:
+    from honeybee_ph_rhino.gh_compo_io.openph.run_openph_from_hbjson import GHCompo_RunOpenPhFromHBJSON
+    from honeybee_ph_rhino.gh_compo_io.write_metr_json import GHCompo_WriteMetrJson
+    from honeybee_ph_rhino.gh_compo_io.write_ppp import GHCompo_WritePPPFile
+    from honeybee_ph_rhino.gh_compo_io.write_wufi_xml_settings import WufiWriteSettings
+    from honeybee_ph_rhino.gh_compo_io.write_wuif_xml import GHCompo_WriteWufiXml
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino.gh_compo_io:\n\t{}".format(e))
+
+
+FORMATS = ("wufi_xml", "metr_json", "ppp", "openph")
+
+
+class GHCompo_WriteExports(object):
+    """GHCompo Interface: HBPH - Write Exports.
+
+    Writes any of the WUFI XML, METr JSON, PPP and OpenPH outputs from one HBJSON file (or
+    HB-Model). On the Py3 worker the HBJSON is read in once for all of them, and the WUFI XML and
+    METr JSON share one PhxProject. Without the worker, each output is written by its own
+    component's subprocess.
+    """
+
+    def __init__(self, _IGH, _filename, _save_folder, _hb_json_file, _settings, _formats, _write, *args, **kwargs):
+        # type: (gh_io.IGH, str, str, Any, Optional[WufiWriteSettings], Optional[List[str]], bool, *Any, **Any) -> None
+        self.IGH = _IGH
+        self.filename = _filename
+        self.save_folder = _save_folder
+        self.hb_json_file = _hb_json_file  # -- The HBJSON file path, or the HB-Model
+        self.settings = _settings or WufiWriteSettings()
+        self.formats = self.clean_formats(_formats)
+        self.write = _write
+
+    def clean_formats(self, _formats):
+        # type: (Optional[List[str]]) -> List[str]
+        """Return the valid, unique format names (all of them if none are given)."""
+        if not _formats:
+            return list(FORMATS)
+
+        formats_ = []
+        for export_format in _formats:
+            name = str(export_format).strip().lower()
+            if name not in FORMATS:
+                self.IGH.error("Unknown export format: '{}'. Use one of: {}".format(export_format, FORMATS))
+            elif name not in formats_:
+                formats_.append(name)
+        return formats_
+
+    def give_user_warnings(self, _stdout):
+        # type: (str) -> None
+        """Give user warnings if any."""
+        for line in _stdout.split("\n"):
+            if "WARNING" in line:
+                self.IGH.warning(line)
+
+    @property
+    def job_payload(self):
+        # type: () -> Dict[str, Any]
+        """The inputs for the 'export' job on the Py3 worker."""
+        payload = py3_worker.hbjson_payload(self.hb_json_file)
+        payload.update(
+            {
+                "group_components": self.settings.group_components,
+                "merge_faces": self.settings.merge_faces,
+                "merge_spaces_by_erv": self.settings.merge_spaces_by_erv,
+                "merge_exhaust_vent_devices": self.settings.merge_exhaust_vent_devices,
+                "log_level": self.settings.generate_log_files,
+                "targets": [
+                    {"format": f, "filename": self.filename, "save_folder": self.save_folder} for f in self.formats
+                ],
+            }
+        )
+        return payload
+
+    def run_each(self):
+        # type: () -> Dict[str, Optional[str]]
+        """Write each output with its own component (one subprocess each), with the Py3 worker turned off."""
+        with py3_worker.disabled(self.IGH.scriptcontext):
+            return self._run_each()
+
+    def _run_each(self):
+        # type: () -> Dict[str, Optional[str]]
+        hb_json_file = py3_worker.hbjson_file(self.hb_json_file)
+        outputs_ = {}  # type: Dict[str, Optional[str]]
+        if "wufi_xml" in self.formats:
+            outputs_["wufi_xml"] = GHCompo_WriteWufiXml(
+                self.IGH, self.filename, self.save_folder, hb_json_file, self.settings, True
+            ).run()
+        if "metr_json" in self.formats:
+            outputs_["metr_json"] = GHCompo_WriteMetrJson(
+                self.IGH, self.filename, self.save_folder, hb_json_file, self.settings, True
+            ).run()
+        if "ppp" in self.formats:
+            outputs_["ppp"] = GHCompo_WritePPPFile(self.IGH, hb_json_file, self.filename, self.save_folder, True).run()
+        if "openph" in self.formats:
+            GHCompo_RunOpenPhFromHBJSON(self.IGH, self.save_folder, hb_json_file, True).run()
+            outputs_["openph"] = self.save_folder
+        return outputs_
+
+    def run(self):
+        # type: () -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]
+        if not (self.write and self.hb_json_file and self.formats):
+            return None, None, None, None
+
+        response = py3_worker.run_job(self.IGH, "export", self.job_payload)
+        if response is None:
+            outputs_ = self.run_each()
+        else:
+            # -- The worker's warnings come grouped in its diagnostics file, not from the stdout
+            diagnostics_given = py3_worker.give_user_diagnostics(self.IGH, response)
+            py3_worker.raise_for_stderr(response["stderr"])
+            if not diagnostics_given:
+                self.give_user_warnings(response["stdout"])
+            outputs_ = dict(zip(self.formats, response["result"]["files"]))
+
+        return (
+            outputs_.get("wufi_xml", None),
+            outputs_.get("metr_json", None),
+            outputs_.get("ppp", None),
+            outputs_.get("openph", None),
+        )
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GHCompo Interface: HBPH - Write HBJSON."""
+
+import os
+
+try:
+    from typing import Any, Optional
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_ph_rhino import gh_io, hbjson_io
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
+
+# -- layout: file extension
+LAYOUTS = {
+    "json": ".hbjson",
+    "gzip": ".hbjson.gz",
+    "chunked": ".hbjsonz",
+}
+
+
+class GHCompo_WriteHBJSON(object):
+    """GHCompo Interface: HBPH - Write HBJSON.
+
+    Writes the HB-Model to a plain, gzip-compressed or chunked HBJSON file (see hbjson_io.py).
+    The default is plain JSON, the only layout the other LBT / Honeybee tools read. The
+    Honeybee-PH export components and the Py3 worker read all three. Zstandard is not
+    offered, since it is not available in Rhino's IronPython.
+    """
+
+    def __init__(self, _IGH, _hb_model, _filename, _save_folder, _layout, _write, *args, **kwargs):
+        # type: (gh_io.IGH, Any, Optional[str], str, Optional[str], bool, *Any, **Any) -> None
+        self.IGH = _IGH
+        self.hb_model = _hb_model
+        self.filename = _filename
+        self.save_folder = _save_folder
+        self.layout = str(_layout or "json").strip().lower()
+        self.write = _write
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        if not (self.write and self.hb_model and self.save_folder):
+            return False
+        if self.layout not in LAYOUTS:
+            self.IGH.error("Unknown HBJSON layout: '{}'. Use one of: {}".format(self.layout, sorted(LAYOUTS)))
+            return False
+        return True
+
+    @property
+    def file_path(self):
+        # type: () -> str
+        filename = self.filename or self.hb_model.identifier
+        return os.path.join(self.save_folder, "{}{}".format(filename, LAYOUTS[self.layout]))
+
+    def run(self):
+        # type: () -> Optional[str]
+        if not self.ready:
+            return None
+
+        if not os.path.exists(self.save_folder):
+            os.makedirs(self.save_folder)
+        return hbjson_io.write_hbjson(self.hb_model.to_dict(), self.file_path, self.layout)
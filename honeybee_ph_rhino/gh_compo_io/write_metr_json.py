@@ -6,12 +6,12 @@
 import os
 
 try:
-    from typing import Any, Optional
+    from typing import Any, Dict, Optional
 except ImportError:
     pass  # IronPython 2.7
 
 try:
-    from honeybee_ph_rhino import gh_io
+    from honeybee_ph_rhino import gh_io, py3_worker
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
@@ -30,11 +30,11 @@ class GHCompo_WriteMetrJson(object):
     """GHCompo Interface: HBPH - Write METr JSON."""
 
     def __init__(self, _IGH, _filename, _save_folder, _hb_json_file, _settings, _write_json, *args, **kwargs):
-        # type: (gh_io.IGH, str, str, str, Optional[WufiWriteSettings], bool, *Any, **Any) -> None
+        # type: (gh_io.IGH, str, str, Any, Optional[WufiWriteSettings], bool, *Any, **Any) -> None
         self.IGH = _IGH
         self.filename = _filename
         self.save_folder = _save_folder
-        self.hb_json_file = _hb_json_file
+        self.hb_json_file = _hb_json_file  # -- The HBJSON file path, or the HB-Model
         self.settings = _settings or WufiWriteSettings()
         self.write_json = _write_json
 
@@ -53,20 +53,47 @@ class GHCompo_WriteMetrJson(object):
             if "ERROR" in line:
                 self.IGH.error(line)
 
+    @property
+    def job_payload(self):
+        # type: () -> Dict[str, Any]
+        """The inputs for the 'metr_json' job on the Py3 worker."""
+        payload = py3_worker.hbjson_payload(self.hb_json_file)
+        payload.update(
+            {
+                "filename": self.filename,
+                "save_folder": self.save_folder,
+                "group_components": self.settings.group_components,
+                "merge_faces": self.settings.merge_faces,
+                "merge_spaces_by_erv": self.settings.merge_spaces_by_erv,
+                "merge_exhaust_vent_devices": self.settings.merge_exhaust_vent_devices,
+                "log_level": self.settings.generate_log_files,
+            }
+        )
+        return payload
+
     def run(self):
         # type: () -> Optional[str]
         if self.write_json and self.hb_json_file and self.settings:
             print("Logging with log-level: {}".format(self.settings.generate_log_files))
-            save_dir, save_filename, stdout, stderr = PHX.run.convert_hbjson_to_METR_JSON(
-                self.hb_json_file,
-                self.filename,
-                self.save_folder,
-                self.settings.group_components,
-                self.settings.merge_faces,
-                self.settings.merge_spaces_by_erv,
-                self.settings.merge_exhaust_vent_devices,
-                self.settings.generate_log_files,
-            )
+            response = py3_worker.run_job(self.IGH, "metr_json", self.job_payload)
+            if response is None:
+                save_dir, save_filename, stdout, stderr = PHX.run.convert_hbjson_to_METR_JSON(
+                    py3_worker.hbjson_file(self.hb_json_file),
+                    self.filename,
+                    self.save_folder,
+                    self.settings.group_components,
+                    self.settings.merge_faces,
+                    self.settings.merge_spaces_by_erv,
+                    self.settings.merge_exhaust_vent_devices,
+                    self.settings.generate_log_files,
+                )
+            else:
+                # -- The worker's warnings come grouped in its diagnostics file, not from the stdout
+                diagnostics_given = py3_worker.give_user_diagnostics(self.IGH, response)
+                py3_worker.raise_for_stderr(response["stderr"])
+                save_dir, save_filename = self.save_folder, self.filename
+                stdout = "" if diagnostics_given else response["stdout"]
+                stderr = response["stderr"]
             self.give_user_warnings(stdout)
             self.give_user_errors(stderr)
             save_filename += ".json"
@@ -11,7 +11,7 @@ except ImportError:
     pass  # IronPython 2.7
 
 try:
-    from honeybee_ph_rhino import gh_io
+    from honeybee_ph_rhino import gh_io, py3_worker
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
@@ -25,11 +25,11 @@ class GHCompo_WritePPPFile(object):
     """GHCompo Interface: HBPH - Write PPP File."""
 
     def __init__(self, _IGH, _hb_json_file, _filename, _save_folder, _write, *args, **kwargs):
-        # type: (gh_io.IGH, str, str, str, bool, *Any, **Any) -> None
+        # type: (gh_io.IGH, Any, str, str, bool, *Any, **Any) -> None
         self.IGH = _IGH
         self.filename = _filename
         self.save_folder = _save_folder
-        self.hb_json_file = _hb_json_file
+        self.hb_json_file = _hb_json_file  # -- The HBJSON file path, or the HB-Model
         self.write = _write
 
     def give_user_warnings(self, _stdout):
@@ -42,11 +42,21 @@ class GHCompo_WritePPPFile(object):
     def run(self):
         # type: () -> str | None
         if self.write and self.hb_json_file:
-            save_dir, save_filename, stdout, stderr = PHX.run.write_hbjson_to_ppp(
-                self.hb_json_file,
-                self.filename,
-                self.save_folder,
-            )
+            payload = py3_worker.hbjson_payload(self.hb_json_file)
+            payload.update({"filename": self.filename, "save_folder": self.save_folder})
+            response = py3_worker.run_job(self.IGH, "ppp", payload)
+            if response is None:
+                save_dir, save_filename, stdout, stderr = PHX.run.write_hbjson_to_ppp(
+                    py3_worker.hbjson_file(self.hb_json_file),
+                    self.filename,
+                    self.save_folder,
+                )
+            else:
+                # -- The worker's warnings come grouped in its diagnostics file, not from the stdout
+                diagnostics_given = py3_worker.give_user_diagnostics(self.IGH, response)
+                py3_worker.raise_for_stderr(response["stderr"])
+                save_dir, save_filename = self.save_folder, self.filename
+                stdout = "" if diagnostics_given else response["stdout"]
             self.give_user_warnings(stdout)
             save_filename += ".ppp"
             ppp_file_ = os.path.join(save_dir, save_filename)
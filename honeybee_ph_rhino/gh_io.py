@@ -49,6 +49,7 @@ except ImportError:
 
 try:
     from ladybug_geometry.geometry3d.face import Face3D
+    from ladybug_rhino.config import units_abbreviation
     from ladybug_rhino.fromgeometry import from_face3d, from_linesegment3d, from_mesh3d, from_point3d, from_polyline3d
     from ladybug_rhino.togeometry import to_face3d, to_linesegment3d, to_mesh3d, to_point3d, to_polyline3d
 except ImportError:
@@ -59,6 +60,18 @@ try:
 except ImportError:
     raise ImportError("Failed to import honeybee_ph_utils")
 
+try:
+    from honeybee_ph_rhino import geometry_kernel, gh_logger, rh_user_text
+    from honeybee_ph_rhino.geometry_conversion import TypeDispatchConverter, to_number_or_str
+    from honeybee_ph_rhino.unit_context import UnitContext
+except ImportError as e:
+    raise ImportError("Failed to import honeybee_ph_rhino modules:\n\t{}".format(e))
+
+try:
+    from honeybee_ph_rhino.gh_profiler import SolveProfiler
+except ImportError:
+    pass  # Type-hints only
+
 
 class LBTGeometryConversionError(Exception):
     def __init__(self, _in):
@@ -91,6 +104,11 @@ class IGH:
         self.rhinoscriptsyntax = _rs
         self.ghpythonlib_components = _ghc
         self.Grasshopper = _gh
+        self.profiler = None  # type: Optional[SolveProfiler]
+        self._to_LBT_converter = None  # type: Optional[TypeDispatchConverter]
+        self._to_rhino_converter = None  # type: Optional[TypeDispatchConverter]
+        self._unit_context = None  # type: Optional[UnitContext]
+        self._log = None  # type: Optional[gh_logger.SolveLogger]
 
     @property
     def rs(self):
@@ -107,6 +125,26 @@ class IGH:
         """Convenience Attribute Alias."""
         return self.scriptcontext
 
+    def profile_count(self, _key, _n=1):
+        # type: (str, int) -> None
+        """Add to a solve-profile counter. Does nothing unless profiling is switched on (see gh_profiler)."""
+        if self.profiler:
+            self.profiler.count(_key, _n)
+
+    def profile_peak(self, _key, _value):
+        # type: (str, int) -> None
+        """Record a solve-profile peak object-count. Does nothing unless profiling is switched on (see gh_profiler)."""
+        if self.profiler:
+            self.profiler.peak(_key, _value)
+
+    @property
+    def log(self):
+        # type: () -> gh_logger.SolveLogger
+        """The levelled, rate-limited logger for the solve. Use this instead of print() inside loops (see gh_logger)."""
+        if self._log is None:
+            self._log = gh_logger.new_logger(self.scriptcontext)
+        return self._log
+
     def DataTree(self, _type=Object):
         # type: (Any) -> Any
         """Facade for Grasshopper.DataTree[_type]"""
@@ -207,8 +245,8 @@ class IGH:
         finally:
             self.scriptcontext.doc = self.ghdoc
 
-    def get_rh_obj_UserText_dict(self, _rh_obj_guids):
-        # type: (System.guid) -> List[Dict]
+    def get_rh_obj_UserText_dict(self, _rh_obj_guids, _use_cache=False):
+        # type: (System.guid, bool) -> List[Dict]
         """
         Get any Rhino-side UserText attribute data for the Object/Elements.
         Note: this only works in Rhino v6.0+ I believe...
@@ -216,6 +254,8 @@ class IGH:
         Arguments:
         ----------
             _rh_obj_guids (list[Rhino Guid]): The Rhino Guid(s) of the Object/Elements.
+            _use_cache (bool): Default=False. Set True to re-use the UserText read during
+                earlier solves, for any object which has not been modified since. See rh_user_text.
 
         Returns:
         --------
@@ -223,35 +263,14 @@ class IGH:
                 in the Rhino object's UserText library.
         """
 
-        def is_grasshopper_geometry(_guid):
-            """If its GH generated geom, will have this GUID always"""
-            return str(_guid) == "00000000-0000-0000-0000-000000000000"
-
         if not _rh_obj_guids:
             return []
         if not isinstance(_rh_obj_guids, list):
             _rh_obj_guids = [_rh_obj_guids]
 
-        output_list = []
+        cache = rh_user_text.get_cache(self.scriptcontext, self.Rhino) if _use_cache else None
         with self.context_rh_doc():
-            for guid in _rh_obj_guids:
-                if not guid or is_grasshopper_geometry(guid):
-                    output_list.append({"Object Name": None})
-                else:
-                    # -- Go get the data from Rhino
-                    rh_obj = self.Rhino.RhinoDoc.ActiveDoc.Objects.Find(guid)
-                    object_rh_UserText_dict = {
-                        k: self.rhinoscriptsyntax.GetUserText(rh_obj, k)
-                        for k in self.rhinoscriptsyntax.GetUserText(rh_obj)
-                    }
-
-                    # -- Fix the name
-                    object_name = self.rhinoscriptsyntax.ObjectName(guid)
-                    object_rh_UserText_dict["Object Name"] = object_name
-
-                    output_list.append(object_rh_UserText_dict)
-
-        return output_list
+            return rh_user_text.read_user_text_dicts(self.Rhino.RhinoDoc.ActiveDoc, _rh_obj_guids, cache)
 
     def convert_to_LBT_geom(self, _inputs):
         # type: (List[Any]) -> List[List]
@@ -270,37 +289,29 @@ class IGH:
             * list[list]: The input (RH/GH) geometry, converted to LBT-Geometry
         """
 
-        if not isinstance(_inputs, list):
-            _inputs = [_inputs]
-        lbt_geometry = []
-        for i, _ in enumerate(_inputs):
-            if isinstance(_, list):
-                for __ in _:
-                    result = self.convert_to_LBT_geom(__)
-                    lbt_geometry.append(result)
-            elif isinstance(_, (str, int, float)):
-                try:
-                    lbt_geometry.append(float(str(_)))
-                except ValueError:
-                    lbt_geometry.append(str(_))
-            elif isinstance(_, bool):
-                lbt_geometry.append(_)
-            elif isinstance(_, self.Rhino.Geometry.Brep):
-                lbt_geometry.append(to_face3d(_))
-            elif isinstance(_, self.Rhino.Geometry.PolylineCurve):
-                lbt_geometry.append(to_polyline3d(_))
-            elif isinstance(_, self.Rhino.Geometry.LineCurve):
-                lbt_geometry.append(to_linesegment3d(_))
-            elif isinstance(_, self.Rhino.Geometry.Line):
-                lbt_geometry.append(to_linesegment3d(self.Rhino.Geometry.LineCurve(_)))
-            elif isinstance(_, self.Rhino.Geometry.Mesh):
-                lbt_geometry.append(to_mesh3d(_))
-            elif isinstance(_, self.Rhino.Geometry.Point3d):
-                lbt_geometry.append(to_point3d(_))
-            else:
-                raise LBTGeometryConversionError(_)
+        return self.to_LBT_converter.convert(_inputs)
 
-        return lbt_geometry
+    @property
+    def to_LBT_converter(self):
+        # type: () -> TypeDispatchConverter
+        """The (type-cached) RH/GH -> LBT converter used by convert_to_LBT_geom()."""
+        if self._to_LBT_converter is None:
+            rg = self.Rhino.Geometry
+            self._to_LBT_converter = TypeDispatchConverter(
+                [
+                    # -- bool is a subclass of int, and has always come back as a string
+                    (bool, str),
+                    ((str, int, float), to_number_or_str),
+                    (rg.Brep, to_face3d),
+                    (rg.PolylineCurve, to_polyline3d),
+                    (rg.LineCurve, to_linesegment3d),
+                    (rg.Line, lambda _: to_linesegment3d(rg.LineCurve(_))),
+                    (rg.Mesh, to_mesh3d),
+                    (rg.Point3d, to_point3d),
+                ],
+                LBTGeometryConversionError,
+            )
+        return self._to_LBT_converter
 
     def convert_to_rhino_geom(self, _inputs):
         # type: (List) -> List
@@ -315,23 +326,21 @@ class IGH:
             * list: The input LBT geometry, converted to Rhino-Geometry
         """
 
-        if not isinstance(_inputs, list):
-            _inputs = [_inputs]
-
-        rh_geom = []
-        for _ in _inputs:
-            if isinstance(_, list):
-                for __ in _:
-                    result = self.convert_to_rhino_geom(__)
-                    rh_geom.append(result)
-            elif isinstance(_, honeybee.face.Face):
-                rh_geom.append(from_face3d(_.geometry))
-            elif isinstance(_, honeybee.face.Face3D):
-                rh_geom.append(from_face3d(_))
-            else:
-                raise Exception('Input Error: Cannot convert "{}" to Rhino Geometry.'.format(type(_)))
+        return self.to_rhino_converter.convert(_inputs)
 
-        return rh_geom
+    @property
+    def to_rhino_converter(self):
+        # type: () -> TypeDispatchConverter
+        """The (type-cached) LBT -> RH converter used by convert_to_rhino_geom()."""
+        if self._to_rhino_converter is None:
+            self._to_rhino_converter = TypeDispatchConverter(
+                [
+                    (honeybee.face.Face, lambda _: from_face3d(_.geometry)),
+                    (honeybee.face.Face3D, from_face3d),
+                ],
+                lambda _: Exception('Input Error: Cannot convert "{}" to Rhino Geometry.'.format(type(_))),
+            )
+        return self._to_rhino_converter
 
     def inset_LBT_face(self, _lbt_face, _inset_distance):
         # type: (honeybee.face.Face, float) -> List
@@ -352,40 +361,8 @@ class IGH:
         if _inset_distance < 0.001:
             return rh_floor_surface
 
-        # -----------------------------------------------------------------------
-        srfcPerim = self.ghpythonlib_components.JoinCurves(
-            self.ghpythonlib_components.BrepEdges(rh_floor_surface)[0], preserve=False
-        )
-
-        # Get the inset Curve
-        # -----------------------------------------------------------------------
-        srfcCentroid = self.Rhino.Geometry.AreaMassProperties.Compute(rh_floor_surface).Centroid
-        plane = self.ghpythonlib_components.XYPlane(srfcCentroid)
-        plane = self.ghpythonlib_components.IsPlanar(rh_floor_surface, True).plane
-        srfcPerim_Inset_Pos = self.ghpythonlib_components.OffsetCurve(srfcPerim, _inset_distance, plane, 1)
-        srfcPerim_Inset_Neg = self.ghpythonlib_components.OffsetCurve(srfcPerim, _inset_distance * -1, plane, 1)
-
-        # Choose the right Offset Curve. The one with the smaller area
-        # Check IsPlanar first to avoid self.grasshopper_components.BoundarySurfaces error
-        # -----------------------------------------------------------------------
-        if srfcPerim_Inset_Pos.IsPlanar:
-            srfcInset_Pos = self.ghpythonlib_components.BoundarySurfaces(srfcPerim_Inset_Pos)
-        else:
-            srfcInset_Pos = self.ghpythonlib_components.BoundarySurfaces(srfcPerim)  # Use the normal perim
-
-        if srfcPerim_Inset_Neg.IsPlanar():
-            srfcInset_Neg = self.ghpythonlib_components.BoundarySurfaces(srfcPerim_Inset_Neg)
-        else:
-            srfcInset_Neg = self.ghpythonlib_components.BoundarySurfaces(srfcPerim)  # Use the normal perim
-
-        # -----------------------------------------------------------------------
-        area_Pos = self.ghpythonlib_components.Area(srfcInset_Pos).area
-        area_neg = self.ghpythonlib_components.Area(srfcInset_Neg).area
-
-        if area_Pos < area_neg:
-            return self.convert_to_LBT_geom(srfcInset_Pos)
-        else:
-            return self.convert_to_LBT_geom(srfcInset_Neg)
+        inset_breps = [geometry_kernel.inset_brep(brep, _inset_distance, self.tolerance) for brep in rh_floor_surface]
+        return self.convert_to_LBT_geom(inset_breps)
 
     def merge_Face3D(self, _face3Ds):
         # type: (List[honeybee.face.Face3D]) -> List[List[honeybee.face.Face3D] ]
@@ -393,7 +370,7 @@ class IGH:
 
         This *should* work on surfaces that are touching, AND ones that overlap. Using
         GH MergeFaces() only works on 'touching' surfaces, but not overlapping ones.
-        Using 'RegionUnion' should work on both touching and overlapping surfaces.
+        Using a boolean-union of the perimeter curves works on both touching and overlapping surfaces.
 
         Arguments:
         ----------
@@ -404,19 +381,11 @@ class IGH:
             * (list[list[honeybee.face.Face3D]]): The merged Face3Ds
         """
 
-        # -- Pull out the Perimeter curves from each Face3D
-        perims = []
-        for face3D in _face3Ds:
-            rh_brep = self.convert_to_rhino_geom(face3D)
-            faces, edges, vertices = self.ghpythonlib_components.DeconstructBrep(rh_brep)
-            perims.append(self.ghpythonlib_components.JoinCurves(edges, True))
-
-        joined_curves = self.ghpythonlib_components.RegionUnion(perims)
+        # -- Pull out the Perimeter curves from each Face3D, and union them together
+        rh_breps = [from_face3d(face3D) for face3D in _face3Ds]
+        joined_curves = geometry_kernel.merged_perimeter_curves(rh_breps, self.tolerance)
 
-        if not isinstance(joined_curves, list):
-            joined_curves = [joined_curves]
-
-        # -- Intersect and Merge the Perimeter Curves back together, make new Face3Ds
+        # -- Make new Face3Ds from the merged Perimeter Curves
         new_LBT_face3ds = []
         for crv in joined_curves:
             merged_breps = self.Rhino.Geometry.Brep.CreatePlanarBreps(crv, 0.01)
@@ -430,14 +399,7 @@ class IGH:
     def extrude_Face3D_WorldZ(self, _face3D, _dist=2.5):
         # type: (List[Face3D], float) -> List[Face3D]
         """Returns a list of Face3D surfaces representing a closed brep extrusion of the base Face3D"""
-        extrusion_vector = self.ghpythonlib_components.UnitZ(_dist)
-        rh_brep = from_face3d(_face3D)
-        volume_geom = self.ghpythonlib_components.Extrude(rh_brep, extrusion_vector)
-        try:
-            volume_geom = volume_geom.ToBrep()
-        except AttributeError:
-            pass
-
+        volume_geom = geometry_kernel.extrude_brep_world_z(from_face3d(_face3D), _dist)
         return self.convert_to_LBT_geom(volume_geom)[0]
 
     def error(self, _in):
@@ -464,10 +426,29 @@ class IGH:
             level = self.Grasshopper.Kernel.GH_RuntimeMessageLevel.Remark
             self.ghenv.Component.AddRuntimeMessage(level, _in)
 
+    @property
+    def unit_context(self):
+        # type: () -> UnitContext
+        """The Rhino document's units, tolerance and conversion factors, read once per solve."""
+        if self._unit_context is None:
+            length_unit = units_abbreviation().upper()
+            self._unit_context = UnitContext(
+                str(self.sc.doc.ModelUnitSystem),
+                length_unit,
+                "{}2".format(length_unit),
+                self.sc.doc.ModelAbsoluteTolerance,
+            )
+        return self._unit_context
+
     def get_rhino_unit_system_name(self):
         # type: () -> str
         """Returns the Rhino Unit System Name as a string."""
-        return str(self.sc.doc.ModelUnitSystem)
+        return self.unit_context.unit_system_name
+
+    def get_rhino_areas_unit_name(self):
+        # type: () -> str
+        """Returns the Rhino Unit System's area unit abbreviation as a string. ie: "Meters" -> "M2"."""
+        return self.unit_context.area_unit
 
     def duplicate_data_to_branches(self, _data, _branch_count=1, _shallow=True):
         # type: (List[Any], int, bool) -> DataTree[Object]
@@ -496,7 +477,7 @@ class IGH:
     @property
     def tolerance(self):
         # type: () -> float
-        return self.scriptcontext.doc.ModelAbsoluteTolerance
+        return self.unit_context.tolerance
 
 
 class ComponentInput:
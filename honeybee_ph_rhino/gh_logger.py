@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Levelled, rate-limited logger for the Honeybee-PH Grasshopper Components.
+
+Grasshopper keeps everything a component prints in its output buffer. A worker which prints
+one line per room, per space or per value can fill that buffer with thousands of lines on a
+large model, and the printing itself takes a real share of the solve time.
+
+Each IGH has a SolveLogger ('IGH.log'). Messages are logged with a format-string and its
+arguments, ie:
+
+>>> IGH.log.info("Hosting Space: {} in HB-Room: {}", space.full_name, room.display_name)
+
+Messages below the logger's level are not printed, only counted. Messages at or above the
+level are printed, but only the first few times for each format-string. After the worker's
+run() the logger prints one summary line for each format-string that was not fully shown,
+ie: "[INFO] x1250: Hosting Space: {} in HB-Room: {}". A message is only formatted if it is
+printed or written to the log-file.
+
+The default level is WARNING, so the per-item INFO messages only show up in the summary.
+Change the level for the Rhino session from any GHPython component with:
+
+>>> import scriptcontext as sc
+>>> from honeybee_ph_rhino import gh_logger
+>>> gh_logger.set_level(sc, "INFO")
+
+or set the 'HBPH_LOG_LEVEL' environment variable before starting Rhino. To also write every
+message (at any level) to a file, use 'gh_logger.set_log_file(sc, path)' or the
+'HBPH_LOG_FILE' environment variable.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+try:
+    from typing import Any, Dict, List, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+LEVEL_STICKY_KEY = "HBPH_LOG_LEVEL"
+LEVEL_ENV_VAR = "HBPH_LOG_LEVEL"
+FILE_STICKY_KEY = "HBPH_LOG_FILE"
+FILE_ENV_VAR = "HBPH_LOG_FILE"
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS = {v: k for k, v in LEVEL_NAMES.items()}
+
+DEFAULT_LEVEL = WARNING
+DEFAULT_MAX_REPEATS = 3  # times the same format-string is printed before it is only counted
+
+
+def to_level(_level):
+    # type: (Any) -> int
+    """Return the int level for a level name (ie: "INFO") or number. Raises ValueError if not valid."""
+    try:
+        return int(_level)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return LEVELS[str(_level).strip().upper()]
+    except KeyError:
+        raise ValueError("Unknown log level: '{}'. Use one of: {}".format(_level, sorted(LEVELS, key=LEVELS.get)))
+
+
+# -----------------------------------------------------------------------------
+# -- Session settings
+
+
+def set_level(_sc, _level):
+    # type: (Any, Any) -> None
+    """Set the log level for the current Rhino session, ie: "INFO"."""
+    _sc.sticky[LEVEL_STICKY_KEY] = to_level(_level)
+
+
+def set_log_file(_sc, _file_path):
+    # type: (Any, Optional[str]) -> None
+    """Write every message to the file for the current Rhino session. Set to None to stop."""
+    _sc.sticky[FILE_STICKY_KEY] = _file_path
+
+
+def _session_setting(_sc, _sticky_key, _env_var):
+    # type: (Any, str, str) -> Any
+    try:
+        value = _sc.sticky.get(_sticky_key, None)
+    except AttributeError:
+        value = None
+    if value is None:
+        value = os.environ.get(_env_var) or None
+    return value
+
+
+# -----------------------------------------------------------------------------
+# -- Logger
+
+
+class SolveLogger(object):
+    """Levelled logger with per-message rate-limiting and counts of repeated messages.
+
+    Arguments:
+    ----------
+        * _level (int): Messages at or above this level are printed. Default=WARNING.
+        * _max_repeats (int): The number of times the same format-string is printed. After that
+            it is only counted, and shows up in the summary.
+        * _log_file (Optional[str]): Optional file to append every message to, at any level.
+    """
+
+    def __init__(self, _level=DEFAULT_LEVEL, _max_repeats=DEFAULT_MAX_REPEATS, _log_file=None):
+        # type: (int, int, Optional[str]) -> None
+        self.level = to_level(_level)
+        self.max_repeats = _max_repeats
+        self.log_file = _log_file
+        self.counts = {}  # type: Dict[Tuple[int, str], int]
+        self.shown = {}  # type: Dict[Tuple[int, str], int]
+        self._file_lines = []  # type: List[str]
+
+    # -------------------------------------------------------------------------
+    # -- Logging
+
+    def log(self, _level, _msg, *args):
+        # type: (int, str, *Any) -> None
+        """Log the message (a format-string, formatted with the args only if it is shown)."""
+        key = (_level, _msg)
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+        if self.log_file:
+            self._file_lines.append(
+                "{} [{}] {}".format(datetime.now().isoformat(), LEVEL_NAMES.get(_level, _level), _format(_msg, args))
+            )
+
+        if _level < self.level:
+            return None
+
+        shown = self.shown.get(key, 0)
+        if shown >= self.max_repeats:
+            return None
+        self.shown[key] = shown + 1
+        print(_format(_msg, args))
+
+    def debug(self, _msg, *args):
+        # type: (str, *Any) -> None
+        self.log(DEBUG, _msg, *args)
+
+    def info(self, _msg, *args):
+        # type: (str, *Any) -> None
+        self.log(INFO, _msg, *args)
+
+    def warning(self, _msg, *args):
+        # type: (str, *Any) -> None
+        self.log(WARNING, _msg, *args)
+
+    def error(self, _msg, *args):
+        # type: (str, *Any) -> None
+        self.log(ERROR, _msg, *args)
+
+    def is_enabled_for(self, _level):
+        # type: (int) -> bool
+        """Return True if messages at the level would be printed (ie: to skip building expensive arguments)."""
+        return _level >= self.level
+
+    # -------------------------------------------------------------------------
+    # -- Summary
+
+    def summary_lines(self):
+        # type: () -> List[str]
+        """One line for each format-string that was logged more times than it was printed."""
+        lines = []
+        for (level, msg), count in sorted(self.counts.items(), key=lambda _: (-_[0][0], -_[1])):
+            hidden = count - self.shown.get((level, msg), 0)
+            if hidden > 0:
+                lines.append("[{}] x{}: {}".format(LEVEL_NAMES.get(level, level), count, msg))
+        return lines
+
+    def flush(self):
+        # type: () -> None
+        """Print the summary of the messages not shown, write out the log-file lines, and reset the counts."""
+        lines = self.summary_lines()
+        if lines:
+            num_hidden = sum(self.counts.values()) - sum(self.shown.values())
+            print("-- {} message(s) not shown (see gh_logger to change the log level):".format(num_hidden))
+            for line in lines:
+                print(line)
+
+        if self.log_file and self._file_lines:
+            try:
+                with open(self.log_file, "a") as f:
+                    f.write("\n".join(self._file_lines) + "\n")
+            except (IOError, OSError) as e:
+                print("Failed to write the log-file: {}".format(e))
+
+        self.counts = {}
+        self.shown = {}
+        self._file_lines = []
+
+    def __repr__(self):
+        return "{}(level={}, max_repeats={}, log_file={!r})".format(
+            self.__class__.__name__, LEVEL_NAMES.get(self.level, self.level), self.max_repeats, self.log_file
+        )
+
+
+def _format(_msg, _args):
+    # type: (str, Tuple[Any, ...]) -> str
+    if not _args:
+        return _msg
+    try:
+        return _msg.format(*_args)
+    except (IndexError, KeyError, ValueError):
+        return "{} {}".format(_msg, _args)
+
+
+# -----------------------------------------------------------------------------
+# -- IGH access
+
+
+def new_logger(_sc):
+    # type: (Any) -> SolveLogger
+    """Return a new SolveLogger using the session's level and log-file settings."""
+    level = _session_setting(_sc, LEVEL_STICKY_KEY, LEVEL_ENV_VAR)
+    try:
+        level = to_level(level) if level is not None else DEFAULT_LEVEL
+    except ValueError:
+        level = DEFAULT_LEVEL
+    return SolveLogger(level, _log_file=_session_setting(_sc, FILE_STICKY_KEY, FILE_ENV_VAR))
+
+
+def print_all_logger():
+    # type: () -> SolveLogger
+    """Return a SolveLogger which prints every message, just like calling print(). For callers without an IGH."""
+    return SolveLogger(DEBUG, _max_repeats=sys.maxsize)
+
+
+def get_logger(_IGH):
+    # type: (Any) -> SolveLogger
+    """Return the IGH's SolveLogger, building it (once) for IGH objects which don't make their own."""
+    logger = getattr(_IGH, "log", None)
+    if isinstance(logger, SolveLogger):
+        return logger
+
+    logger = getattr(_IGH, "_hbph_log", None)
+    if logger is None:
+        logger = new_logger(getattr(_IGH, "scriptcontext", None))
+        setattr(_IGH, "_hbph_log", logger)
+    return logger
+
+
+def flush(_IGH):
+    # type: (Any) -> None
+    """Flush the IGH's SolveLogger, if one was used during the run."""
+    for attr_name in ("_log", "_hbph_log"):
+        logger = getattr(_IGH, attr_name, None)
+        if logger is not None:
+            logger.flush()
@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Solve-time profiler for the Honeybee-PH Grasshopper Components.
+
+Profiling is switched off by default. Turn it on for the current Rhino session from any
+GHPython component with:
+
+>>> import scriptcontext as sc
+>>> from honeybee_ph_rhino import gh_profiler
+>>> gh_profiler.enable(sc)
+
+or set the 'HBPH_PROFILE' environment variable before starting Rhino. While profiling is on,
+every GHCompo_*.run() records its wall-time and the call-counts of the 'hot' primitives
+(ghpythonlib.components calls, Brep intersections, .duplicate() and ph_units 'convert').
+One JSON line per solve is appended to a trace file next to the Grasshopper definition
+('<definition-name>.hbph_profile.jsonl') and a short summary is shown as the component's
+message. Use 'scripts/report_solve_profile.py' to rank the components found in a trace file.
+"""
+
+import inspect
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from functools import wraps
+from timeit import default_timer
+
+try:
+    from typing import Any, Callable, Dict, List, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_ph_rhino import gh_logger
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
+STICKY_KEY = "HBPH_PROFILE"
+ENV_VAR = "HBPH_PROFILE"
+TRACE_DIR_ENV_VAR = "HBPH_PROFILE_DIR"
+TRACE_FILE_SUFFIX = ".hbph_profile.jsonl"
+
+# -- ghpythonlib.components which intersect, split or boolean Brep geometry.
+BREP_INTERSECTION_COMPONENTS = {
+    "BrepXBrep",
+    "BrepXCurve",
+    "BrepXLine",
+    "BrepXPlane",
+    "CurveXCurve",
+    "RegionDifference",
+    "RegionIntersection",
+    "RegionUnion",
+    "SolidDifference",
+    "SolidIntersection",
+    "SolidUnion",
+    "SplitBrep",
+    "SurfaceSplit",
+}
+
+# -- (module, attribute-path, counter-name) of the library primitives counted during a profiled run.
+COUNTED_PRIMITIVES = (
+    ("ph_units.converter", "convert", "convert"),
+    ("honeybee._base", "_Base.duplicate", "duplicate"),
+    ("honeybee_energy.load._base", "_LoadBase.duplicate", "duplicate"),
+    ("honeybee_energy.schedule.ruleset", "ScheduleRuleset.duplicate", "duplicate"),
+)
+
+
+# -----------------------------------------------------------------------------
+# -- On / Off
+
+
+def enable(_sc):
+    # type: (Any) -> None
+    """Switch solve-profiling on for the current Rhino session."""
+    _sc.sticky[STICKY_KEY] = True
+
+
+def disable(_sc):
+    # type: (Any) -> None
+    """Switch solve-profiling off for the current Rhino session."""
+    _sc.sticky[STICKY_KEY] = False
+
+
+def is_enabled(_IGH):
+    # type: (Any) -> bool
+    """Return True if solve-profiling is switched on (environment variable or Rhino sticky)."""
+    if os.environ.get(ENV_VAR):
+        return True
+    try:
+        return bool(_IGH.scriptcontext.sticky.get(STICKY_KEY, False))
+    except AttributeError:
+        return False
+
+
+# -----------------------------------------------------------------------------
+# -- Counting Wrappers
+
+
+def _counted(_profiler, _key, _func):
+    # type: (SolveProfiler, str, Callable) -> Callable
+    """Return a wrapper around the function which adds 1 to the profiler's counter on each call."""
+
+    def counted_func(*args, **kwargs):
+        _profiler.count(_key)
+        return _func(*args, **kwargs)
+
+    try:
+        counted_func = wraps(_func)(counted_func)
+    except (AttributeError, TypeError):
+        pass  # .NET or builtin callable without the normal attributes
+
+    return counted_func
+
+
+class CountingComponents(object):
+    """Proxy for 'ghpythonlib.components' which counts each component call made through it."""
+
+    def __init__(self, _ghc, _profiler):
+        # type: (Any, SolveProfiler) -> None
+        self._ghc = _ghc
+        self._profiler = _profiler
+
+    def __getattr__(self, _name):
+        attr = getattr(self._ghc, _name)
+        if not callable(attr):
+            return attr
+
+        profiler = self._profiler
+
+        def counted_component(*args, **kwargs):
+            profiler.count_component(_name)
+            return attr(*args, **kwargs)
+
+        return counted_component
+
+
+# -----------------------------------------------------------------------------
+# -- Profiler
+
+
+class SolveProfiler(object):
+    """Record the wall-time and primitive call-counts for a single GHCompo_*.run() call.
+
+    Used as a context manager around the run. On enter, the IGH's ghpythonlib.components
+    is swapped for a counting proxy and the COUNTED_PRIMITIVES are patched. On exit,
+    everything is restored, a record is appended to the trace-file and the summary
+    is written to the GH-Component's message.
+    """
+
+    def __init__(self, _IGH, _worker_name):
+        # type: (Any, str) -> None
+        self.IGH = _IGH
+        self.worker_name = _worker_name
+        self.counts = {}  # type: Dict[str, int]
+        self.peaks = {}  # type: Dict[str, int]
+        self.wall_time_ms = 0.0
+        self.error = None  # type: Optional[str]
+        self._start = None  # type: Optional[float]
+        self._restore = []  # type: List[Tuple[Any, str, Any]]
+
+    # -------------------------------------------------------------------------
+    # -- Recording
+
+    def count(self, _key, _n=1):
+        # type: (str, int) -> None
+        """Add _n to the named counter."""
+        self.counts[_key] = self.counts.get(_key, 0) + _n
+
+    def count_component(self, _component_name):
+        # type: (str) -> None
+        """Record a single ghpythonlib.components call."""
+        self.count("ghc")
+        self.count("ghc.{}".format(_component_name))
+        if _component_name in BREP_INTERSECTION_COMPONENTS:
+            self.count("brep_intersection")
+
+    def peak(self, _key, _value):
+        # type: (str, int) -> None
+        """Keep the largest value seen for the named object-count."""
+        if _value > self.peaks.get(_key, 0):
+            self.peaks[_key] = _value
+
+    def record_outputs(self, _outputs):
+        # type: (Any) -> None
+        """Record the number of items output by the run as the 'outputs' peak object-count."""
+        if not isinstance(_outputs, tuple):
+            _outputs = (_outputs,)
+        self.peak("outputs", sum(_count_items(_) for _ in _outputs))
+
+    # -------------------------------------------------------------------------
+    # -- Patching
+
+    def _patch(self, _owner, _attr_name, _new_value):
+        # type: (Any, str, Any) -> None
+        self._restore.append((_owner, _attr_name, getattr(_owner, _attr_name)))
+        setattr(_owner, _attr_name, _new_value)
+
+    def _patch_primitive(self, _module_name, _attr_path, _key):
+        # type: (str, str, str) -> None
+        """Wrap a library function (or class method) so that its calls are counted."""
+        module = sys.modules.get(_module_name)
+        if not module:
+            return None
+
+        owner = module
+        path = _attr_path.split(".")
+        for part in path[:-1]:
+            owner = getattr(owner, part, None)
+            if owner is None:
+                return None
+
+        attr_name = path[-1]
+        if inspect.isclass(owner):
+            original = owner.__dict__.get(attr_name)
+        else:
+            original = getattr(owner, attr_name, None)
+        if original is None:
+            return None
+
+        counted = _counted(self, _key, original)
+        self._restore.append((owner, attr_name, original))
+        setattr(owner, attr_name, counted)
+
+        # -- Module-level functions are often imported by name ('from x import convert')
+        # -- so also patch those references in the honeybee_ph_rhino modules.
+        if owner is module:
+            for mod_name, mod in list(sys.modules.items()):
+                if not mod_name.startswith("honeybee_ph_rhino") or mod is None:
+                    continue
+                if getattr(mod, attr_name, None) is original:
+                    self._patch(mod, attr_name, counted)
+
+    def __enter__(self):
+        try:
+            self._patch(self.IGH, "ghpythonlib_components", CountingComponents(self.IGH.ghpythonlib_components, self))
+        except AttributeError:
+            pass  # IGH without ghpythonlib_components
+
+        for module_name, attr_path, key in COUNTED_PRIMITIVES:
+            self._patch_primitive(module_name, attr_path, key)
+
+        self.IGH.profiler = self
+        self._start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.wall_time_ms = (default_timer() - (self._start or 0.0)) * 1000
+        if exc_type:
+            self.error = exc_type.__name__
+
+        for owner, attr_name, original in reversed(self._restore):
+            setattr(owner, attr_name, original)
+        self._restore = []
+        self.IGH.profiler = None
+
+        # -- Never let a profiler problem hide the component's own result or error
+        try:
+            self.write_trace()
+            self.show_summary()
+        except Exception as e:
+            print("Failed to write the solve-profile: {}".format(e))
+
+        return False
+
+    # -------------------------------------------------------------------------
+    # -- Output
+
+    @property
+    def component_name(self):
+        # type: () -> str
+        try:
+            return str(self.IGH.ghenv.Component.Name)
+        except AttributeError:
+            return self.worker_name
+
+    @property
+    def component_guid(self):
+        # type: () -> Optional[str]
+        try:
+            return str(self.IGH.ghenv.Component.InstanceGuid)
+        except AttributeError:
+            return None
+
+    @property
+    def canvas_path(self):
+        # type: () -> Optional[str]
+        """The file-path of the Grasshopper definition the component is on, if it has been saved."""
+        try:
+            return str(self.IGH.ghenv.Component.OnPingDocument().FilePath) or None
+        except AttributeError:
+            return None
+
+    @property
+    def trace_file_path(self):
+        # type: () -> str
+        """The JSONL trace-file for the canvas. Saved next to the .gh file unless 'HBPH_PROFILE_DIR' is set."""
+        folder = os.environ.get(TRACE_DIR_ENV_VAR)
+        canvas_path = self.canvas_path
+        if canvas_path:
+            name = os.path.splitext(os.path.basename(canvas_path))[0]
+            folder = folder or os.path.dirname(canvas_path)
+        else:
+            name = "unsaved_canvas"
+            folder = folder or os.path.join(tempfile.gettempdir(), "hbph_profile")
+        return os.path.join(folder, "{}{}".format(name, TRACE_FILE_SUFFIX))
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "canvas": self.canvas_path,
+            "component": self.component_name,
+            "component_guid": self.component_guid,
+            "worker": self.worker_name,
+            "wall_time_ms": round(self.wall_time_ms, 3),
+            "counts": self.counts,
+            "peaks": self.peaks,
+            "error": self.error,
+        }
+
+    def write_trace(self):
+        # type: () -> str
+        """Append this solve's record to the canvas trace-file and return the file path."""
+        path = self.trace_file_path
+        folder = os.path.dirname(path)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        with open(path, "a") as f:
+            f.write(json.dumps(self.to_dict(), sort_keys=True) + "\n")
+        return path
+
+    def summary(self):
+        # type: () -> str
+        """A short summary to display as the GH-Component message."""
+        return "{:.0f} ms | ghc {} | dup {} | conv {}".format(
+            self.wall_time_ms,
+            self.counts.get("ghc", 0),
+            self.counts.get("duplicate", 0),
+            self.counts.get("convert", 0),
+        )
+
+    def show_summary(self):
+        # type: () -> None
+        try:
+            self.IGH.ghenv.Component.Message = self.summary()
+        except AttributeError:
+            pass
+        print("Solve-profile [{}]: {}".format(self.component_name, self.summary()))
+
+    def __str__(self):
+        return "{}(worker={}, wall_time_ms={:.1f})".format(self.__class__.__name__, self.worker_name, self.wall_time_ms)
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
+def _count_items(_output):
+    # type: (Any) -> int
+    """Return the number of items in a GH-Component output (DataTree, list or single item)."""
+    if _output is None:
+        return 0
+    try:
+        return int(_output.DataCount)  # DataTree
+    except AttributeError:
+        pass
+    if isinstance(_output, (list, tuple, set)):
+        return len(_output)
+    return 1
+
+
+# -----------------------------------------------------------------------------
+# -- GHCompo Instrumentation
+
+
+def profiled_run(_run):
+    # type: (Callable) -> Callable
+    """Wrap a GHCompo_*.run() method so that it is profiled whenever profiling is switched on.
+
+    The wrapper also flushes the IGH's logger (see gh_logger) after every run.
+    """
+
+    def run(self, *args, **kwargs):
+        IGH = getattr(self, "IGH", None)
+        try:
+            if IGH is None or not is_enabled(IGH):
+                return _run(self, *args, **kwargs)
+
+            with SolveProfiler(IGH, self.__class__.__name__) as profiler:
+                result = _run(self, *args, **kwargs)
+                profiler.record_outputs(result)
+            return result
+        finally:
+            # -- Show the summary of any log messages the run did not print
+            if IGH is not None:
+                gh_logger.flush(IGH)
+
+    run = wraps(_run)(run)
+    run._hbph_profiled = True  # type: ignore
+    return run
+
+
+def instrument_gh_compo_classes(_namespace):
+    # type: (Dict[str, Any]) -> None
+    """Wrap the .run() method of every GHCompo_* class found in the namespace with the profiler."""
+    for name, obj in list(_namespace.items()):
+        if not name.startswith("GHCompo_") or not inspect.isclass(obj):
+            continue
+
+        for cls in inspect.getmro(obj):
+            run = cls.__dict__.get("run")
+            if run is not None:
+                break
+        else:
+            continue
+
+        if not inspect.isfunction(run) or getattr(run, "_hbph_profiled", False):
+            continue
+        setattr(obj, "run", profiled_run(run))
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Read and write compressed and chunked HBJSON files.
+
+A large model's HBJSON is a single JSON document of several hundred MB, which has to be read
+and parsed in full before anything can be done with it. This module adds two packed layouts:
+
+    * Compressed (".hbjson.gz", or ".hbjson.zst" if the 'zstandard' package is installed):
+        the same HBJSON document, compressed. Several times smaller, and faster to read from
+        disk, but still parsed in full.
+
+    * Chunked (".hbjsonz"): a zip archive with one JSON chunk per room, one chunk with
+        everything else in the model (constructions, schedules, properties...), and an
+        'index.json' which lists the rooms and a hash of each chunk. A reader can check the
+        hashes (ie: to see which rooms changed since the last export) and load only the chunks
+        it needs.
+
+The layout is found from the start of the file, not its name, so a plain HBJSON file always
+works. This module runs in both Rhino (IronPython 2.7) and the Python-3 worker. Zstandard is
+only available where the 'zstandard' package is installed (not in Rhino).
+
+>>> from honeybee_ph_rhino import hbjson_io
+>>> hbjson_io.write_hbjson(hb_model.to_dict(), "model.hbjsonz")
+>>> chunked = hbjson_io.ChunkedHBJSON("model.hbjsonz")
+>>> chunked.room_hashes  # -- from the index only
+>>> hb_json_dict = chunked.to_dict()
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import zipfile
+
+try:
+    from typing import Any, Dict, List, Optional
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None  # -- Optional. Not available in Rhino.
+
+
+CHUNKED_FORMAT = "hbjsonz"
+CHUNKED_VERSION = 1
+INDEX_NAME = "index.json"
+SHARED_NAME = "shared.json"
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZIP_MAGIC = b"PK\x03\x04"
+
+
+class HBJSONFormatError(Exception):
+    def __init__(self, _path, _reason):
+        self.msg = "\nCannot read the HBJSON file: '{}'\n{}".format(_path, _reason)
+        super(HBJSONFormatError, self).__init__(self.msg)
+
+
+class ZstandardNotInstalledError(Exception):
+    def __init__(self, _path):
+        self.msg = (
+            "\nThe HBJSON file '{}' is Zstandard compressed, but the 'zstandard' package is "
+            "not installed. Use a '.hbjson.gz' or '.hbjsonz' file instead.".format(_path)
+        )
+        super(ZstandardNotInstalledError, self).__init__(self.msg)
+
+
+def _to_text(_data):
+    # type: (Any) -> str
+    return json.dumps(_data, sort_keys=True, separators=(",", ":"))
+
+
+def chunk_hash(_text):
+    # type: (str) -> str
+    """Return the hash of a chunk's JSON text, as stored in the chunked index."""
+    return hashlib.sha1(_text.encode("utf-8")).hexdigest()
+
+
+# -----------------------------------------------------------------------------
+# -- Layouts
+
+
+def file_layout(_file_path):
+    # type: (str) -> str
+    """Return the layout of the HBJSON file: "json", "gzip", "zstd" or "chunked"."""
+    with open(_file_path, "rb") as f:
+        start = f.read(4)
+    if start.startswith(GZIP_MAGIC):
+        return "gzip"
+    if start.startswith(ZSTD_MAGIC):
+        return "zstd"
+    if start.startswith(ZIP_MAGIC):
+        return "chunked"
+    return "json"
+
+
+def is_packed(_file_path):
+    # type: (str) -> bool
+    """Return True if the file is a compressed or chunked HBJSON (which only this module can read)."""
+    return os.path.isfile(_file_path) and file_layout(_file_path) != "json"
+
+
+def layout_for_path(_file_path):
+    # type: (str) -> str
+    """Return the layout to write, from the file name: "gzip", "zstd", "chunked" or "json"."""
+    name = _file_path.lower()
+    if name.endswith(".gz"):
+        return "gzip"
+    if name.endswith(".zst"):
+        return "zstd"
+    if name.endswith("." + CHUNKED_FORMAT):
+        return "chunked"
+    return "json"
+
+
+# -----------------------------------------------------------------------------
+# -- Write
+
+
+def write_hbjson(_hb_json_dict, _file_path, _layout=None):
+    # type: (Dict[str, Any], str, Optional[str]) -> str
+    """Write the HBJSON dict to a file, in the layout given (or the one for the file name).
+
+    Arguments:
+    ----------
+        * _hb_json_dict (Dict[str, Any]): The HB-Model dict (ie: from 'hb_model.to_dict()').
+        * _file_path (str): The file to write.
+        * _layout (Optional[str]): "json", "gzip", "zstd" or "chunked". Default: from the file
+            extension (".gz", ".zst", ".hbjsonz", or else plain JSON).
+
+    Returns:
+    --------
+        * (str): The file path.
+    """
+    layout = _layout or layout_for_path(_file_path)
+    if layout == "chunked":
+        _write_chunked(_hb_json_dict, _file_path)
+        return _file_path
+
+    data = json.dumps(_hb_json_dict).encode("utf-8")
+    if layout == "gzip":
+        with gzip.open(_file_path, "wb") as f:
+            f.write(data)
+    elif layout == "zstd":
+        if zstandard is None:
+            raise ZstandardNotInstalledError(_file_path)
+        with open(_file_path, "wb") as f:
+            f.write(zstandard.ZstdCompressor().compress(data))
+    else:
+        with open(_file_path, "wb") as f:
+            f.write(data)
+    return _file_path
+
+
+def _write_chunked(_hb_json_dict, _file_path):
+    # type: (Dict[str, Any], str) -> None
+    shared_text = _to_text({k: v for k, v in _hb_json_dict.items() if k != "rooms"})
+    index = {
+        "format": CHUNKED_FORMAT,
+        "version": CHUNKED_VERSION,
+        "identifier": _hb_json_dict.get("identifier"),
+        "shared": {"file": SHARED_NAME, "hash": chunk_hash(shared_text)},
+        "rooms": [],
+    }  # type: Dict[str, Any]
+
+    with zipfile.ZipFile(_file_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(SHARED_NAME, shared_text.encode("utf-8"))
+        for i, room in enumerate(_hb_json_dict.get("rooms") or []):
+            room_text = _to_text(room)
+            room_file = "rooms/{:06d}.json".format(i)
+            archive.writestr(room_file, room_text.encode("utf-8"))
+            index["rooms"].append({"identifier": room["identifier"], "file": room_file, "hash": chunk_hash(room_text)})
+        archive.writestr(INDEX_NAME, _to_text(index).encode("utf-8"))
+
+
+# -----------------------------------------------------------------------------
+# -- Read
+
+
+class ChunkedHBJSON(object):
+    """A chunked HBJSON (".hbjsonz") file. Only the index is read until a chunk is asked for.
+
+    Arguments:
+    ----------
+        * _file_path (str): The chunked HBJSON file.
+    """
+
+    def __init__(self, _file_path):
+        # type: (str) -> None
+        self.file_path = _file_path
+        with zipfile.ZipFile(_file_path, "r") as archive:
+            try:
+                self.index = json.loads(archive.read(INDEX_NAME).decode("utf-8"))
+            except KeyError:
+                raise HBJSONFormatError(_file_path, "The file has no '{}'.".format(INDEX_NAME))
+        if self.index.get("format") != CHUNKED_FORMAT or self.index.get("version") != CHUNKED_VERSION:
+            raise HBJSONFormatError(_file_path, "Unknown chunked format: {}".format(self.index.get("format")))
+        self._room_files = {r["identifier"]: r["file"] for r in self.index["rooms"]}
+
+    @property
+    def identifier(self):
+        # type: () -> Optional[str]
+        return self.index.get("identifier")
+
+    @property
+    def room_identifiers(self):
+        # type: () -> List[str]
+        return [r["identifier"] for r in self.index["rooms"]]
+
+    @property
+    def room_hashes(self):
+        # type: () -> Dict[str, str]
+        """The hash of each room's chunk, by room identifier."""
+        return {r["identifier"]: r["hash"] for r in self.index["rooms"]}
+
+    @property
+    def shared_hash(self):
+        # type: () -> str
+        """The hash of the chunk with everything except the rooms."""
+        return self.index["shared"]["hash"]
+
+    def _read(self, _archive, _name):
+        # type: (zipfile.ZipFile, str) -> Any
+        return json.loads(_archive.read(_name).decode("utf-8"))
+
+    def shared(self):
+        # type: () -> Dict[str, Any]
+        """Return the model's dict without its rooms."""
+        with zipfile.ZipFile(self.file_path, "r") as archive:
+            return self._read(archive, self.index["shared"]["file"])
+
+    def rooms(self, _identifiers=None):
+        # type: (Optional[List[str]]) -> List[Dict[str, Any]]
+        """Return the room dicts (all of them, or the ones with the identifiers given), in the model's order."""
+        if _identifiers is None:
+            files = [r["file"] for r in self.index["rooms"]]
+        else:
+            wanted = set(_identifiers)
+            files = [r["file"] for r in self.index["rooms"] if r["identifier"] in wanted]
+        with zipfile.ZipFile(self.file_path, "r") as archive:
+            return [self._read(archive, f) for f in files]
+
+    def room(self, _identifier):
+        # type: (str) -> Dict[str, Any]
+        with zipfile.ZipFile(self.file_path, "r") as archive:
+            return self._read(archive, self._room_files[_identifier])
+
+    def to_dict(self, _room_identifiers=None):
+        # type: (Optional[List[str]]) -> Dict[str, Any]
+        """Return the HBJSON dict, with all of the rooms (or only the ones with the identifiers given)."""
+        hb_json_dict = self.shared()
+        hb_json_dict["rooms"] = self.rooms(_room_identifiers)
+        return hb_json_dict
+
+    def __repr__(self):
+        return "{}(file_path={!r}, rooms={})".format(self.__class__.__name__, self.file_path, len(self.index["rooms"]))
+
+
+def read_hbjson(_file_path):
+    # type: (str) -> Dict[str, Any]
+    """Return the HBJSON dict from a file in any of the layouts (plain, gzip, zstd or chunked)."""
+    layout = file_layout(_file_path)
+    if layout == "chunked":
+        return ChunkedHBJSON(_file_path).to_dict()
+
+    if layout == "gzip":
+        with gzip.open(_file_path, "rb") as f:
+            data = f.read()
+    elif layout == "zstd":
+        if zstandard is None:
+            raise ZstandardNotInstalledError(_file_path)
+        with open(_file_path, "rb") as f:
+            data = zstandard.ZstdDecompressor().decompressobj().decompress(f.read())
+    else:
+        with open(_file_path, "rb") as f:
+            data = f.read()
+    return json.loads(data.decode("utf-8"))
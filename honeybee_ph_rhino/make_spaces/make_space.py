@@ -4,7 +4,7 @@
 """Functions to Add Spaces onto Honeybee Rooms."""
 
 try:
-    from typing import Dict, List, Tuple
+    from typing import Dict, List, Optional, Tuple
 except ImportError:
     pass  # IronPython 2.7
 
@@ -33,7 +33,7 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph:\n\t{}".format(e))
 
 try:
-    from honeybee_ph_rhino import gh_io
+    from honeybee_ph_rhino import gh_io, gh_logger
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
 
@@ -125,8 +125,8 @@ def set_absolute_ventilation(_hb_room, _new_room_airflow):
     return _hb_room
 
 
-def add_spaces_to_honeybee_rooms(_spaces, _hb_rooms, _inherit_names=False):
-    # type: (List[space.Space], List[room.Room], bool) -> Tuple[List[room.Room], List[SpaceData], List[room.Room]]
+def add_spaces_to_honeybee_rooms(_spaces, _hb_rooms, _inherit_names=False, _log=None):
+    # type: (List[space.Space], List[room.Room], bool, Optional[gh_logger.SolveLogger]) -> Tuple[List[room.Room], List[SpaceData], List[room.Room]]
     """Sorts a list of Spaces, checks which are 'in' which HB-Room, and adds the space to that room.
 
     Arguments:
@@ -135,6 +135,8 @@ def add_spaces_to_honeybee_rooms(_spaces, _hb_rooms, _inherit_names=False):
         * _hb_rooms (list[room.Room]): A list of Honeybee Rooms.
         * _inherit_names (bool) default=False. Set True to override all space names
             with the name of the parent Honeybee-Room.
+        * _log (Optional[gh_logger.SolveLogger]): Optional logger for the progress messages (ie: IGH.log).
+            If None, every message is printed.
 
     Returns:
     --------
@@ -145,6 +147,7 @@ def add_spaces_to_honeybee_rooms(_spaces, _hb_rooms, _inherit_names=False):
     # -- Organize the spaces into a dict and pull out the reference points
     # -- This is done to avoid re-collecting the points at each is_point_inside
     # -- check and so that 'del' can be used to speed up the hosting checks.
+    log = _log or gh_logger.print_all_logger()
     spaces_dict = {}  # type: Dict[int, SpaceData]
     for space in _spaces:
         spaces_dict[id(space)] = SpaceData(space, [pt for pt in space.reference_points])
@@ -158,7 +161,7 @@ def add_spaces_to_honeybee_rooms(_spaces, _hb_rooms, _inherit_names=False):
 
         # -- Check to ensure that the room is actually solid first
         if not dup_room.geometry.is_solid:
-            print("Error: Room {} not solid. Cannot host spaces.".format(dup_room.display_name))
+            log.error("Error: Room {} not solid. Cannot host spaces.", dup_room.display_name)
             open_rooms.append(dup_room)
             continue
 
@@ -168,7 +171,7 @@ def add_spaces_to_honeybee_rooms(_spaces, _hb_rooms, _inherit_names=False):
                 if not dup_room.geometry.is_point_inside(pt):
                     continue
 
-                print("Hosting Space: {}  in HB-Room: {}".format(space_data.space.full_name, dup_room.display_name))
+                log.info("Hosting Space: {}  in HB-Room: {}", space_data.space.full_name, dup_room.display_name)
 
                 sp = space_data.space.duplicate()
                 sp.host = dup_room
@@ -0,0 +1,639 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Client for the long-lived Python-3 export worker (scripts/hbph_worker.py).
+
+The export components (Write WUFI XML, Write METr JSON, Write PPP, Run OpenPH) used to start
+a new Python-3 subprocess for every write. That subprocess re-imports honeybee, PHX (and
+OpenPH) each time, which is several seconds per export before any work is done.
+
+The worker here is started the first time an export runs, kept in the Rhino sticky, and
+re-used for every export in the Rhino session. It is stopped when Rhino closes (and in any
+case exits by itself once its stdin is closed, ie: if Rhino crashes).
+
+If the worker is turned off, or cannot be started, or stops during a job, 'run_job' returns
+None and the component runs its export as a subprocess, as before. Turn the worker off for
+the Rhino session with:
+
+>>> import scriptcontext as sc
+>>> from honeybee_ph_rhino import py3_worker
+>>> py3_worker.set_enabled(sc, False)
+
+or set the 'HBPH_PY3_WORKER' environment variable to "False" before starting Rhino. The
+worker's own output (not the job output) is written to 'hbph_py3_worker.log' in the temp folder.
+
+While a job runs, the worker sends its stages, warnings and results as events. 'run_job' shows
+them as the component's message while it waits. The wait only polls for Escape: it does not
+pump Rhino's message loop, which would let the user change or delete the component in the
+middle of its solution. Press Escape to cancel the job, or set a time limit (seconds) for the
+Rhino session with:
+
+>>> py3_worker.set_timeout(sc, 600)
+
+A cancelled (or timed-out) job stops the worker, which is started again for the next export.
+
+The export components take either an HBJSON file path, or the HB-Model itself. A model is sent
+to the worker over the pipe (as compact JSON), so it is not written to disk and read back in.
+Only if the export has to run as a subprocess is the model written to a temp HBJSON file.
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue  # IronPython 2.7
+
+try:
+    from typing import Any, Callable, Dict, Iterator, List, Optional
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.config import folders as hb_folders
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+try:
+    from honeybee_ph_rhino import hbjson_io
+    from honeybee_ph_rhino.gh_logger import get_logger
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
+
+WORKER_STICKY_KEY = "HBPH_PY3_WORKER"
+ENABLED_STICKY_KEY = "HBPH_USE_PY3_WORKER"
+ENABLED_ENV_VAR = "HBPH_PY3_WORKER"
+TIMEOUT_STICKY_KEY = "HBPH_PY3_WORKER_TIMEOUT"
+POLL_INTERVAL = 0.1  # seconds between checks for Escape / the timeout while waiting for the worker
+LOG_FILE_NAME = "hbph_py3_worker.log"
+TEMP_HBJSON_FOLDER = "hbph_models"
+MAX_LISTED_OBJECT_IDS = 10  # object IDs to list in each diagnostic's component warning
+CREATE_NO_WINDOW = 0x08000000  # Windows: don't open a console window for the worker
+
+_WORKERS = {}  # type: Dict[str, Py3Worker]  (for callers without a scriptcontext)
+
+
+class WorkerError(Exception):
+    """Raised when the worker cannot be started, or stops while running a job."""
+
+    def __init__(self, _msg):
+        self.msg = "\nPy3-Worker Error: {}".format(_msg)
+        super(WorkerError, self).__init__(self.msg)
+
+
+class JobCancelledError(Exception):
+    """Raised when a job is cancelled, or runs over its time limit. The worker is stopped."""
+
+    def __init__(self, _job, _reason):
+        self.msg = "\nThe '{}' job was stopped: {}".format(_job, _reason)
+        super(JobCancelledError, self).__init__(self.msg)
+
+
+def worker_script_path():
+    # type: () -> str
+    """The path to the worker's Python-3 script, in the LBT Python-3 site-packages."""
+    return os.path.join(hb_folders.python_package_path, "honeybee_ph_rhino", "scripts", "hbph_worker.py")
+
+
+class Py3Worker(object):
+    """A Python-3 worker subprocess, and the JSON-lines connection to it.
+
+    Arguments:
+    ----------
+        * _python_exe (str): The Python-3 interpreter to run the worker with.
+        * _script_file (str): The worker script (hbph_worker.py).
+        * _log_file (Optional[str]): File for the worker's own stderr. Default: the temp folder.
+    """
+
+    def __init__(self, _python_exe, _script_file, _log_file=None):
+        # type: (str, str, Optional[str]) -> None
+        self.python_exe = _python_exe
+        self.script_file = _script_file
+        self.log_file = _log_file or os.path.join(tempfile.gettempdir(), LOG_FILE_NAME)
+        self.process = None  # type: Optional[subprocess.Popen]
+        self.pid = None  # type: Optional[int]
+        self._next_id = 0
+        self._log = None  # type: Any
+        self._messages = None  # type: Optional[queue.Queue]
+
+    @property
+    def is_alive(self):
+        # type: () -> bool
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        # type: () -> Py3Worker
+        """Start the worker subprocess and wait for it to be ready (ie: done with its imports)."""
+        if self.is_alive:
+            return self
+
+        if not os.path.isfile(self.script_file):
+            raise WorkerError("No worker script found at: {}".format(self.script_file))
+
+        # -- Create a new PYTHONHOME to avoid the Rhino-8 issues (same as PHX.run)
+        env = os.environ.copy()
+        env["PYTHONHOME"] = ""
+
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = CREATE_NO_WINDOW
+
+        try:
+            self._log = open(self.log_file, "w")
+            self.process = subprocess.Popen(
+                [self.python_exe, "-u", self.script_file],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=self._log,
+                env=env,
+                universal_newlines=True,
+                **kwargs
+            )
+        except (OSError, IOError, ValueError) as e:
+            self._close()
+            raise WorkerError("Failed to start: {}".format(e))
+
+        # -- Read the worker's lines on a thread, so waiting for them can time out (or be cancelled)
+        self._messages = queue.Queue()
+        reader = threading.Thread(target=_read_lines, args=(self.process.stdout, self._messages))
+        reader.daemon = True
+        reader.start()
+
+        ready = self._read_message()
+        if ready.get("event") != "ready":
+            self.stop()
+            raise WorkerError("Unexpected start-up message: {}".format(ready))
+        self.pid = ready.get("pid")
+        return self
+
+    def _read_message(self, _poll=None):
+        # type: (Optional[Callable[[], Optional[str]]]) -> Dict[str, Any]
+        """Return the next JSON message from the worker. Raises WorkerError if the worker stopped.
+
+        While waiting, '_poll' (if given) is called every POLL_INTERVAL seconds. If it returns a
+        reason (str), the worker is stopped and the reason is returned as a 'cancelled' message.
+        """
+        while True:
+            try:
+                line = self._messages.get(timeout=POLL_INTERVAL) if self._messages else ""
+            except queue.Empty:
+                reason = _poll() if _poll else None
+                if reason:
+                    self._close()
+                    return {"event": "cancelled", "reason": reason}
+                continue
+            if not line:
+                self._close()
+                raise WorkerError("The worker stopped. See the worker log: {}".format(self.log_file))
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(message, dict):
+                return message
+
+    def submit(self, _job, _payload=None, _on_event=None, _timeout=None, _is_cancelled=None):
+        # type: (str, Optional[Dict[str, Any]], Optional[Callable], Optional[float], Optional[Callable]) -> Dict[str, Any]
+        """Run one job on the worker and return its response dict.
+
+        Arguments:
+        ----------
+            * _job (str): The job name, ie: "wufi_xml". See hbph_worker.py for the jobs.
+            * _payload (Optional[Dict[str, Any]]): The job's inputs.
+            * _on_event (Optional[Callable[[Dict], None]]): Called with each event (stage, warning,
+                result) of the job, as the worker sends it.
+            * _timeout (Optional[float]): The time limit for the job (seconds). Default: None.
+            * _is_cancelled (Optional[Callable[[], bool]]): Called every POLL_INTERVAL seconds
+                while waiting for the worker. Return True to cancel the job.
+
+        Returns:
+        --------
+            * (Dict[str, Any]): The response: "ok", "result" (or "error"), "stdout" and "stderr".
+
+        Raises:
+        -------
+            * JobCancelledError: If the job is cancelled, or runs over the time limit. The worker
+                is stopped, since it cannot be interrupted in the middle of a job.
+        """
+        if not self.is_alive:
+            self.start()
+
+        self._next_id += 1
+        request = {"id": self._next_id, "job": _job, "payload": _payload or {}}
+        try:
+            self.process.stdin.write(json.dumps(request, separators=(",", ":")) + "\n")
+            self.process.stdin.flush()
+        except (IOError, OSError, ValueError) as e:
+            self._close()
+            raise WorkerError("Failed to send the job: {}".format(e))
+
+        end_time = time.time() + _timeout if _timeout else None
+
+        def poll():
+            # type: () -> Optional[str]
+            if _is_cancelled and _is_cancelled():
+                return "Cancelled."
+            if end_time and time.time() > end_time:
+                return "Timed out after {} seconds.".format(_timeout)
+            return None
+
+        while True:
+            message = self._read_message(poll)
+            if message.get("event") == "cancelled":
+                raise JobCancelledError(_job, message["reason"])
+            if message.get("id") != request["id"]:
+                continue
+            if "event" not in message:
+                return message
+            if _on_event:
+                _on_event(message)
+
+    def stop(self, _timeout=5.0):
+        # type: (float) -> None
+        """Ask the worker to shut down, and kill it if it has not stopped after the timeout (seconds)."""
+        if self.is_alive:
+            try:
+                self.process.stdin.write(json.dumps({"id": None, "job": "shutdown"}) + "\n")
+                self.process.stdin.close()
+            except (IOError, OSError, ValueError):
+                pass
+            if not _wait(self.process, _timeout):
+                try:
+                    self.process.kill()
+                except OSError:
+                    pass
+        self._close()
+
+    def _close(self):
+        # type: () -> None
+        if self.process is not None:
+            if self.process.poll() is None:
+                try:
+                    self.process.kill()
+                except OSError:
+                    pass
+            for stream in (self.process.stdin, self.process.stdout):
+                try:
+                    stream.close()
+                except (IOError, OSError, ValueError, AttributeError):
+                    pass
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        self.process = None
+
+    def __repr__(self):
+        return "{}(pid={}, alive={}, script={!r})".format(
+            self.__class__.__name__, self.pid, self.is_alive, self.script_file
+        )
+
+
+def _read_lines(_stream, _messages):
+    # type: (Any, queue.Queue) -> None
+    """Put each line from the worker's stdout on the queue, and "" once the stream ends."""
+    try:
+        for line in iter(_stream.readline, ""):
+            _messages.put(line)
+    except (IOError, OSError, ValueError):
+        pass
+    _messages.put("")
+
+
+def _wait(_process, _timeout):
+    # type: (subprocess.Popen, float) -> bool
+    """Wait for the process to exit. Returns False if it is still running after the timeout (seconds)."""
+    end = time.time() + _timeout
+    while _process.poll() is None:
+        if time.time() > end:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+# -----------------------------------------------------------------------------
+# -- Session settings
+
+
+def set_enabled(_sc, _enabled):
+    # type: (Any, bool) -> None
+    """Turn the worker on or off for the Rhino session. Turning it off stops any running worker."""
+    _sc.sticky[ENABLED_STICKY_KEY] = bool(_enabled)
+    if not _enabled:
+        stop_worker(_sc)
+
+
+def is_enabled(_sc):
+    # type: (Any) -> bool
+    """Return True if the exports should use the worker (the default)."""
+    enabled = _sticky(_sc).get(ENABLED_STICKY_KEY, None)
+    if enabled is None:
+        enabled = os.environ.get(ENABLED_ENV_VAR, "True").strip().lower() not in ("0", "false", "no", "off")
+    return bool(enabled)
+
+
+@contextmanager
+def disabled(_sc):
+    # type: (Any) -> Iterator[None]
+    """Turn the worker off inside the 'with' block, ie: for the subprocess fallback after the worker failed.
+
+    Without this, each component the fallback runs would try (and fail) to start the worker again.
+    """
+    sticky = _sticky(_sc)
+    original = sticky.get(ENABLED_STICKY_KEY, None)
+    sticky[ENABLED_STICKY_KEY] = False
+    try:
+        yield
+    finally:
+        if original is None:
+            sticky.pop(ENABLED_STICKY_KEY, None)
+        else:
+            sticky[ENABLED_STICKY_KEY] = original
+
+
+def set_timeout(_sc, _seconds):
+    # type: (Any, Optional[float]) -> None
+    """Set the time limit (seconds) for each job on the worker, for the Rhino session. None for no limit."""
+    _sc.sticky[TIMEOUT_STICKY_KEY] = float(_seconds) if _seconds else None
+
+
+def get_timeout(_sc):
+    # type: (Any) -> Optional[float]
+    try:
+        return _sc.sticky.get(TIMEOUT_STICKY_KEY, None)
+    except AttributeError:
+        return None
+
+
+def _sticky(_sc):
+    # type: (Any) -> Dict
+    try:
+        return _sc.sticky
+    except AttributeError:
+        return _WORKERS
+
+
+def get_worker(_sc, _Rhino=None):
+    # type: (Any, Any) -> Py3Worker
+    """Return the session's (running) worker, starting it if needed. Raises WorkerError if it cannot start.
+
+    Arguments:
+    ----------
+        * _sc (scriptcontext): The Rhino scriptcontext. The worker is kept in its sticky.
+        * _Rhino (Optional[Rhino]): If given, the worker is stopped when Rhino closes.
+    """
+    sticky = _sticky(_sc)
+    worker = sticky.get(WORKER_STICKY_KEY, None)
+    if worker is None:
+        worker = Py3Worker(hb_folders.python_exe_path, worker_script_path())
+        sticky[WORKER_STICKY_KEY] = worker
+        if _Rhino is not None:
+            _Rhino.RhinoApp.Closing += lambda _sender, _e: worker.stop()
+    return worker.start()
+
+
+def stop_worker(_sc):
+    # type: (Any) -> None
+    """Stop the session's worker, if there is one."""
+    worker = _sticky(_sc).pop(WORKER_STICKY_KEY, None)
+    if worker is not None:
+        worker.stop()
+
+
+# -----------------------------------------------------------------------------
+# -- Component access
+
+
+class JobProgress(object):
+    """Shows a job's events as the component's message, and checks for Escape while the job runs.
+
+    Arguments:
+    ----------
+        * _IGH (IGH): The Grasshopper Interface (either IGH class).
+        * _job (str): The job name, ie: "wufi_xml".
+    """
+
+    def __init__(self, _IGH, _job):
+        # type: (Any, str) -> None
+        self.IGH = _IGH
+        self.job = _job
+        self.stage = None  # type: Optional[str]
+        self.warnings = []  # type: List[str]
+        self.results = []  # type: List[str]
+        self.component = getattr(getattr(_IGH, "ghenv", None), "Component", None)
+        self._original_message = getattr(self.component, "Message", None)
+
+    @property
+    def message(self):
+        # type: () -> str
+        text = "{}: {}".format(self.job, self.stage or "starting")
+        if self.warnings:
+            text += " | {} warning(s)".format(len(self.warnings))
+        return text
+
+    def on_event(self, _event):
+        # type: (Dict[str, Any]) -> None
+        """Update the message for one job event (from the worker)."""
+        event = _event.get("event")
+        if event == "stage":
+            name = _event.get("stage", "")
+            if _event.get("format"):
+                name = "{} {}".format(name, _event["format"])
+            if _event.get("status") == "start":
+                self.stage = "{}...".format(name)
+            else:
+                self.stage = "{} done ({:.1f} s)".format(name, _event.get("seconds", 0.0))
+        elif event == "warning":
+            self.warnings.append(_event.get("message", ""))
+        elif event == "result":
+            self.results.append(_event.get("path", ""))
+        self.show(self.message)
+
+    def show(self, _text):
+        # type: (Optional[str]) -> None
+        """Set the component's message, and ask the canvas to redraw it."""
+        if self.component is None:
+            return None
+        try:
+            self.component.Message = _text
+            self.component.OnDisplayExpired(True)
+        except Exception:
+            pass
+
+    def is_cancelled(self):
+        # type: () -> bool
+        """Return True if the user pressed Escape.
+
+        This only polls the key state. It must not pump the UI message loop (ie: RhinoApp.Wait()),
+        since the job runs inside the component's SolveInstance: the user could then change the
+        inputs, delete the component or start a new solution before this one is done.
+        """
+        try:
+            return bool(self.IGH.Grasshopper.Kernel.GH_Document.IsEscapeKeyDown())
+        except Exception:
+            return False
+
+    def done(self):
+        # type: () -> None
+        """Put back the component's original message."""
+        self.show(self._original_message)
+
+
+def run_job(_IGH, _job, _payload):
+    # type: (Any, str, Dict[str, Any]) -> Optional[Dict[str, Any]]
+    """Run the export job on the session's worker, and print its output, as the subprocess would.
+
+    Arguments:
+    ----------
+        * _IGH (IGH): The Grasshopper Interface (either IGH class).
+        * _job (str): The job name, ie: "wufi_xml". See hbph_worker.py for the jobs.
+        * _payload (Dict[str, Any]): The job's inputs.
+
+    Returns:
+    --------
+        * (Optional[Dict[str, Any]]): The job response, or None if the worker is turned off
+            or is not available. The caller should then run the export as a subprocess. If the
+            job failed, its traceback is on the response's "stderr", as for a subprocess.
+
+    Raises:
+    -------
+        * JobCancelledError: If the user pressed Escape, or the job ran over the session's time limit.
+    """
+    sc = getattr(_IGH, "scriptcontext", None) or getattr(_IGH, "sc", None)
+    if not is_enabled(sc):
+        return None
+
+    log = get_logger(_IGH)
+    progress = JobProgress(_IGH, _job)
+    try:
+        worker = get_worker(sc, getattr(_IGH, "Rhino", None))
+        response = worker.submit(_job, _payload, progress.on_event, get_timeout(sc), progress.is_cancelled)
+    except WorkerError as e:
+        log.warning("{} Running the export as a subprocess instead.", e.msg)
+        stop_worker(sc)
+        return None
+    except JobCancelledError:
+        stop_worker(sc)
+        raise
+    finally:
+        progress.done()
+
+    for line in response.get("stdout", "").split("\n"):
+        print(line)
+    return response
+
+
+def hbjson_payload(_hb_json):
+    # type: (Any) -> Dict[str, Any]
+    """Return the job payload entry for the model: its 'hbjson_file' path, or the model as an 'hbjson' dict.
+
+    Arguments:
+    ----------
+        * _hb_json (str | dict | Model): The HBJSON file path, the HBJSON dict, or the HB-Model.
+
+    Returns:
+    --------
+        * (Dict[str, Any]): {"hbjson_file": path} for a path, otherwise {"hbjson": dict}.
+    """
+    if isinstance(_hb_json, str):
+        return {"hbjson_file": _hb_json}
+    if isinstance(_hb_json, dict):
+        return {"hbjson": _hb_json}
+    return {"hbjson": _hb_json.to_dict()}
+
+
+def hbjson_file(_hb_json):
+    # type: (Any) -> str
+    """Return the HBJSON file path for a subprocess. A model (or dict) is written to a temp HBJSON file.
+
+    The subprocess scripts only read plain HBJSON, so a compressed or chunked HBJSON file is
+    also written out to a temp HBJSON file.
+
+    Arguments:
+    ----------
+        * _hb_json (str | dict | Model): The HBJSON file path, the HBJSON dict, or the HB-Model.
+
+    Returns:
+    --------
+        * (str): The HBJSON file path.
+    """
+    if isinstance(_hb_json, str):
+        if not hbjson_io.is_packed(_hb_json):
+            return _hb_json
+        hb_json_dict = hbjson_io.read_hbjson(_hb_json)
+    elif isinstance(_hb_json, dict):
+        hb_json_dict = _hb_json
+    else:
+        hb_json_dict = _hb_json.to_dict()
+
+    folder = os.path.join(tempfile.gettempdir(), TEMP_HBJSON_FOLDER)
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    file_path = os.path.join(folder, "{}.hbjson".format(hb_json_dict.get("identifier") or "model"))
+    with open(file_path, "w") as f:
+        json.dump(hb_json_dict, f, separators=(",", ":"))
+    return file_path
+
+
+def diagnostic_message(_diagnostic):
+    # type: (Dict[str, Any]) -> str
+    """Return the user message for one diagnostic: its code, message, count and object IDs."""
+    text = "[{}] {}".format(_diagnostic.get("code", ""), _diagnostic.get("message", ""))
+    count = _diagnostic.get("count", 1)
+    if count > 1:
+        object_ids = (_diagnostic.get("object_ids") or [])[:MAX_LISTED_OBJECT_IDS]
+        if object_ids:
+            more = ", ..." if len(object_ids) < count else ""
+            text += " ({} times, for: {}{})".format(count, ", ".join(object_ids), more)
+        else:
+            text += " ({} times)".format(count)
+    return text
+
+
+def give_user_diagnostics(_IGH, _response):
+    # type: (Any, Dict[str, Any]) -> bool
+    """Give the user one warning (or error) for each kind of diagnostic in the job's diagnostics file.
+
+    Arguments:
+    ----------
+        * _IGH (IGH): The Grasshopper Interface (either IGH class).
+        * _response (Dict[str, Any]): The job response, with the "diagnostics_file" path.
+
+    Returns:
+    --------
+        * (bool): False if there is no diagnostics file to read. The caller should then look for
+            the warnings in the job's stdout instead.
+    """
+    file_path = _response.get("diagnostics_file", None)
+    if not file_path or not os.path.isfile(file_path):
+        return False
+    try:
+        with open(file_path) as f:
+            diagnostics = json.load(f)
+    except (IOError, OSError, ValueError):
+        return False
+
+    for diagnostic in diagnostics.get("diagnostics", []):
+        if diagnostic.get("severity") == "error":
+            _IGH.error(diagnostic_message(diagnostic))
+        else:
+            _IGH.warning(diagnostic_message(diagnostic))
+    return True
+
+
+def raise_for_stderr(_stderr):
+    # type: (str) -> None
+    """Raise an Exception if the job wrote to stderr, the same as PHX.run does for its subprocesses."""
+    if not _stderr:
+        return None
+    if "Defaulting to Windows directory." in str(_stderr):
+        print("WARNING: {}".format(_stderr))
+    else:
+        print(_stderr)
+        raise Exception(_stderr)
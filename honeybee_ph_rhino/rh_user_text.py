@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Bulk reader for Rhino object UserText (Attribute User-Strings), with an optional per-document cache.
+
+Reading UserText through rhinoscriptsyntax re-finds the object by its GUID on every
+call (once for the keys, once per key, and once more for the name). The reader here
+finds each RhinoObject once and reads all of its User-Strings in a single call.
+
+The optional cache lives in the Rhino scriptcontext.sticky so that it survives between
+component solves. It is keyed by document and object-GUID, and entries are dropped
+whenever Rhino reports that an object's attributes changed, or the object was replaced
+or deleted. The whole document's entries are dropped when the document is closed.
+Note that a script which edits an object's Attributes in place (without committing
+the change to the document) does not raise any event, so use the cache only where
+the UserText is edited through the normal Rhino UI / commands.
+"""
+
+try:
+    from typing import Any, Dict, List, Optional
+except ImportError:
+    pass  # IronPython 2.7
+
+STICKY_KEY = "HBPH_USER_TEXT_CACHE"
+OBJECT_NAME_KEY = "Object Name"
+GH_GEOMETRY_GUID = "00000000-0000-0000-0000-000000000000"
+
+
+def is_grasshopper_geometry(_guid):
+    # type: (Any) -> bool
+    """If its GH generated geom, will have this GUID always"""
+    return str(_guid) == GH_GEOMETRY_GUID
+
+
+def read_user_text(_rh_obj):
+    # type: (Any) -> Dict[str, Optional[str]]
+    """Return all of the Rhino Object's Attribute User-Strings, plus its name, as a dict.
+
+    Arguments:
+    ----------
+        * _rh_obj (Rhino.DocObjects.RhinoObject | None): The Rhino object to read.
+
+    Returns:
+    --------
+        * (Dict[str, Optional[str]]): The User-Strings, with the object's name under "Object Name".
+    """
+    if _rh_obj is None:
+        return {OBJECT_NAME_KEY: None}
+
+    attributes = _rh_obj.Attributes
+    user_strings = attributes.GetUserStrings()
+    user_text = {k: user_strings.Get(k) for k in user_strings.AllKeys}
+    user_text[OBJECT_NAME_KEY] = attributes.Name
+    return user_text
+
+
+class UserTextCache(object):
+    """Per-document cache of UserText dicts, invalidated by the Rhino document events."""
+
+    def __init__(self, _Rhino):
+        # type: (Any) -> None
+        self._documents = {}  # type: Dict[int, Dict[str, Dict[str, Optional[str]]]]
+        self._subscribe(_Rhino.RhinoDoc)
+
+    def _subscribe(self, _RhinoDoc):
+        _RhinoDoc.ModifyObjectAttributes += self._on_modify_attributes
+        _RhinoDoc.ReplaceRhinoObject += self._on_replace_object
+        _RhinoDoc.DeleteRhinoObject += self._on_delete_object
+        _RhinoDoc.CloseDocument += self._on_close_document
+
+    # -- Rhino event handlers
+    def _on_modify_attributes(self, _sender, _e):
+        self.invalidate(_e.Document.RuntimeSerialNumber, _e.RhinoObject.Id)
+
+    def _on_replace_object(self, _sender, _e):
+        self.invalidate(_e.Document.RuntimeSerialNumber, _e.ObjectId)
+
+    def _on_delete_object(self, _sender, _e):
+        self.invalidate(_e.TheObject.Document.RuntimeSerialNumber, _e.ObjectId)
+
+    def _on_close_document(self, _sender, _e):
+        self._documents.pop(_e.DocumentSerialNumber, None)
+
+    # -- Cache access
+    def invalidate(self, _doc_serial_number, _guid):
+        # type: (int, Any) -> None
+        """Drop any cached UserText for the object."""
+        self._documents.get(_doc_serial_number, {}).pop(str(_guid), None)
+
+    def clear(self):
+        # type: () -> None
+        self._documents = {}
+
+    def get(self, _rh_doc, _guid):
+        # type: (Any, Any) -> Dict[str, Optional[str]]
+        """Return (a copy of) the object's UserText dict, reading it from the document if it is not cached."""
+        doc_cache = self._documents.setdefault(_rh_doc.RuntimeSerialNumber, {})
+        key = str(_guid)
+        try:
+            user_text = doc_cache[key]
+        except KeyError:
+            user_text = read_user_text(_rh_doc.Objects.FindId(_guid))
+            doc_cache[key] = user_text
+        return dict(user_text)
+
+    def __len__(self):
+        return sum(len(_) for _ in self._documents.values())
+
+
+def get_cache(_sc, _Rhino):
+    # type: (Any, Any) -> UserTextCache
+    """Return the session's UserTextCache from the Rhino sticky, creating it on first use."""
+    cache = _sc.sticky.get(STICKY_KEY, None)
+    if cache is None:
+        cache = UserTextCache(_Rhino)
+        _sc.sticky[STICKY_KEY] = cache
+    return cache
+
+
+def read_user_text_dicts(_rh_doc, _guids, _cache=None):
+    # type: (Any, List[Any], Optional[UserTextCache]) -> List[Dict[str, Optional[str]]]
+    """Return one UserText dict for each GUID, in order.
+
+    Arguments:
+    ----------
+        * _rh_doc (Rhino.RhinoDoc): The Rhino document the objects live in.
+        * _guids (List[System.Guid]): The Rhino object GUIDs. Empty GUIDs and Grasshopper-geometry
+            GUIDs get a dict with only a None "Object Name".
+        * _cache (Optional[UserTextCache]): Optional cache to read from / add to.
+
+    Returns:
+    --------
+        * (List[Dict[str, Optional[str]]])
+    """
+    objects = _rh_doc.Objects
+    output_list = []
+    for guid in _guids:
+        if not guid or is_grasshopper_geometry(guid):
+            output_list.append({OBJECT_NAME_KEY: None})
+        elif _cache is not None:
+            output_list.append(_cache.get(_rh_doc, guid))
+        else:
+            output_list.append(read_user_text(objects.FindId(guid)))
+    return output_list
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Cached annual statistics (hourly values, mean, full-load-hours) for Honeybee-Energy schedules.
+
+Calling 'schedule.values()' expands the schedule into 8,760 hourly values. The program
+components used to do this for every room and every load, even though only a handful of
+different schedules are used (ie: the same occupant-presence schedule for 800 dwellings).
+
+The statistics here are computed the first time a schedule is seen and kept for the session.
+They are keyed by the schedule's identifier and its hash. Honeybee-Energy schedules are hashed
+by their contents, so a schedule which has been edited gets new statistics.
+
+Usage:
+------
+
+>>> from honeybee_ph_rhino.schedule_stats import annual_mean
+>>> annual_mean(hbe_people.occupancy_schedule)
+0.6875
+"""
+
+from statistics import mean
+
+try:
+    from typing import Any, Dict, Hashable, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+
+# -- The cache is cleared whenever it grows larger than this. Models
+# -- normally only use a few dozen different schedules.
+MAX_CACHE_SIZE = 1000
+
+_STATS = {}  # type: Dict[Tuple[str, Hashable], ScheduleStats]
+
+
+class ScheduleStats(object):
+    """The annual hourly values of a schedule, and the statistics derived from them."""
+
+    __slots__ = ("identifier", "values", "mean", "full_load_hours")
+
+    def __init__(self, _identifier, _values):
+        # type: (str, Tuple[float, ...]) -> None
+        self.identifier = _identifier
+        self.values = _values
+        self.mean = mean(_values) if _values else 0.0
+        self.full_load_hours = sum(_values)
+
+    def __repr__(self):
+        return "{}(identifier={!r}, mean={}, full_load_hours={})".format(
+            self.__class__.__name__, self.identifier, self.mean, self.full_load_hours
+        )
+
+
+def _cache_key(_schedule):
+    # type: (Any) -> Tuple[str, Hashable]
+    """Return the (identifier, content-hash) key for the schedule."""
+    try:
+        content_key = hash(_schedule)  # type: Hashable
+    except TypeError:
+        content_key = id(_schedule)  # unhashable: only the same object will match
+    return (getattr(_schedule, "identifier", None), content_key)
+
+
+def get_schedule_stats(_schedule):
+    # type: (Any) -> ScheduleStats
+    """Return the (cached) ScheduleStats for a Honeybee-Energy ScheduleRuleset or ScheduleFixedInterval."""
+    key = _cache_key(_schedule)
+    try:
+        return _STATS[key]
+    except KeyError:
+        pass
+
+    stats = ScheduleStats(key[0], tuple(_schedule.values()))
+    if len(_STATS) >= MAX_CACHE_SIZE:
+        _STATS.clear()
+    _STATS[key] = stats
+    return stats
+
+
+def annual_values(_schedule):
+    # type: (Any) -> Tuple[float, ...]
+    """Return the schedule's annual hourly values (cached)."""
+    return get_schedule_stats(_schedule).values
+
+
+def annual_mean(_schedule):
+    # type: (Any) -> float
+    """Return the mean of the schedule's annual hourly values (cached). Same as 'mean(_schedule.values())'."""
+    return get_schedule_stats(_schedule).mean
+
+
+def full_load_hours(_schedule):
+    # type: (Any) -> float
+    """Return the schedule's equivalent full-load hours: the sum of its annual hourly values (cached)."""
+    return get_schedule_stats(_schedule).full_load_hours
+
+
+def clear_cache():
+    # type: () -> None
+    """Clear the schedule-statistics cache."""
+    _STATS.clear()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Cache of the HB-Models and PhxProjects converted by the Py3 worker (hbph_worker.py).
+
+Each export used to rebuild the HB-Model from the HBJSON and convert it to a PhxProject, even
+if the model had not changed since the last export. The cache keeps the last few models (by
+model identifier), with a content-hash of each room (by room identifier) and of the rest of
+the HBJSON (constructions, schedules, model properties, ...). When an export's HBJSON has
+the same hashes, the cached HB-Model and PhxProjects are used again.
+
+When any room changed, the whole model is converted again: PHX merges the rooms of each
+building segment before building the components, and the assemblies and schedules are
+shared by the whole PhxProject, so parts of an old PhxProject cannot be used for a new one.
+The log lists the rooms which changed.
+
+A chunked HBJSON (see honeybee_ph_rhino/hbjson_io.py) has the hashes in its index, so the
+worker can look for its model in the cache (with 'find') before any room is read in.
+
+The PhxProjects are kept by conversion settings. A 'fix' (ie: the WUFI cooling bug-fix,
+which changes the PhxProject) is applied to a copy, which is kept separately.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Callable
+
+from PHX.from_HBJSON import create_project, read_HBJSON_file
+
+MAX_MODELS = 2
+MAX_LISTED_ROOMS = 10
+
+
+def content_hash(data) -> str:
+    """Return a hash of the JSON-serializable data."""
+    text = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def room_hashes(hbjson: dict) -> dict[str, str]:
+    """Return a content-hash of each room in the HBJSON dict, by room identifier."""
+    return {room["identifier"]: content_hash(room) for room in hbjson.get("rooms") or []}
+
+
+def shared_hash(hbjson: dict) -> str:
+    """Return a content-hash of everything in the HBJSON dict except the rooms."""
+    return content_hash({k: v for k, v in hbjson.items() if k != "rooms"})
+
+
+def settings_key(settings: dict) -> tuple:
+    return tuple(sorted(settings.items()))
+
+
+class ModelConversion:
+    """An HB-Model (built from an HBJSON dict) and the PhxProjects converted from it."""
+
+    def __init__(self, hbjson: dict, shared: str | None = None, rooms: dict[str, str] | None = None) -> None:
+        self.identifier = hbjson.get("identifier")
+        self.shared_hash = shared
+        self.room_hashes = rooms
+        self.hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(hbjson)
+        self._phx_projects = {}
+
+    def matches(self, shared: str, rooms: dict[str, str]) -> bool:
+        return self.shared_hash == shared and self.room_hashes == rooms
+
+    def phx_project(self, settings: dict, fix: Callable | None = None):
+        """Return the PhxProject for the conversion settings, converting the HB-Model only the first time.
+
+        Arguments:
+        ----------
+            * settings (dict): The conversion settings (group_components, merge_faces, ...).
+            * fix (Callable | None): Optional function which changes the PhxProject. It is
+                applied to a copy, so the un-fixed PhxProject can still be used.
+
+        Returns:
+        --------
+            * (PhxProject): The PhxProject. Don't change it, it may be used again.
+        """
+        key = (settings_key(settings), fix.__name__ if fix else None)
+        try:
+            phx_project = self._phx_projects[key]
+            logging.info(f'> Re-using the PHX-Project for: "{self.hb_model}"')
+            return phx_project
+        except KeyError:
+            pass
+
+        if fix is None:
+            logging.info(f'> Generating the PHX-Project from the Honeybee-Model: "{self.hb_model}"')
+            phx_project = create_project.convert_hb_model_to_PhxProject(
+                self.hb_model, **{f"_{k}": v for k, v in settings.items()}
+            )
+        else:
+            phx_project = fix(copy.deepcopy(self.phx_project(settings)))
+
+        self._phx_projects[key] = phx_project
+        return phx_project
+
+
+class ConversionCache:
+    """The last few ModelConversions, by model identifier."""
+
+    def __init__(self, max_models: int = MAX_MODELS) -> None:
+        self.max_models = max_models
+        self._models: OrderedDict[str, ModelConversion] = OrderedDict()
+
+    def find(self, identifier: str | None, shared: str, rooms: dict[str, str]) -> ModelConversion | None:
+        """Return the cached ModelConversion if the model (by its hashes) has not changed, else None."""
+        cached = self._models.get(identifier)
+        if cached is None or not cached.matches(shared, rooms):
+            return None
+        logging.info(f"> The HB-Model '{identifier}' has not changed since the last export.")
+        self._models.move_to_end(identifier)
+        return cached
+
+    def get(self, hbjson: dict, shared: str | None = None, rooms: dict[str, str] | None = None) -> ModelConversion:
+        """Return the ModelConversion for the HBJSON dict: the cached one if the model has not changed.
+
+        The 'shared' and 'rooms' hashes are worked out from the HBJSON dict unless they are given
+        (ie: from the index of a chunked HBJSON).
+        """
+        if shared is None or rooms is None:
+            shared, rooms = shared_hash(hbjson), room_hashes(hbjson)
+        identifier = hbjson.get("identifier")
+
+        cached = self.find(identifier, shared, rooms)
+        if cached is not None:
+            return cached
+
+        cached = self._models.get(identifier)
+        if cached is not None:
+            log_changes(cached, shared, rooms)
+
+        conversion = ModelConversion(hbjson, shared, rooms)
+        self._models[identifier] = conversion
+        self._models.move_to_end(identifier)
+        while len(self._models) > self.max_models:
+            self._models.popitem(last=False)
+        return conversion
+
+    def clear(self) -> None:
+        self._models.clear()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+def log_changes(cached: ModelConversion, shared: str, rooms: dict[str, str]) -> None:
+    """Log what changed in the HB-Model since it was cached."""
+    old_rooms = cached.room_hashes or {}
+    changed = [k for k, v in rooms.items() if k in old_rooms and old_rooms[k] != v]
+    added = [k for k in rooms if k not in old_rooms]
+    removed = [k for k in old_rooms if k not in rooms]
+
+    logging.info(
+        f"> The HB-Model '{cached.identifier}' changed since the last export: {len(changed)} room(s) changed, "
+        f"{len(added)} added, {len(removed)} removed (of {len(rooms)})."
+    )
+    if cached.shared_hash != shared:
+        logging.info("> The model's shared data (constructions, schedules, properties, ...) changed.")
+    for label, identifiers in (("Changed", changed), ("Added", added), ("Removed", removed)):
+        if identifiers:
+            more = f" (and {len(identifiers) - MAX_LISTED_ROOMS} more)" if len(identifiers) > MAX_LISTED_ROOMS else ""
+            logging.info(f"> {label} rooms: {', '.join(identifiers[:MAX_LISTED_ROOMS])}{more}")
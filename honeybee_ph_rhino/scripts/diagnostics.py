@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Structured diagnostics (warnings and errors) of the jobs run by the Py3 worker (hbph_worker.py).
+
+The export components used to find the warnings by splitting the whole stdout of the export
+into lines and looking for "WARNING" in each one. With the log-files on, that output can be
+hundreds of thousands of lines. A single model issue (ie: one construction) may also log the
+same warning thousands of times, and each one became its own component warning.
+
+The DiagnosticsHandler here collects the job's WARNING and ERROR log records as they are
+logged instead. Records of the same kind (the same severity, code, and message template) are
+kept as one diagnostic, with a count and the IDs of the objects involved. The diagnostics are
+written to a JSON file which the component reads:
+
+    {
+        "version": 1,
+        "counts": {"warning": 2031, "error": 0},
+        "diagnostics": [
+            {
+                "code": "create_assemblies.get_declared_u_thickness",
+                "severity": "warning",
+                "message": "Declared-U Material 'Wall-A' has an unusable 'thickness_mm' (None)...",
+                "count": 2000,
+                "object_ids": ["Wall-A", "Wall-B", ...]
+            },
+            ...
+        ]
+    }
+
+The 'code' is the logging module and function. The 'message' is the first of its kind. The
+'object_ids' are the first argument of each log call (or the first quoted name in the message)
+and are limited to MAX_OBJECT_IDS.
+"""
+
+import json
+import logging
+import pathlib
+import re
+
+DIAGNOSTICS_VERSION = 1
+DIAGNOSTICS_FILE_NAME = "hbph_diagnostics.json"
+MAX_OBJECT_IDS = 25
+
+_QUOTED = re.compile(r"""'([^']*)'|"([^"]*)\"""")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(\.\d+)?(?![\w.])")
+
+
+def message_template(record: logging.LogRecord) -> str:
+    """Return the record's message with its object names and numbers taken out, for grouping."""
+    if record.args:
+        return str(record.msg)
+    template = _QUOTED.sub("'{}'", record.getMessage())
+    return _NUMBER.sub("#", template)
+
+
+def object_id(record: logging.LogRecord) -> str | None:
+    """Return the ID of the object the record is about: the first log argument, or the first quoted name."""
+    if isinstance(record.args, tuple) and record.args:
+        return str(record.args[0])
+    match = _QUOTED.search(record.getMessage())
+    if match:
+        return match.group(1) if match.group(1) is not None else match.group(2)
+    return None
+
+
+class Diagnostic:
+    """All the log records of one kind: the same severity, code and message template."""
+
+    def __init__(self, code: str, severity: str, message: str) -> None:
+        self.code = code
+        self.severity = severity
+        self.message = message
+        self.count = 0
+        self.object_ids: list[str] = []
+
+    def add(self, _object_id: str | None) -> None:
+        self.count += 1
+        if _object_id is not None and _object_id not in self.object_ids and len(self.object_ids) < MAX_OBJECT_IDS:
+            self.object_ids.append(_object_id)
+
+    def to_dict(self) -> dict:
+        return {
+            "code": self.code,
+            "severity": self.severity,
+            "message": self.message,
+            "count": self.count,
+            "object_ids": self.object_ids,
+        }
+
+
+class DiagnosticsHandler(logging.Handler):
+    """Collects the WARNING and ERROR log records of a job as grouped Diagnostics."""
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.WARNING)
+        self.diagnostics: dict[tuple[str, str, str], Diagnostic] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            severity = "error" if record.levelno >= logging.ERROR else "warning"
+            code = f"{record.module}.{record.funcName}"
+            key = (severity, code, message_template(record))
+            if key not in self.diagnostics:
+                self.diagnostics[key] = Diagnostic(code, severity, record.getMessage())
+            self.diagnostics[key].add(object_id(record))
+        except Exception:
+            self.handleError(record)
+
+    def to_dict(self) -> dict:
+        diagnostics = sorted(self.diagnostics.values(), key=lambda d: (d.severity != "error", -d.count))
+        return {
+            "version": DIAGNOSTICS_VERSION,
+            "counts": {
+                "warning": sum(d.count for d in diagnostics if d.severity == "warning"),
+                "error": sum(d.count for d in diagnostics if d.severity == "error"),
+            },
+            "diagnostics": [d.to_dict() for d in diagnostics],
+        }
+
+    def write(self, folder: pathlib.Path) -> pathlib.Path:
+        """Write the diagnostics to the JSON file in the folder, and return its path."""
+        file_path = pathlib.Path(folder, DIAGNOSTICS_FILE_NAME)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return file_path
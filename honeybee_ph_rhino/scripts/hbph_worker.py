@@ -0,0 +1,529 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""A long-lived Python-3 worker for the PHX / OpenPH exports.
+
+The export components used to start a new Python-3 interpreter for every write, which then
+re-imported honeybee, honeybee-energy, PHX (and OpenPH) and re-read the HBJSON file. This
+worker is started once per Rhino session (see honeybee_ph_rhino/py3_worker.py) and keeps
+those imports loaded between jobs.
+
+Protocol: one JSON object per line. The worker writes a 'ready' line once the imports are
+done, then reads one job per line from stdin and writes one response per line to stdout:
+
+    -> {"id": 1, "job": "wufi_xml", "payload": {"hbjson_file": "...", "filename": "...", ...}}
+    <- {"id": 1, "ok": true, "result": {"file": "..."}, "stdout": "...", "stderr": "..."}
+    <- {"id": 1, "ok": false, "error": "Traceback ...", "stdout": "...", "stderr": "...Traceback ..."}
+
+'stdout' / 'stderr' hold what the job printed / logged, the same text the PHX run-scripts
+write when they run as a subprocess, including the traceback of a job which fails. The
+payload holds either an 'hbjson_file' path, or the HBJSON 'hbjson' dict itself (sent by the
+components which are given an HB-Model, so the model is not written to disk). The HBJSON file
+may also be compressed or chunked (see honeybee_ph_rhino/hbjson_io.py). The worker
+exits on a 'shutdown' job, or when its stdin is closed (ie: Rhino exits).
+
+While a job runs, the worker also writes event lines for it, so the client can show the progress:
+
+    <- {"id": 1, "event": "stage", "stage": "read_hbjson", "status": "start"}
+    <- {"id": 1, "event": "stage", "stage": "read_hbjson", "status": "finish", "seconds": 2.1}
+    <- {"id": 1, "event": "warning", "message": "..."}
+    <- {"id": 1, "event": "result", "format": "wufi_xml", "path": "..."}
+
+The stages are "read_hbjson", "build_model", and "convert" / "write" (with the "format") for
+each output. The warnings are the job's WARNING log messages. The response line comes last.
+
+The job's warnings and errors are also written, grouped, to a diagnostics JSON file in the
+save-folder (see diagnostics.py). Its path is the response's "diagnostics_file".
+
+Jobs:
+    * "ping": No payload. Returns the worker's pid.
+    * "wufi_xml" / "metr_json": hbjson_file | hbjson, filename, save_folder, group_components,
+        merge_faces, merge_spaces_by_erv, merge_exhaust_vent_devices, log_level.
+    * "ppp": hbjson_file | hbjson, filename, save_folder.
+    * "openph": hbjson_file | hbjson, output_folder.
+    * "export": hbjson_file | hbjson, the "wufi_xml" conversion settings, log_level and
+        'targets': a list of {"format": "wufi_xml" | "metr_json" | "ppp" | "openph",
+        "filename": ..., "save_folder": ...}. Writes every target from one read of the HBJSON,
+        and returns their 'files' in order.
+    * "clear_cache": No payload. Drops the cached HB-Models and PhxProjects.
+    * "shutdown": No payload.
+
+Every job which reads an HBJSON keeps the HB-Model and its PhxProjects in a cache (see
+conversion_cache.py), and uses them again for the next job if the model has not changed.
+Add "use_cache": false to the payload to skip the cache.
+"""
+
+import contextlib
+import io
+import json
+import logging
+import os
+import pathlib
+import sys
+import time
+import traceback
+from datetime import datetime
+
+from PHX.from_HBJSON import read_HBJSON_file
+from PHX.hbjson_to_wufi_xml import remove_old_logs, setup_logging_dir
+from PHX.to_METr_JSON import metr_builder, metr_json_to_file
+from PHX.to_PPP import ppp_builder, ppp_txt_to_file
+from PHX.to_WUFI_XML import _bug_fixes, xml_builder, xml_txt_to_file
+
+from honeybee_ph_rhino import hbjson_io
+
+from conversion_cache import ConversionCache, ModelConversion  # -- (in this scripts folder)
+from diagnostics import DiagnosticsHandler  # -- (in this scripts folder)
+
+SCRIPTS_DIR = pathlib.Path(__file__).resolve().parent
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(funcName)s - %(message)s"
+CACHE = ConversionCache()
+
+
+class InputFileError(Exception):
+    def __init__(self, path) -> None:
+        self.msg = f"\nError: Cannot find HBJSON file: {path}"
+        super().__init__(self.msg)
+
+
+class UnknownJobError(Exception):
+    def __init__(self, job) -> None:
+        self.msg = f"\nError: Unknown job: '{job}'. Use one of: {sorted(JOBS)}"
+        super().__init__(self.msg)
+
+
+class UnknownFormatError(Exception):
+    def __init__(self, export_format) -> None:
+        self.msg = f"\nError: Unknown export format: '{export_format}'. Use one of: {sorted(FORMATS)}"
+        super().__init__(self.msg)
+
+
+# -----------------------------------------------------------------------------
+# -- Job events
+
+_EVENT_SINK = None  # -- While a job runs: writes an event line for the job to the protocol.
+
+
+def send_event(event: str, **data) -> None:
+    """Write an event line (ie: a stage start) for the running job. Does nothing outside a job."""
+    if _EVENT_SINK is not None:
+        _EVENT_SINK(event, data)
+
+
+@contextlib.contextmanager
+def job_events(protocol, job_id):
+    """Send the events of the job (with the job's id) to the protocol stream, while the job runs."""
+    global _EVENT_SINK
+
+    def sink(event: str, data: dict) -> None:
+        send(protocol, {"id": job_id, "event": event, **data})
+
+    if protocol is not None:
+        _EVENT_SINK = sink
+    try:
+        yield
+    finally:
+        _EVENT_SINK = None
+
+
+@contextlib.contextmanager
+def stage(name: str, **data):
+    """Send a 'stage' event when the stage starts, and when it finishes (with its time in seconds)."""
+    send_event("stage", stage=name, status="start", **data)
+    start_time = time.perf_counter()
+    yield
+    send_event("stage", stage=name, status="finish", seconds=round(time.perf_counter() - start_time, 3), **data)
+
+
+class WarningEventHandler(logging.Handler):
+    """Sends each WARNING log message of the job as a 'warning' event."""
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.WARNING)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno == logging.WARNING:
+            send_event("warning", message=record.getMessage())
+
+
+# -----------------------------------------------------------------------------
+# -- Job helpers
+
+
+def source_path(payload: dict) -> pathlib.Path | None:
+    """Return the payload's HBJSON file path, or None if the payload holds the HBJSON dict."""
+    if payload.get("hbjson") is not None:
+        return None
+    src = pathlib.Path(payload["hbjson_file"])
+    if not src.exists():
+        raise InputFileError(src)
+    return src
+
+
+def save_folder(payload: dict) -> pathlib.Path | None:
+    """Return the job's (first) save-folder, made if needed. None for jobs without one."""
+    targets = payload.get("targets") or [payload]
+    folder = targets[0].get("save_folder") or payload.get("output_folder")
+    if not folder:
+        return None
+    os.makedirs(folder, exist_ok=True)
+    return pathlib.Path(folder)
+
+
+def log_source(payload: dict) -> pathlib.Path | None:
+    """Return the path which the 'PHX_Logs' folder is made next to.
+
+    This is the HBJSON file or, if the payload holds the HBJSON dict, a path in the save-folder.
+    """
+    if payload.get("hbjson") is None:
+        return source_path(payload) if "hbjson_file" in payload else None
+    folder = save_folder(payload)
+    return pathlib.Path(folder, "model.hbjson") if folder else None
+
+
+def load_model(payload: dict) -> ModelConversion:
+    """Return the HB-Model (as a ModelConversion) from the payload's 'hbjson' dict, or read in from its 'hbjson_file'.
+
+    Unless the payload's 'use_cache' is False, an unchanged model (and its PhxProjects) comes from the cache.
+    """
+    use_cache = payload.get("use_cache", True)
+    hb_json_dict = payload.get("hbjson")
+    hashes = (None, None)
+    if hb_json_dict is None:
+        src = source_path(payload)
+        logging.info(f"> Reading in the HBJSON file: ./{src}")
+        with stage("read_hbjson"):
+            layout = hbjson_io.file_layout(src)
+            if layout == "json":
+                hb_json_dict = read_HBJSON_file.read_hb_json_from_file(src)
+            elif layout == "chunked":
+                # -- Check the index hashes first: an unchanged model's rooms are not read in at all.
+                chunked = hbjson_io.ChunkedHBJSON(str(src))
+                hashes = (chunked.shared_hash, chunked.room_hashes)
+                cached = CACHE.find(chunked.identifier, *hashes) if use_cache else None
+                if cached is not None:
+                    return cached
+                hb_json_dict = chunked.to_dict()
+            else:
+                hb_json_dict = hbjson_io.read_hbjson(str(src))
+
+    with stage("build_model"):
+        if use_cache:
+            return CACHE.get(hb_json_dict, *hashes)
+        return ModelConversion(hb_json_dict)
+
+
+def target_path(target: dict, extension: str | None) -> pathlib.Path:
+    """Return the output file path (or folder, if no extension). Make the output directory if needed."""
+    target_dir = pathlib.Path(target["save_folder"])
+    if not target_dir.exists():
+        os.mkdir(target_dir)
+    if extension is None:
+        return target_dir
+    return pathlib.Path(target_dir, f"{target['filename']}{extension}")
+
+
+def merge_faces(value) -> bool | float:
+    """Return the 'merge_faces' value as bool | float (it may come as a string, as in the run-scripts)."""
+    if isinstance(value, str):
+        if value.lower() in ("true", "false"):
+            return value.lower() == "true"
+        return float(value)
+    return value
+
+
+def conversion_settings(payload: dict) -> dict:
+    """Return the PhxProject conversion settings from the payload (the WUFI Write Settings)."""
+    return {
+        "group_components": bool(payload.get("group_components", True)),
+        "merge_faces": merge_faces(payload.get("merge_faces", False)),
+        "merge_spaces_by_erv": bool(payload.get("merge_spaces_by_erv", False)),
+        "merge_exhaust_vent_devices": bool(payload.get("merge_exhaust_vent_devices", False)),
+    }
+
+
+# -- The fixed conversion settings of the PPP (same as PHX's hbjson_to_ppp.py) and OpenPH exports.
+PPP_SETTINGS = {
+    "group_components": False,
+    "merge_faces": False,
+    "merge_spaces_by_erv": True,
+    "merge_exhaust_vent_devices": False,
+}
+OPENPH_SETTINGS = {
+    "group_components": True,
+    "merge_faces": False,
+    "merge_spaces_by_erv": False,
+    "merge_exhaust_vent_devices": False,
+}
+
+
+# -----------------------------------------------------------------------------
+# -- Writers
+
+
+def write_wufi_xml(phx_project, target: pathlib.Path) -> pathlib.Path:
+    logging.info(f'> Generating XML Text for the PHX-Project: "{phx_project}"')
+    xml_txt = xml_builder.generate_WUFI_XML_from_object(phx_project)
+
+    logging.info(f"> Saving the XML file to: ./{target}")
+    xml_txt_to_file.write_XML_text_file(target, xml_txt)
+    return target
+
+
+def write_metr_json(phx_project, target: pathlib.Path) -> pathlib.Path:
+    logging.info(f'> Generating METr JSON for the PHX-Project: "{phx_project}"')
+    metr_json_text = metr_builder.generate_metr_json_text(phx_project)
+
+    logging.info(f"> Saving the METr JSON file to: ./{target}")
+    metr_json_to_file.write_metr_json_file(target, metr_json_text)
+    logging.info("> Finished conversion of HBJSON to METr JSON.")
+    return target
+
+
+def write_ppp(phx_project, target: pathlib.Path) -> pathlib.Path:
+    logging.info("> Building PPP file...")
+    ppp_file = ppp_builder.build_ppp_file(phx_project)
+
+    logging.info(f"> Writing PPP file to: {target}")
+    ppp_txt_to_file.write_ppp_file(target, ppp_file)
+    logging.info("> Done.")
+    return target
+
+
+def write_openph(phx_project, target: pathlib.Path) -> pathlib.Path:
+    # -- OpenPH is only imported (once) when first used, since not every install has it.
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    import run_openph_with_hbjson_file
+
+    run_openph_with_hbjson_file.write_openph_tables(target, phx_project)
+    return target
+
+
+# -- format: (file extension or None for a folder, writer, fixed conversion settings or None, PhxProject fix or None)
+# -- The WUFI-Passive cooling bug-fix (200 KW limit) changes the PhxProject, so it gets a fixed copy.
+FORMATS = {
+    "wufi_xml": (".xml", write_wufi_xml, None, _bug_fixes.split_cooling_into_multiple_systems),
+    "metr_json": (".json", write_metr_json, None, None),
+    "ppp": (".ppp", write_ppp, PPP_SETTINGS, None),
+    "openph": (None, write_openph, OPENPH_SETTINGS, None),
+}
+
+
+def export(model: ModelConversion, payload: dict, targets: list[dict]) -> list[str]:
+    """Write every target from the one HB-Model, and return the output paths in the targets' order.
+
+    Each target is a dict with a 'format' (see FORMATS), a 'save_folder' and a 'filename'
+    (not used by 'openph', which writes its tables into the save-folder). Each PhxProject is
+    built only once for all the targets which use the same conversion settings: 'wufi_xml'
+    and 'metr_json' use the payload's settings, 'ppp' and 'openph' their own fixed settings.
+    """
+    for target in targets:
+        if target.get("format") not in FORMATS:
+            raise UnknownFormatError(target.get("format"))
+    paths = [target_path(t, FORMATS[t["format"]][0]) for t in targets]
+
+    outputs_ = []
+    for target, path in zip(targets, paths):
+        export_format = target["format"]
+        _, writer, fixed_settings, fix = FORMATS[export_format]
+        with stage("convert", format=export_format):
+            phx_project = model.phx_project(fixed_settings or conversion_settings(payload), fix)
+        with stage("write", format=export_format):
+            output = str(writer(phx_project, path))
+        send_event("result", format=export_format, path=output)
+        outputs_.append(output)
+    return outputs_
+
+
+# -----------------------------------------------------------------------------
+# -- Jobs
+
+
+def job_ping(payload: dict) -> dict:
+    return {"pid": os.getpid()}
+
+
+def job_export(payload: dict) -> dict:
+    return {"files": export(load_model(payload), payload, payload["targets"])}
+
+
+def job_clear_cache(payload: dict) -> dict:
+    CACHE.clear()
+    return {}
+
+
+def job_wufi_xml(payload: dict) -> dict:
+    return {"file": export(load_model(payload), payload, [dict(payload, format="wufi_xml")])[0]}
+
+
+def job_metr_json(payload: dict) -> dict:
+    return {"file": export(load_model(payload), payload, [dict(payload, format="metr_json")])[0]}
+
+
+def job_ppp(payload: dict) -> dict:
+    return {"file": export(load_model(payload), payload, [dict(payload, format="ppp")])[0]}
+
+
+def job_openph(payload: dict) -> dict:
+    target = dict(payload, format="openph", save_folder=payload["output_folder"])
+    return {"output_folder": export(load_model(payload), payload, [target])[0]}
+
+
+JOBS = {
+    "ping": job_ping,
+    "export": job_export,
+    "clear_cache": job_clear_cache,
+    "wufi_xml": job_wufi_xml,
+    "metr_json": job_metr_json,
+    "ppp": job_ppp,
+    "openph": job_openph,
+}
+
+
+# -----------------------------------------------------------------------------
+# -- Job logging
+
+
+@contextlib.contextmanager
+def job_logging(
+    log_level: int,
+    src: pathlib.Path | None,
+    stdout: io.StringIO,
+    stderr: io.StringIO,
+    diagnostics: logging.Handler | None = None,
+):
+    """Route the root logger to the job's captured stdout / stderr, as the PHX run-scripts do.
+
+    ERROR and CRITICAL go to stderr, INFO and WARNING to stdout. If the log-level is above 0
+    every message is also written to a log file in a 'PHX_Logs' folder next to the HBJSON file.
+    The diagnostics handler (if given) also gets every record.
+    """
+    logger = logging.getLogger()
+    old_level = logger.level
+    logger.setLevel(log_level)
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    stderr_handler = logging.StreamHandler(stream=stderr)
+    stderr_handler.setLevel(logging.ERROR)
+    stderr_handler.setFormatter(formatter)
+
+    stdout_handler = logging.StreamHandler(stream=stdout)
+    stdout_handler.setLevel(logging.INFO)
+    stdout_handler.setFormatter(formatter)
+    stdout_handler.addFilter(lambda record: record.levelno < logging.ERROR)
+
+    handlers = [stderr_handler, stdout_handler, WarningEventHandler()]
+    if diagnostics is not None:
+        handlers.append(diagnostics)
+    if log_level > 0 and src is not None:
+        log_dir = setup_logging_dir(src)
+        remove_old_logs(log_dir, 10)
+        current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        file_handler = logging.FileHandler(log_dir / f"PHX_{current_time}.log")
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    for handler in handlers:
+        logger.addHandler(handler)
+    try:
+        yield logger
+    finally:
+        for handler in handlers:
+            logger.removeHandler(handler)
+            handler.close()
+        logger.setLevel(old_level)
+
+
+def log_level(payload: dict) -> int:
+    try:
+        return int(payload.get("log_level", 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def run_job(request: dict, protocol=None) -> dict:
+    """Run one job request and return its response dict. Never raises.
+
+    If the protocol stream is given, the job's events are written to it while the job runs.
+    """
+    job = request.get("job")
+    payload = request.get("payload") or {}
+    stdout, stderr = io.StringIO(), io.StringIO()
+    diagnostics = DiagnosticsHandler()
+    response = {"id": request.get("id"), "ok": True}
+
+    try:
+        try:
+            job_function = JOBS[job]
+        except KeyError:
+            raise UnknownJobError(job)
+        src = log_source(payload)
+        with job_events(protocol, request.get("id")), job_logging(log_level(payload), src, stdout, stderr, diagnostics):
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                response["result"] = job_function(payload)
+    except Exception:
+        # -- The traceback also goes on the job's stderr, as it would for a subprocess.
+        response["ok"] = False
+        response["error"] = traceback.format_exc()
+        stderr.write(response["error"])
+
+    try:
+        folder = save_folder(payload)
+        if folder is not None:
+            response["diagnostics_file"] = str(diagnostics.write(folder))
+    except OSError as e:
+        # -- Not a job error: the component then falls back to the job's stdout for the warnings.
+        sys.stderr.write(f"Failed to write the diagnostics file: {e}\n")
+
+    response["stdout"] = stdout.getvalue()
+    response["stderr"] = stderr.getvalue()
+    return response
+
+
+# -----------------------------------------------------------------------------
+# -- Main loop
+
+
+def protocol_stream():
+    """Return a stream on the real stdout for the protocol, and point stdout (fd 1) at stderr.
+
+    Anything else which writes to stdout (a stray print, or a library writing to the file
+    descriptor directly) then goes to stderr and cannot break the protocol.
+    """
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8", newline="\n")
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return protocol
+
+
+def send(protocol, message: dict) -> None:
+    protocol.write(json.dumps(message) + "\n")
+    protocol.flush()
+
+
+def main() -> None:
+    protocol = protocol_stream()
+    send(protocol, {"event": "ready", "pid": os.getpid(), "python": sys.version.split()[0]})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+        except ValueError:
+            send(protocol, {"id": None, "ok": False, "error": f"Invalid job request: {line[:200]}"})
+            continue
+
+        if request.get("job") == "shutdown":
+            send(protocol, {"id": request.get("id"), "ok": True, "result": {}})
+            break
+
+        send(protocol, run_job(request, protocol))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,22 @@ This script is called from the command line with the following arguments:
     * [0] (str): The path to the Python script (this file).
     * [1] (str): The path to the HBJSON file to read in.
     * [2] (str): The path to the output folder.
+        The HBJSON file may be compressed or chunked (see honeybee_ph_rhino/hbjson_io.py).
+    * [3] (str): Optional. The number of processes to run the variants on (default: one per
+        variant, up to the number of CPUs). Use "1" to run the variants one after another.
+
+The tables of a single-variant model are written to the 'out' folder. For a model with more
+than one variant (building segment), each variant's tables are written to its own folder
+inside 'out', named after the variant, and the variants are calculated in parallel.
 """
 
+import contextlib
+import io
 import os
+import re
 import sys
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 from openph.from_HBJSON import create_phpp
@@ -19,6 +30,8 @@ from openph.to_table import TableDisplayManager, TableGroup, TableNames
 from openph_demand.to_table import DemandTableNames
 from PHX.from_HBJSON import create_project, read_HBJSON_file
 
+from honeybee_ph_rhino import hbjson_io
+
 
 class InputFileError(Exception):
     def __init__(self, path) -> None:
@@ -26,7 +39,61 @@ class InputFileError(Exception):
         super().__init__(self.msg)
 
 
-Filepaths = namedtuple("Filepaths", ["output", "hbjson"])
+Filepaths = namedtuple("Filepaths", ["output", "hbjson", "max_workers"])
+
+# -- The PhxProject conversion settings for OpenPH
+PHX_SETTINGS = {
+    "_group_components": True,
+    "_merge_faces": False,
+    "_merge_spaces_by_erv": False,
+    "_merge_exhaust_vent_devices": False,
+}
+
+ORIENTATIONS = ("north", "east", "south", "west")
+
+# -- The HTML table groups: the file name, and the (table name, orientation) of each table in it.
+TABLE_GROUPS: dict[str, list[tuple[str, str | None]]] = {
+    # -- Group 1.1: Climate Tables (Core)
+    "climate.html": [
+        (TableNames.CLIMATE_ANNUAL, None),
+        (TableNames.CLIMATE_PEAK_LOAD, None),
+    ],
+    # -- Group 1.2: Ventilation Tables (Core)
+    "ventilation.html": [
+        (TableNames.ROOMS_VENTILATION_PROPERTIES, None),
+        (TableNames.ROOMS_VENTILATION_SCHEDULE, None),
+        (TableNames.VENTILATION_DUCT_INPUTS, None),
+        (TableNames.VENTILATION_DUCT_RESULTS, None),
+        (TableNames.VENTILATION_DUCT_ITERATIVE_SOLVER, None),
+        (TableNames.VENTILATION_DUCT_NUSSELT_NUMBER, None),
+    ],
+    # -- Group 1.3: Areas Tables (Core)
+    "areas.html": [
+        (TableNames.AREAS_SUMMARY, None),
+        (TableNames.AREAS_OPAQUE_SURFACE_ATTRIBUTES, None),
+        (TableNames.AREAS_OPAQUE_SURFACE_HEAT_GAIN, None),
+        (TableNames.AREAS_APERTURE_SURFACES, None),
+        (TableNames.AREAS_APERTURE_HEAT_GAIN, None),
+        (TableNames.AREAS_SOLAR_REDUCTION_WINTER, None),
+        (TableNames.AREAS_SOLAR_REDUCTION_SUMMER, None),
+    ],
+    # -- Group 2.1: Energy-Demand | Ground
+    "ground.html": [
+        (DemandTableNames.GROUND, None),
+    ],
+    # -- Group 2.2: Energy-Demand | Cooling and Heating
+    "energy_demand.html": [
+        (DemandTableNames.COOLING_DEMAND, None),
+        (DemandTableNames.COOLING_DEMAND_PEAK_MONTH, None),
+        (DemandTableNames.HEATING_DEMAND, None),
+    ],
+    # -- Group 2.3: Energy-Demand | Cooling Detail Tables
+    "summer_radiation.html": [
+        *[(DemandTableNames.SUMMER_OPAQUE_SURFACE_RADIATION, o) for o in ORIENTATIONS],
+        *[(DemandTableNames.SUMMER_WINDOW_SURFACE_RADIATION, o) for o in ORIENTATIONS],
+        (DemandTableNames.SUMMER_OPAQUE_SURFACE_HEAT_GAINS, None),
+    ],
+}
 
 
 def resolve_paths(_args: list[str]) -> Filepaths:
@@ -41,7 +108,7 @@ def resolve_paths(_args: list[str]) -> Filepaths:
         * (Filepaths): The Filepaths object.
     """
 
-    assert len(_args) == 3, "Error: Incorrect number of arguments."
+    assert len(_args) in (3, 4), "Error: Incorrect number of arguments."
 
     # -----------------------------------------------------------------------------------
     # -- The output folder location to save the script results to.
@@ -55,126 +122,132 @@ def resolve_paths(_args: list[str]) -> Filepaths:
     if not results_hbjson_file.exists():
         raise InputFileError(results_hbjson_file)
 
-    return Filepaths(output_folder, results_hbjson_file)
+    # -----------------------------------------------------------------------------------
+    # -- The number of processes for the variants (optional)
+    max_workers = int(_args[3]) if len(_args) == 4 else None
 
+    return Filepaths(output_folder, results_hbjson_file, max_workers)
 
-def main(output_folder: Path, source_file_path: Path) -> None:
-    OUTPUT_DIR = output_folder / "out"
-    if not OUTPUT_DIR.exists():
-        os.mkdir(OUTPUT_DIR)
 
+def main(output_folder: Path, source_file_path: Path, max_workers: int | None = None) -> None:
     # -- Read in an existing HB_JSON and re-build the HB Objects
     # -------------------------------------------------------------------------
     print(f"Reading in the HBJSON file: {source_file_path}")
-    hb_json_dict = read_HBJSON_file.read_hb_json_from_file(source_file_path)
+    if hbjson_io.is_packed(str(source_file_path)):
+        hb_json_dict = hbjson_io.read_hbjson(str(source_file_path))
+    else:
+        hb_json_dict = read_HBJSON_file.read_hb_json_from_file(source_file_path)
     hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(hb_json_dict)
 
     # -- Generate the PhxProject from the HB-Model
     # -------------------------------------------------------------------------
-    phx_project = create_project.convert_hb_model_to_PhxProject(hb_model, _group_components=True)
+    phx_project = create_project.convert_hb_model_to_PhxProject(hb_model, **PHX_SETTINGS)
+
+    write_openph_tables(output_folder, phx_project, max_workers)
+
+
+def variant_folder_names(phx_variants) -> list[str]:
+    """Return a unique, file-system safe folder name for each variant, based on the variant names."""
+    names_ = []
+    for i, phx_variant in enumerate(phx_variants, start=1):
+        name = re.sub(r"[^\w\-. ]", "_", str(phx_variant.name or "")).strip(" .") or f"Variant_{i}"
+        unique_name, count = name, 1
+        while unique_name.lower() in (n.lower() for n in names_):
+            count += 1
+            unique_name = f"{name}_{count}"
+        names_.append(unique_name)
+    return names_
+
+
+def build_tables(display: TableDisplayManager, phpp) -> dict[tuple[str, str | None], object]:
+    """Return each table used by the TABLE_GROUPS, built only once, by its (table name, orientation)."""
+    tables_ = {}
+    for table_keys in TABLE_GROUPS.values():
+        for table_name, orientation in table_keys:
+            if (table_name, orientation) in tables_:
+                continue
+            if orientation is None:
+                tables_[(table_name, orientation)] = display.get_table(table_name)
+            else:
+                tables_[(table_name, orientation)] = display.get_table(table_name, phpp=phpp, orientation=orientation)
+    return tables_
+
+
+def render_table_groups(output_dir: Path, tables: dict[tuple[str, str | None], object]) -> None:
+    """Render each of the TABLE_GROUPS to its HTML file, all of the groups at the same time."""
+    with ThreadPoolExecutor(max_workers=len(TABLE_GROUPS)) as executor:
+        futures = [
+            executor.submit(
+                TableGroup([tables[k] for k in table_keys]).render, format="html", output_path=output_dir / f
+            )
+            for f, table_keys in TABLE_GROUPS.items()
+        ]
+        for future in futures:
+            future.result()
 
-    # -- Build the PHPP Model
-    # -------------------------------------------------------------------------
-    for phx_variant in phx_project.variants:
+
+def write_variant_tables(phx_variant, output_dir: Path) -> str:
+    """Run the OpenPH calculation on one PhxVariant, and write its HTML tables to the output folder.
+
+    Returns:
+    --------
+        * (str): The text printed while calculating and writing. The variants may run in other
+            processes, so their output is returned to be printed in order by the main process.
+    """
+    with contextlib.redirect_stdout(io.StringIO()) as stdout:
+        if not output_dir.exists():
+            os.makedirs(output_dir)
+
+        # -- Build the PHPP Model
         ph_energy_phpp = create_phpp.from_phx_variant(phx_variant)
 
-        # ---------------------------------------------------------------------
         display = TableDisplayManager(ph_energy_phpp)
         print(f"\nAvailable table views: {display.available_tables}\n")
 
-        # ---------------------------------------------------------------------
-        # Group 1.1: Climate Tables (Core)
-        # ---------------------------------------------------------------------
-        climate_group = display.create_group(
-            [
-                TableNames.CLIMATE_ANNUAL,
-                TableNames.CLIMATE_PEAK_LOAD,
-            ]
-        )
-        climate_group.render(format="html", output_path=OUTPUT_DIR / "climate.html")
-
-        # ---------------------------------------------------------------------
-        # Group 1.2: Ventilation Tables (Core)
-        # ---------------------------------------------------------------------
-        ventilation_group = display.create_group(
-            [
-                TableNames.ROOMS_VENTILATION_PROPERTIES,
-                TableNames.ROOMS_VENTILATION_SCHEDULE,
-                TableNames.VENTILATION_DUCT_INPUTS,
-                TableNames.VENTILATION_DUCT_RESULTS,
-                TableNames.VENTILATION_DUCT_ITERATIVE_SOLVER,
-                TableNames.VENTILATION_DUCT_NUSSELT_NUMBER,
-            ]
-        )
-        ventilation_group.render(format="html", output_path=OUTPUT_DIR / "ventilation.html")
-
-        # ---------------------------------------------------------------------
-        # Group 1.3: Areas Tables (Core)
-        # ---------------------------------------------------------------------
-        areas_group = display.create_group(
-            [
-                TableNames.AREAS_SUMMARY,
-                TableNames.AREAS_OPAQUE_SURFACE_ATTRIBUTES,
-                TableNames.AREAS_OPAQUE_SURFACE_HEAT_GAIN,
-                TableNames.AREAS_APERTURE_SURFACES,
-                TableNames.AREAS_APERTURE_HEAT_GAIN,
-                TableNames.AREAS_SOLAR_REDUCTION_WINTER,
-                TableNames.AREAS_SOLAR_REDUCTION_SUMMER,
-            ]
-        )
-        areas_group.render(format="html", output_path=OUTPUT_DIR / "areas.html")
-
-        # ---------------------------------------------------------------------
-        # Group 2.1: Energy-Demand | Ground
-        # ---------------------------------------------------------------------
-        demand_group = display.create_group(
-            [
-                DemandTableNames.GROUND,
-            ]
-        )
-        demand_group.render(format="html", output_path=OUTPUT_DIR / "ground.html")
-
-        # ---------------------------------------------------------------------
-        # Group 2.2: Energy-Demand | Cooling and Heating
-        # ---------------------------------------------------------------------
-        demand_group = display.create_group(
-            [
-                DemandTableNames.COOLING_DEMAND,
-                DemandTableNames.COOLING_DEMAND_PEAK_MONTH,
-                DemandTableNames.HEATING_DEMAND,
-            ]
-        )
-        demand_group.render(format="html", output_path=OUTPUT_DIR / "energy_demand.html")
-
-        # ---------------------------------------------------------------------
-        # Group 2.3: Energy-Demand | Cooling Detail Tables
-        # ---------------------------------------------------------------------
-        cooling_detail_tables = []
-
-        for orientation in ["north", "east", "south", "west"]:
-            opaque_rad = display.get_table(
-                DemandTableNames.SUMMER_OPAQUE_SURFACE_RADIATION,
-                phpp=ph_energy_phpp,
-                orientation=orientation,
-            )
-            cooling_detail_tables.append(opaque_rad)
+        render_table_groups(output_dir, build_tables(display, ph_energy_phpp))
+    return stdout.getvalue()
 
-        for orientation in ["north", "east", "south", "west"]:
-            window_rad = display.get_table(
-                DemandTableNames.SUMMER_WINDOW_SURFACE_RADIATION,
-                phpp=ph_energy_phpp,
-                orientation=orientation,
-            )
-            cooling_detail_tables.append(window_rad)
 
-        window_total = display.get_table(DemandTableNames.SUMMER_WINDOW_TOTAL_RADIATION, phpp=ph_energy_phpp)
-        window_total = display.get_table(DemandTableNames.SUMMER_OPAQUE_SURFACE_HEAT_GAINS, phpp=ph_energy_phpp)
-        cooling_detail_tables.append(window_total)
+def write_openph_tables(output_folder: Path, phx_project, max_workers: int | None = None) -> None:
+    """Run the OpenPH calculation on each variant of the PhxProject and write the HTML tables to the 'out' folder.
+
+    Used by main() and by the Py3 worker (hbph_worker.py), which may already have the PhxProject.
+    The PhxProject should be built with PHX_SETTINGS.
+
+    Arguments:
+    ----------
+        * output_folder (Path): The folder to write the 'out' folder into.
+        * phx_project (PhxProject): The PhxProject to calculate.
+        * max_workers (int | None): The number of processes to calculate the variants on. Default:
+            one per variant, up to the number of CPUs. With 1 (or a single variant) the variants
+            are calculated one after another, in this process.
+    """
+    OUTPUT_DIR = output_folder / "out"
+    if not OUTPUT_DIR.exists():
+        os.mkdir(OUTPUT_DIR)
+
+    phx_variants = list(phx_project.variants)
+    if len(phx_variants) == 1:
+        output_dirs = [OUTPUT_DIR]
+    else:
+        output_dirs = [OUTPUT_DIR / name for name in variant_folder_names(phx_variants)]
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(phx_variants)))
+
+    if max_workers == 1:
+        for phx_variant, output_dir in zip(phx_variants, output_dirs):
+            print(write_variant_tables(phx_variant, output_dir), end="")
+        return None
 
-        cooling_detail_group = TableGroup(cooling_detail_tables)
-        cooling_detail_group.render(format="html", output_path=OUTPUT_DIR / "summer_radiation.html")
+    print(f"Calculating {len(phx_variants)} variants on {max_workers} processes.")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(write_variant_tables, v, d) for v, d in zip(phx_variants, output_dirs)]
+        for future in futures:
+            print(future.result(), end="")
 
 
 if __name__ == "__main__":
     file_paths = resolve_paths(sys.argv)
-    result = main(file_paths.output, file_paths.hbjson)
+    result = main(file_paths.output, file_paths.hbjson, file_paths.max_workers)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Per-solve Rhino-document unit information: unit names, tolerance and cached conversion factors.
+
+Reading the document's ModelUnitSystem crosses into .NET, and every ph_units 'convert' call
+re-parses both unit names. Inside a per-item loop (per room, per frame-element, per value...)
+that is pure overhead since the answer never changes during a solve. The UnitContext reads
+the document once. Its conversions use the cached plans in unit_conversion.
+
+Use 'get_unit_context(IGH)'. It works with the local gh_io.IGH (which builds and keeps its own
+'unit_context') as well as with the ph_gh_component_io IGH used by some of the program components.
+"""
+
+try:
+    from typing import Any, Optional, Union
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_ph_rhino import unit_conversion
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_rhino:\n\t{}".format(e))
+
+
+class UnitContext(object):
+    """The Rhino document's unit-type and tolerance, with cached conversion factors.
+
+    Arguments:
+    ----------
+        * _unit_system_name (str): The Rhino document's ModelUnitSystem name, ie: "Millimeters".
+        * _length_unit (str): The unit abbreviation for lengths, ie: "MM".
+        * _area_unit (str): The unit abbreviation for areas, ie: "MM2".
+        * _tolerance (float): The Rhino document's ModelAbsoluteTolerance.
+    """
+
+    def __init__(self, _unit_system_name, _length_unit, _area_unit, _tolerance):
+        # type: (str, str, str, float) -> None
+        self.unit_system_name = _unit_system_name
+        self.length_unit = _length_unit
+        self.area_unit = _area_unit
+        self.tolerance = _tolerance
+
+    def factor(self, _source_unit, _target_unit):
+        # type: (str, str) -> Optional[float]
+        """Return the multiplier to go from the source unit to the target unit, or None if there isn't one."""
+        plan = unit_conversion.get_plan(_source_unit, _target_unit)
+        if plan is None or plan.offset:
+            return None
+        return plan.factor
+
+    def convert(self, _value, _source_unit, _target_unit):
+        # type: (Union[int, float], str, str) -> Optional[float]
+        """Convert the value using a cached plan. Returns None if the units don't convert, just like ph_units."""
+        return unit_conversion.convert(_value, _source_unit, _target_unit)
+
+    @property
+    def length_to_m(self):
+        # type: () -> Optional[float]
+        return self.factor(self.length_unit, "M")
+
+    @property
+    def m_to_length(self):
+        # type: () -> Optional[float]
+        return self.factor("M", self.length_unit)
+
+    @property
+    def area_to_m2(self):
+        # type: () -> Optional[float]
+        return self.factor(self.area_unit, "M2")
+
+    @property
+    def area_to_ft2(self):
+        # type: () -> Optional[float]
+        return self.factor(self.area_unit, "FT2")
+
+    def __repr__(self):
+        return "{}(unit_system_name={!r}, length_unit={!r}, area_unit={!r}, tolerance={})".format(
+            self.__class__.__name__, self.unit_system_name, self.length_unit, self.area_unit, self.tolerance
+        )
+
+
+def get_unit_context(_IGH):
+    # type: (Any) -> UnitContext
+    """Return the IGH's UnitContext, building it (once) for IGH objects which don't make their own."""
+    try:
+        return _IGH.unit_context
+    except AttributeError:
+        pass
+
+    unit_context = getattr(_IGH, "_hbph_unit_context", None)
+    if unit_context is None:
+        unit_system_name = _IGH.get_rhino_unit_system_name()
+        area_unit = _IGH.get_rhino_areas_unit_name()
+        unit_context = UnitContext(
+            unit_system_name,
+            area_unit[:-1] if area_unit.endswith("2") else unit_system_name,
+            area_unit,
+            _IGH.sc.doc.ModelAbsoluteTolerance,
+        )
+        setattr(_IGH, "_hbph_unit_context", unit_context)
+    return unit_context
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Cached drop-in versions of ph_units 'parse_input' and 'convert', plus list conversion.
+
+ph_units re-parses the unit names and walks its conversion schema on every call. That
+is fine for a single value, but many components convert every item of a list or
+DataTree branch (ie: a Reinhart sky has 1,160 patches) with the same pair of units.
+
+All the PH unit conversions are linear (y = a*x + b), so the first time a (source-unit,
+target-unit) pair is seen, a ConversionPlan is built by sampling ph_units 'convert'. After
+that, converting a value is one multiply and one add. Any pair which does not come out
+linear, or which ph_units cannot convert, always falls back to calling ph_units directly,
+so the results are always the same as calling ph_units yourself.
+
+Usage:
+------
+
+>>> from honeybee_ph_rhino.unit_conversion import convert, convert_many, parse_input
+>>> convert(1000, "MM", "M")
+1.0
+>>> convert_many(["1000 MM", "1 FT", None, 3], _target_unit="M", _default_unit="M")
+[1.0, 0.3048, None, 3.0]
+"""
+
+try:
+    from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from ph_units import converter, parser
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_units:\n\t{}".format(e))
+
+
+# -- The parse-cache is cleared whenever it grows larger than this. Inputs
+# -- repeat a lot (defaults, typed-in values), so it rarely gets there.
+MAX_PARSE_CACHE_SIZE = 10000
+
+_PLANS = {}  # type: Dict[Tuple[Optional[str], Optional[str]], Optional[ConversionPlan]]
+_PARSED = {}  # type: Dict[Tuple[type, Any], Tuple[Any, Optional[str]]]
+
+
+class ConversionPlan(object):
+    """A precomputed linear conversion from one unit to another: target = source * factor + offset."""
+
+    __slots__ = ("source_unit", "target_unit", "factor", "offset")
+
+    def __init__(self, _source_unit, _target_unit, _factor, _offset):
+        # type: (Optional[str], Optional[str], float, float) -> None
+        self.source_unit = _source_unit
+        self.target_unit = _target_unit
+        self.factor = _factor
+        self.offset = _offset
+
+    def __call__(self, _value):
+        # type: (float) -> float
+        return _value * self.factor + self.offset
+
+    def __repr__(self):
+        return "{}({!r} -> {!r}: x * {} + {})".format(
+            self.__class__.__name__, self.source_unit, self.target_unit, self.factor, self.offset
+        )
+
+
+def _build_plan(_source_unit, _target_unit):
+    # type: (Optional[str], Optional[str]) -> Optional[ConversionPlan]
+    """Return a ConversionPlan by sampling ph_units, or None if the conversion is not linear."""
+    try:
+        y_0 = converter.convert(0.0, _source_unit, _target_unit)
+        y_1000 = converter.convert(1000.0, _source_unit, _target_unit)
+        y_1 = converter.convert(1.0, _source_unit, _target_unit)
+    except Exception:
+        return None
+
+    if y_0 is None or y_1000 is None or y_1 is None:
+        return None
+
+    try:
+        offset = float(y_0)
+        if offset:
+            # -- Take the factor over a wide span so the offset (ie: C->F) does not cost precision.
+            factor = (float(y_1000) - offset) / 1000.0
+        else:
+            factor = float(y_1)
+        plan = ConversionPlan(_source_unit, _target_unit, factor, offset)
+        if abs(plan(1000.0) - float(y_1000)) > 1e-9 * max(1.0, abs(float(y_1000))):
+            return None
+        if abs(plan(1.0) - float(y_1)) > 1e-9 * max(1.0, abs(float(y_1))):
+            return None
+    except (TypeError, ValueError):
+        return None
+
+    return plan
+
+
+def get_plan(_source_unit, _target_unit):
+    # type: (Optional[str], Optional[str]) -> Optional[ConversionPlan]
+    """Return the (cached) ConversionPlan for the unit pair, or None if the pair has no linear plan."""
+    key = (_source_unit, _target_unit)
+    try:
+        return _PLANS[key]
+    except KeyError:
+        plan = _build_plan(_source_unit, _target_unit)
+        _PLANS[key] = plan
+        return plan
+
+
+def clear_caches():
+    # type: () -> None
+    """Clear the conversion-plan and parse caches."""
+    _PLANS.clear()
+    _PARSED.clear()
+
+
+def parse_input(_input):
+    # type: (Any) -> Tuple[Any, Optional[str]]
+    """Cached version of ph_units.parser.parse_input: ie: "12.7 MM" -> ("12.7", "MM")."""
+    # -- The type is part of the key, since True, 1 and 1.0 are equal (and hash the same).
+    key = (type(_input), _input)
+    try:
+        return _PARSED[key]
+    except KeyError:
+        pass
+    except TypeError:
+        return parser.parse_input(_input)  # unhashable input
+
+    result = parser.parse_input(_input)
+    if len(_PARSED) >= MAX_PARSE_CACHE_SIZE:
+        _PARSED.clear()
+    _PARSED[key] = result
+    return result
+
+
+def convert(_value, _source_unit, _target_unit):
+    # type: (Any, Optional[str], Optional[str]) -> Optional[float]
+    """Cached version of ph_units.converter.convert, with the same arguments and results."""
+    plan = get_plan(_source_unit, _target_unit)
+    if plan is not None:
+        try:
+            return plan(float(_value))
+        except (TypeError, ValueError):
+            pass
+    return converter.convert(_value, _source_unit, _target_unit)
+
+
+def convert_values(_values, _source_unit, _target_unit):
+    # type: (Iterable[Any], Optional[str], Optional[str]) -> List[Optional[float]]
+    """Convert every value (all in the same source-unit) to the target-unit."""
+    plan = get_plan(_source_unit, _target_unit)
+    if plan is None:
+        return [converter.convert(v, _source_unit, _target_unit) for v in _values]
+
+    output = []
+    for value in _values:
+        try:
+            output.append(plan(float(value)))
+        except (TypeError, ValueError):
+            output.append(converter.convert(value, _source_unit, _target_unit))
+    return output
+
+
+def convert_many(_inputs, _target_unit, _default_unit=None):
+    # type: (Iterable[Any], Optional[str], Optional[str]) -> List[Optional[float]]
+    """Parse and convert every input (ie: a list or a DataTree Branch) to the target-unit.
+
+    Arguments:
+    ----------
+        * _inputs (Iterable[Any]): The user-inputs. Each may be a number or a string with
+            or without a unit (ie: "12.7 MM"). None items are returned as None.
+        * _target_unit (Optional[str]): The unit to convert the inputs to.
+        * _default_unit (Optional[str]): The unit to use for any inputs without one.
+
+    Returns:
+    --------
+        * (List[Optional[float]]): The converted values, in the same order as the inputs.
+    """
+    output = []
+    for _input in _inputs:
+        if _input is None:
+            output.append(None)
+            continue
+        value, unit = parse_input(_input)
+        output.append(convert(value, unit or _default_unit, _target_unit))
+    return output
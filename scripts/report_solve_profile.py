@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Rank the Honeybee-PH components recorded in one or more solve-profile trace files.
+
+The trace files ('<definition-name>.hbph_profile.jsonl') are written by
+honeybee_ph_rhino/gh_profiler.py while profiling is switched on in Rhino.
+
+Usage:
+    python scripts/report_solve_profile.py path/to/model.hbph_profile.jsonl \
+        --sort total \
+        --top 20
+
+Prints one row per component, slowest first, followed by the hottest
+primitive counters for each of the top components.
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+SORT_KEYS = ("total", "mean", "max", "solves")
+
+
+class ComponentStats:
+    """Aggregated solve-profile records for a single component name."""
+
+    def __init__(self, name):
+        self.name = name
+        self.times_ms = []
+        self.counts = defaultdict(int)
+        self.peaks = defaultdict(int)
+        self.errors = 0
+
+    def add(self, record):
+        self.times_ms.append(float(record.get("wall_time_ms", 0.0)))
+        for key, value in (record.get("counts") or {}).items():
+            self.counts[key] += value
+        for key, value in (record.get("peaks") or {}).items():
+            self.peaks[key] = max(self.peaks[key], value)
+        if record.get("error"):
+            self.errors += 1
+
+    @property
+    def solves(self):
+        return len(self.times_ms)
+
+    @property
+    def total(self):
+        return sum(self.times_ms)
+
+    @property
+    def mean(self):
+        return self.total / self.solves if self.solves else 0.0
+
+    @property
+    def max(self):
+        return max(self.times_ms) if self.times_ms else 0.0
+
+    def hottest_counters(self, n=5):
+        """Return the n largest per-component counters (ghpythonlib calls by name, duplicate, convert...)."""
+        items = [(k, v) for k, v in self.counts.items() if k != "ghc"]
+        return sorted(items, key=lambda kv: kv[1], reverse=True)[:n]
+
+
+def read_records(paths):
+    """Yield every record found in the JSONL trace files, skipping any malformed lines."""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Skipping malformed line {line_number} in {path}", file=sys.stderr)
+
+
+def aggregate(records):
+    """Group the records by component name."""
+    stats = {}
+    for record in records:
+        name = record.get("component") or record.get("worker") or "<unknown>"
+        stats.setdefault(name, ComponentStats(name)).add(record)
+    return stats
+
+
+def print_report(stats, sort_key, top):
+    ranked = sorted(stats.values(), key=lambda s: getattr(s, sort_key), reverse=True)[:top]
+    grand_total = sum(s.total for s in stats.values()) or 1.0
+
+    header = f"{'Component':<55} {'Solves':>7} {'Total ms':>11} {'Mean ms':>10} {'Max ms':>10} {'%':>6} {'ghc':>7}"
+    print(header)
+    print("-" * len(header))
+    for s in ranked:
+        print(
+            f"{s.name[:55]:<55} {s.solves:>7} {s.total:>11.1f} {s.mean:>10.1f} {s.max:>10.1f} "
+            f"{100 * s.total / grand_total:>6.1f} {s.counts.get('ghc', 0):>7}"
+        )
+
+    print("\nHottest primitives:")
+    for s in ranked:
+        counters = ", ".join(f"{k}={v}" for k, v in s.hottest_counters())
+        peaks = ", ".join(f"{k}={v}" for k, v in sorted(s.peaks.items()))
+        errors = f" | errors={s.errors}" if s.errors else ""
+        print(f"  {s.name}: {counters or '-'} | peaks: {peaks or '-'}{errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank Honeybee-PH components by solve-time")
+    parser.add_argument("trace_files", nargs="+", type=Path, help="One or more .hbph_profile.jsonl files")
+    parser.add_argument("--sort", dest="sort_key", choices=SORT_KEYS, default="total")
+    parser.add_argument("--top", type=int, default=25, help="Number of components to show")
+    args = parser.parse_args()
+
+    missing = [p for p in args.trace_files if not p.exists()]
+    if missing:
+        print(f"ERROR: trace file(s) not found: {', '.join(str(p) for p in missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    stats = aggregate(read_records(args.trace_files))
+    if not stats:
+        print("No solve-profile records found.")
+        return
+
+    print_report(stats, args.sort_key, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Run the component workers on CPython, with the Grasshopper / IGH stand-ins of benchmarks/gh_stand_ins.py."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+from gh_stand_ins import StandInIGH, install_stand_in_modules  # noqa: E402
+
+install_stand_in_modules()
+
+
+@pytest.fixture
+def IGH():
+    return StandInIGH()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the batch mode of the Create components (attr_input_map)."""
+
+import types
+
+import pytest
+
+pytest.importorskip("ph_units")
+
+from honeybee_ph_rhino.attr_input_map import batch_input_group, batch_input_names, expand_batch_inputs, run_batch
+
+
+def component_input(_name, _access=0):
+    return types.SimpleNamespace(name=_name, access=_access)
+
+
+def test_batch_input_group_sets_only_the_item_inputs_to_list_access():
+    input_group = {1: component_input("display_name"), 2: component_input("monthly_COPS", 1)}
+    batch_group = batch_input_group(input_group)
+
+    assert [i.access for i in batch_group.values()] == [1, 1]
+    assert input_group[1].access == 0  # -- the module's input group is not changed
+    assert batch_input_names(input_group) == ["display_name"]
+
+
+def test_expand_batch_inputs_uses_longest_list_matching():
+    input_dict = {"display_name": ["A", "B", "C"], "capacity": [10.0], "monthly_COPS": [3.0, 3.5], "notes": []}
+    input_dicts = expand_batch_inputs(input_dict, ["display_name", "capacity", "notes"])
+
+    assert [d["display_name"] for d in input_dicts] == ["A", "B", "C"]
+    assert [d["capacity"] for d in input_dicts] == [10.0, 10.0, 10.0]
+    assert all(d["monthly_COPS"] == [3.0, 3.5] for d in input_dicts)
+    assert all(d["notes"] is None for d in input_dicts)
+
+
+def test_run_batch_builds_one_result_per_input_dict():
+    class Interface:
+        input_dict = {"display_name": None}
+
+        def run(self):
+            return self.input_dict["display_name"]
+
+    interface = Interface()
+    original_input_dict = interface.input_dict
+    results = run_batch(interface, expand_batch_inputs({"display_name": ["A", "B"]}, ["display_name"]))
+
+    assert results == ["A", "B"]
+    assert interface.input_dict is original_input_dict
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the Phius Program Finder worker (GHCompo_FindPhiusProgram)."""
+
+from honeybee_ph_rhino.gh_compo_io.program.find_phius_program import GHCompo_FindPhiusProgram
+
+PROTOCOL = "PHIUS_MultiFamily"
+
+
+def test_exact_name_gives_no_warning(IGH):
+    programs = GHCompo_FindPhiusProgram(IGH, "Common Office", None, PROTOCOL, None).run()
+    assert programs
+    assert IGH.warnings() == []
+
+
+def test_closest_match_substitution_is_a_warning(IGH):
+    programs = GHCompo_FindPhiusProgram(IGH, "Comon Ofice", None, PROTOCOL, None).run()
+    assert programs
+    assert len(IGH.warnings()) == 1
+    assert "Comon Ofice" in IGH.warnings()[0]
+    assert "'Common Office'" in IGH.warnings()[0]
+
+
+def test_no_match_is_a_warning(IGH):
+    programs = GHCompo_FindPhiusProgram(IGH, "zzzzzzzzzzzz", None, PROTOCOL, None).run()
+    assert programs == []
+    assert len(IGH.warnings()) == 1
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Tests for geometry_kernel.merged_perimeter_curves() (RhinoCommon replaced by a stand-in)."""
+
+import sys
+import types
+
+import pytest
+
+
+class Curve:
+    """Stand-in for Rhino.Geometry.Curve. 'union_result' is what CreateBooleanUnion returns."""
+
+    union_result = None
+    union_calls = 0
+
+    def __init__(self, _name):
+        self.name = _name
+
+    @classmethod
+    def CreateBooleanUnion(cls, _curves, _tolerance):
+        cls.union_calls += 1
+        return cls.union_result
+
+
+@pytest.fixture
+def geometry_kernel(monkeypatch):
+    rhino = types.ModuleType("Rhino")
+    rhino_geometry = types.ModuleType("Rhino.Geometry")
+    rhino_geometry.Curve = Curve
+    rhino.Geometry = rhino_geometry
+    monkeypatch.setitem(sys.modules, "Rhino", rhino)
+    monkeypatch.setitem(sys.modules, "Rhino.Geometry", rhino_geometry)
+    monkeypatch.delitem(sys.modules, "honeybee_ph_rhino.geometry_kernel", raising=False)
+    Curve.union_result = None
+    Curve.union_calls = 0
+
+    from honeybee_ph_rhino import geometry_kernel
+
+    # -- Each 'Brep' here is just the list of its perimeter curves.
+    monkeypatch.setattr(geometry_kernel, "brep_perimeter_curves", lambda _brep, _tolerance: list(_brep))
+    return geometry_kernel
+
+
+def test_merged_perimeter_curves_single_curve_is_returned_unchanged(geometry_kernel):
+    curve = Curve("A")
+    assert geometry_kernel.merged_perimeter_curves([[curve]], 0.001) == [curve]
+    assert Curve.union_calls == 0
+
+
+def test_merged_perimeter_curves_disjoint_curves_are_returned_unchanged(geometry_kernel):
+    curve_a, curve_b = Curve("A"), Curve("B")
+    Curve.union_result = []  # -- CreateBooleanUnion finds nothing to union
+    assert geometry_kernel.merged_perimeter_curves([[curve_a], [curve_b]], 0.001) == [curve_a, curve_b]
+
+    Curve.union_result = None
+    assert geometry_kernel.merged_perimeter_curves([[curve_a], [curve_b]], 0.001) == [curve_a, curve_b]
+
+
+def test_merged_perimeter_curves_touching_curves_are_unioned(geometry_kernel):
+    merged = Curve("A+B")
+    Curve.union_result = [merged]
+    assert geometry_kernel.merged_perimeter_curves([[Curve("A")], [Curve("B")]], 0.001) == [merged]
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the Py3 worker client's session settings (py3_worker)."""
+
+import pytest
+
+pytest.importorskip("honeybee")
+
+from honeybee_ph_rhino import py3_worker
+
+
+def test_disabled_turns_the_worker_off_inside_the_block_only(IGH):
+    sc = IGH.scriptcontext
+    assert py3_worker.is_enabled(sc)
+
+    with py3_worker.disabled(sc):
+        assert not py3_worker.is_enabled(sc)
+        assert py3_worker.run_job(IGH, "export", {}) is None  # -- no worker is started
+
+    assert py3_worker.is_enabled(sc)
+    assert py3_worker.ENABLED_STICKY_KEY not in sc.sticky
+
+
+def test_disabled_keeps_the_session_setting(IGH):
+    sc = IGH.scriptcontext
+    py3_worker.set_enabled(sc, False)
+
+    with py3_worker.disabled(sc):
+        assert not py3_worker.is_enabled(sc)
+
+    assert sc.sticky[py3_worker.ENABLED_STICKY_KEY] is False
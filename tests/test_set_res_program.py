@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the Set Residential Program worker (GHCompo_CreatePHProgramSingleFamilyHome)."""
+
+import pytest
+
+pytest.importorskip("ph_gh_component_io")
+
+from honeybee.room import Room
+from honeybee_energy.lib.programtypes import program_type_by_identifier
+from honeybee_energy.lib.schedules import schedule_by_identifier
+from honeybee_energy.load.people import People
+from honeybee_energy_ph.properties.load.people import PhDwellings
+from honeybee_ph import space
+from ladybug_geometry.geometry3d.pointvector import Point3D
+
+from honeybee_ph_rhino.gh_compo_io.program.set_res_program import GHCompo_CreatePHProgramSingleFamilyHome
+
+
+def make_dwelling_room(_name, _x):
+    """Return an HB-Room in its own dwelling, with 2 bedrooms and 3 people (the same in every dwelling)."""
+    hb_room = Room.from_box(_name, 6, 8, 3, origin=Point3D(_x, 0, 0))
+    hb_room.properties.energy.program_type = program_type_by_identifier("Generic Office Program")
+    schedule = schedule_by_identifier("Generic Office Occupancy")
+    people = People("People_{}".format(_name), 0.05, schedule)
+    ppl_prop_ph = people.properties.ph
+    ppl_prop_ph.dwellings = PhDwellings(1)
+    ppl_prop_ph.number_bedrooms = 2
+    ppl_prop_ph.number_people = 3
+    hb_room.properties.energy.people = people
+    hb_room.properties.ph.add_new_space(space.Space())
+    return hb_room
+
+
+def ph_equipment_ids(_hb_room):
+    return {load.properties.ph.ph_equipment.identifier for load in _hb_room.properties.energy.process_loads}
+
+
+def test_dwellings_share_the_phius_default_appliance_identifiers(IGH):
+    """PHX merges the devices by PhEquipment identifier, so the Phius defaults must keep theirs."""
+    hb_rooms = [make_dwelling_room("Unit_A", 0), make_dwelling_room("Unit_B", 10)]
+    rooms_tree = GHCompo_CreatePHProgramSingleFamilyHome(IGH, hb_rooms).run()
+
+    room_a, room_b = [room for branch in rooms_tree.Branches for room in branch]
+    assert len(room_a.properties.energy.process_loads) == 8
+    assert len(room_b.properties.energy.process_loads) == 8
+    assert ph_equipment_ids(room_a) == ph_equipment_ids(room_b)
+
+
+def test_rooms_of_one_dwelling_share_the_appliances(IGH):
+    hb_rooms = [make_dwelling_room("Unit_A_1", 0), make_dwelling_room("Unit_A_2", 10)]
+    dwelling = hb_rooms[0].properties.energy.people.properties.ph.dwellings
+    hb_rooms[1].properties.energy.people.properties.ph.dwellings = dwelling
+    rooms_tree = GHCompo_CreatePHProgramSingleFamilyHome(IGH, hb_rooms).run()
+
+    room_1, room_2 = [room for branch in rooms_tree.Branches for room in branch]
+    assert ph_equipment_ids(room_1) == ph_equipment_ids(room_2)
+
+
+def test_per_room_messages_are_not_printed_at_the_default_level(IGH, capsys):
+    hb_rooms = [make_dwelling_room("Unit_A", 0), make_dwelling_room("Unit_B", 10)]
+    GHCompo_CreatePHProgramSingleFamilyHome(IGH, hb_rooms).run()
+
+    assert "Setting" not in capsys.readouterr().out
+    assert IGH._hbph_log.counts  # -- counted, for the summary after the run